@@ -8,7 +8,11 @@ from sqlalchemy.exc import IntegrityError
 from dotenv import load_dotenv
 
 from api_university.db.db_sqlalchemy import db
+from api_university.models import student_count  # noqa: F401 (the triggers are created with the tables)
 from api_university.ma import ma
+from api_university.cache.response_cache import response_cache
+from api_university.compress import compress
+from api_university.json_provider import json_provider
 from api_university.config import (
     Configuration,
     DevelopmentConfiguration,
@@ -17,9 +21,16 @@ from api_university.config import (
 from api_university.db.tools.utils import PsqlDatabaseConnection
 from api_university.db.db_operations import DatabaseOperation
 from api_university.data.insertion_data_into_db import insert_data_to_db
-from api_university.resources.student import Student, StudentList
+from api_university.resources.student import Student, StudentList, StudentSearch
 from api_university.resources.course import Course, CourseList
 from api_university.resources.group import Group, GroupList
+from api_university.resources.group_changes import GroupMove, GroupMerge, GroupSplit
+from api_university.resources.cache_stats import CacheStats
+from api_university.resources.enrollment import CourseStudents, StudentCourses
+from api_university.resources.bulk_import import Import
+from api_university.resources.bulk_export import Export
+from api_university.resources.stats import (Stats, StatsStudentCourses, StatsCourseStudents,
+                                            StatsCourseCounts, StatsRefresh)
 from api_university.handlers import make_error, handle_404_error_api
 
 migrate = Migrate()
@@ -93,15 +104,35 @@ def create_app(test_config=False, dev_config=False):
     # RESOURCES:
     # Student
     api.add_resource(StudentList, f"{api_url}/students")
+    api.add_resource(StudentSearch, f"{api_url}/students/search")
     api.add_resource(Student, f"{api_url}/students/<int:student_id>")
+    api.add_resource(StudentCourses, f"{api_url}/students/<int:student_id>/courses")
 
     # Courses
     api.add_resource(CourseList, f"{api_url}/courses")
     api.add_resource(Course, f"{api_url}/courses/<int:course_id>")
+    api.add_resource(CourseStudents, f"{api_url}/courses/<int:course_id>/students")
 
     # Groups
     api.add_resource(GroupList, f"{api_url}/groups")
     api.add_resource(Group, f"{api_url}/groups/<int:group_id>")
+    api.add_resource(GroupMove, f"{api_url}/groups/<int:group_id>/move")
+    api.add_resource(GroupMerge, f"{api_url}/groups/<int:group_id>/merge")
+    api.add_resource(GroupSplit, f"{api_url}/groups/<int:group_id>/split")
+
+    # Import / export
+    api.add_resource(Import, f"{api_url}/import/<string:kind>")
+    api.add_resource(Export, f"{api_url}/export/<string:kind>")
+
+    # Statistics
+    api.add_resource(Stats, f"{api_url}/stats")
+    api.add_resource(StatsStudentCourses, f"{api_url}/stats/student-courses")
+    api.add_resource(StatsCourseStudents, f"{api_url}/stats/course-students")
+    api.add_resource(StatsCourseCounts, f"{api_url}/stats/course-counts")
+    api.add_resource(StatsRefresh, f"{api_url}/stats/refresh")
+
+    # Cache
+    api.add_resource(CacheStats, f"{api_url}/cache/stats")
 
     # HANDLERS:
     application.register_error_handler(404, handle_404_error_api)
@@ -109,6 +140,9 @@ def create_app(test_config=False, dev_config=False):
     # Initialization
     db.init_app(application)
     ma.init_app(application)
+    response_cache.init_app(application)
+    compress.init_app(application)
+    json_provider.init_app(application)
     migrate.init_app(application, db, directory=Configuration.MIGRATION_DIR)
 
     return application
@@ -0,0 +1,238 @@
+import json
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, defaultdict
+from threading import RLock
+from time import monotonic, time
+from typing import Iterable, NamedTuple, NoReturn
+
+try:
+    from redis import Redis, WatchError
+except ImportError:  # the redis backend is optional
+    Redis = WatchError = None
+
+STAT_NAMES = ('hits', 'misses', 'evictions', 'expirations', 'invalidations')
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    status: int
+    headers: list[tuple[str, str]]
+    tags: frozenset[str]
+
+
+class CacheBackend(ABC):
+    """
+    Storage of cached responses with their tags, bounded by `max_entries` (least recently used are evicted).
+    Counts hits, misses, evictions, expirations and invalidations.
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Returns the entry, None if there is no entry or it has expired."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse, ttl: float, generation: int = None) -> NoReturn:
+        """Stores the entry for `ttl` seconds unless the cache has been invalidated since `generation`."""
+
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str]) -> NoReturn:
+        """Removes every entry tagged with any of `tags`."""
+
+    @abstractmethod
+    def generation(self) -> int:
+        """Returns the number of invalidations so far."""
+
+    @abstractmethod
+    def clear(self) -> NoReturn:
+        """Removes all entries and resets the counters."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Returns the number of entries ('size') and the counters."""
+
+
+class MemoryBackend(CacheBackend):
+    """Cache of a single process."""
+    def __init__(self, max_entries: int = 1024):
+        super().__init__(max_entries)
+        self._entries: OrderedDict[str, tuple[CachedResponse, float]] = OrderedDict()
+        self._tag_keys: defaultdict[str, set[str]] = defaultdict(set)
+        self._stats = Counter()
+        self._lock = RLock()
+        self._generation = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry, expires_at = self._entries.get(key, (None, None))
+            if entry is not None and expires_at <= monotonic():
+                self._remove(key)
+                self._stats['expirations'] += 1
+                entry = None
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry
+
+    def set(self, key: str, entry: CachedResponse, ttl: float, generation: int = None) -> NoReturn:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remove(key)
+            self._entries[key] = (entry, monotonic() + ttl)
+            for tag in entry.tags:
+                self._tag_keys[tag].add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def invalidate(self, tags: Iterable[str]) -> NoReturn:
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in self._tag_keys.pop(tag, ()):
+                    if self._remove(key):
+                        self._stats['invalidations'] += 1
+
+    def generation(self) -> int:
+        return self._generation
+
+    def clear(self) -> NoReturn:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tag_keys.clear()
+            self._stats.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._entries), **{name: self._stats[name] for name in STAT_NAMES}}
+
+    def _remove(self, key: str) -> bool:
+        entry, _ = self._entries.pop(key, (None, None))
+        if entry is None:
+            return False
+        for tag in entry.tags:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+        return True
+
+
+class RedisBackend(CacheBackend):
+    """
+    Cache shared by all the processes connected to the same Redis (or a server speaking its protocol).
+    Invalidation made by any process removes the entries for all of them.
+
+    Keys (all of them start with `prefix`):
+        entry:<key>  - hash with the response, expires after the ttl
+        tag:<tag>    - set of the keys of the entries tagged with <tag>
+        lru          - sorted set of the keys scored by the last access time, for the `max_entries` bound
+        generation   - number of invalidations
+        stats        - hash of the counters
+    """
+    def __init__(self, client, max_entries: int = 1024, prefix: str = 'api_university:cache:'):
+        super().__init__(max_entries)
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisBackend":
+        if Redis is None:
+            raise ImportError("The 'redis' package is required by the redis cache backend")
+        return cls(Redis.from_url(url), **kwargs)
+
+    def _key(self, *parts: str) -> str:
+        return self.prefix + ':'.join(parts)
+
+    def get(self, key: str) -> CachedResponse | None:
+        data = self.client.hgetall(self._key('entry', key))
+        if not data:
+            # an entry which is still in the lru set has expired
+            if self.client.zrem(self._key('lru'), key):
+                self._count('expirations')
+            self._count('misses')
+            return None
+        self.client.zadd(self._key('lru'), {key: time()})
+        self._count('hits')
+        return CachedResponse(body=data[b'body'],
+                              status=int(data[b'status']),
+                              headers=[tuple(header) for header in json.loads(data[b'headers'])],
+                              tags=frozenset(json.loads(data[b'tags'])))
+
+    def set(self, key: str, entry: CachedResponse, ttl: float, generation: int = None) -> NoReturn:
+        entry_key = self._key('entry', key)
+        ttl = max(int(ttl), 1)
+        with self.client.pipeline() as pipe:
+            try:
+                # the entry is not stored if any process invalidates the cache in the meantime
+                pipe.watch(self._key('generation'))
+                if generation is not None and generation != int(pipe.get(self._key('generation')) or 0):
+                    return
+                pipe.multi()
+                pipe.delete(entry_key)
+                pipe.hset(entry_key, mapping={'body': entry.body,
+                                              'status': entry.status,
+                                              'headers': json.dumps(entry.headers),
+                                              'tags': json.dumps(sorted(entry.tags))})
+                pipe.expire(entry_key, ttl)
+                for tag in entry.tags:
+                    # every entry has the same ttl, so a tag lives as long as its newest entry
+                    pipe.sadd(self._key('tag', tag), key)
+                    pipe.expire(self._key('tag', tag), ttl)
+                pipe.zadd(self._key('lru'), {key: time()})
+                pipe.execute()
+            except WatchError:
+                return
+        self._evict()
+
+    def _evict(self) -> NoReturn:
+        excess = self.client.zcard(self._key('lru')) - self.max_entries
+        if excess <= 0:
+            return
+        evicted = [key.decode() for key, _ in self.client.zpopmin(self._key('lru'), excess)]
+        if evicted:
+            self.client.delete(*(self._key('entry', key) for key in evicted))
+            self._count('evictions', len(evicted))
+
+    def invalidate(self, tags: Iterable[str]) -> NoReturn:
+        tag_keys = [self._key('tag', tag) for tag in tags]
+        # the tag sets are read and deleted in one transaction (MULTI/EXEC),
+        # so a key added to them concurrently is either read here or added to a new set after it
+        with self.client.pipeline() as pipe:
+            pipe.incr(self._key('generation'))
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            if tag_keys:
+                pipe.delete(*tag_keys)
+            results = pipe.execute()
+        keys = {key.decode() for members in results[1:1 + len(tag_keys)] for key in members}
+        if not keys:
+            return
+        with self.client.pipeline() as pipe:
+            pipe.delete(*(self._key('entry', key) for key in keys))
+            pipe.zrem(self._key('lru'), *keys)
+            removed_entries, _ = pipe.execute()
+        if removed_entries:
+            self._count('invalidations', removed_entries)
+
+    def generation(self) -> int:
+        return int(self.client.get(self._key('generation')) or 0)
+
+    def clear(self) -> NoReturn:
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+        self.client.incr(self._key('generation'))
+
+    def stats(self) -> dict:
+        counters = {name.decode(): int(value) for name, value in self.client.hgetall(self._key('stats')).items()}
+        return {'size': self.client.zcard(self._key('lru')), **{name: counters.get(name, 0) for name in STAT_NAMES}}
+
+    def _count(self, name: str, amount: int = 1) -> NoReturn:
+        self.client.hincrby(self._key('stats'), name, amount)
@@ -0,0 +1,141 @@
+# Tags of cached responses and their invalidation on writes.
+#
+#   'students:5' - entity tag, put on the responses which show the columns of student 5
+#   'students:5+' - links tag, put on the responses about student 5, which also show its relationships
+#   'students'   - table tag, put on the list responses read from the table
+#   'students:*' - put on every response read from the table, invalidated by bulk writes,
+#                  which do not tell which rows they have changed
+from itertools import chain
+from typing import Iterable, NoReturn
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm.attributes import History
+from sqlalchemy.orm.state import InstanceState
+
+from api_university.db.db_sqlalchemy import db
+from api_university.cache.response_cache import response_cache
+
+SESSION_TAGS_KEY = 'response_cache_tags'
+
+
+def table_wide_tag(table_name: str) -> str:
+    return f"{table_name}:*"
+
+
+def _own_tag(state: InstanceState) -> str:
+    primary_key = ','.join(str(value) for value in state.mapper.primary_key_from_instance(state.obj()))
+    return f"{state.mapper.local_table.name}:{primary_key}"
+
+
+def _links_tag(tag: str) -> str:
+    return f"{tag}+"
+
+
+def _referred_links_tags(table_name: str, values: Iterable) -> set[str]:
+    return {_links_tag(f"{table_name}:{value}") for value in values if value is not None}
+
+
+def _foreign_keys(state: InstanceState) -> list[tuple[str, str]]:
+    """Returns (attribute name, referred table name) of the foreign key columns of the instance."""
+    return [(column_property.key, foreign_key.column.table.name)
+            for column_property in state.mapper.column_attrs
+            for column in column_property.columns
+            for foreign_key in column.foreign_keys]
+
+
+def entity_tags(*objs) -> set[str]:
+    """
+    Returns tags of a response about the instances: their entity and links tags
+    and entity tags of every instance loaded through their relationships.
+    """
+    states = [inspect(obj) for obj in objs if obj is not None]
+    tags = {_links_tag(_own_tag(state)) for state in states}
+    while states:
+        state = states.pop()
+        own_tag = _own_tag(state)
+        if own_tag in tags:
+            continue
+        tags.add(own_tag)
+        for relationship in state.mapper.relationships:
+            if relationship.key not in state.dict:
+                continue
+            related = state.dict[relationship.key]
+            related = related if relationship.uselist else [related]
+            states.extend(inspect(obj) for obj in related if obj is not None)
+    return tags
+
+
+def _changed_values(history: History, deleted: bool) -> list:
+    """Returns the values added and removed by the flush, every value of a deleted object is removed."""
+    if deleted:
+        return history.sum()
+    return [*(history.added or ()), *(history.deleted or ())]
+
+
+def _changed_tags(session) -> set[str]:
+    """
+    Returns tags of the responses which may show the new, dirty and deleted objects of the flush:
+    the objects themselves, the links of the objects they are linked to before and after the flush
+    and the lists of the tables.
+    """
+    tags = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        state = inspect(obj)
+        deleted = obj in session.deleted
+        own_tag = _own_tag(state)
+        tags.add(_links_tag(own_tag))
+        # dirty objects may have changed their collections only
+        if obj not in session.dirty or session.is_modified(obj, include_collections=False):
+            tags.add(own_tag)
+            tags.update(table.name for table in state.mapper.tables)
+        for key, table_name in _foreign_keys(state):
+            tags.update(_referred_links_tags(table_name, _changed_values(state.attrs[key].history, deleted)))
+        for relationship in state.mapper.relationships:
+            history = state.attrs[relationship.key].history
+            tags.update(_links_tag(_own_tag(inspect(related)))
+                        for related in _changed_values(history, deleted) if related is not None)
+            if relationship.secondary is not None and (history.has_changes() or deleted):
+                tags.add(relationship.secondary.name)
+    return tags
+
+
+def invalidate_tables(table_names: Iterable[str]) -> NoReturn:
+    """Invalidates every response read from the tables, for writes which do not tell the changed rows."""
+    if response_cache.enabled:
+        table_names = list(table_names)
+        response_cache.invalidate([*table_names, *map(table_wide_tag, table_names)])
+
+
+@event.listens_for(db.session, 'after_flush')
+def invalidate_flushed(session, flush_context) -> NoReturn:
+    if not response_cache.enabled:
+        return
+    tags = _changed_tags(session)
+    response_cache.invalidate(tags)
+    # responses cached by concurrent requests until the commit are invalidated once again after it
+    session.info.setdefault(SESSION_TAGS_KEY, set()).update(tags)
+
+
+@event.listens_for(db.session, 'do_orm_execute')
+def invalidate_executed(orm_execute_state) -> NoReturn:
+    # INSERT, UPDATE and DELETE statements executed through the session (bulk operations)
+    if not response_cache.enabled:
+        return
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table_name = getattr(orm_execute_state.statement.table, 'name', None)
+        if table_name:
+            tags = [table_name, table_wide_tag(table_name)]
+            response_cache.invalidate(tags)
+            orm_execute_state.session.info.setdefault(SESSION_TAGS_KEY, set()).update(tags)
+
+
+@event.listens_for(db.session, 'after_commit')
+def invalidate_committed(session) -> NoReturn:
+    tags = session.info.pop(SESSION_TAGS_KEY, None)
+    if tags and response_cache.enabled:
+        response_cache.invalidate(tags)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def forget_rolled_back(session) -> NoReturn:
+    session.info.pop(SESSION_TAGS_KEY, None)
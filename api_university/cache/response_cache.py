@@ -0,0 +1,75 @@
+from typing import Iterable, NoReturn
+
+from flask import Flask
+
+from api_university.cache.backends import CacheBackend, CachedResponse, MemoryBackend, RedisBackend
+
+
+class ResponseCache:
+    """
+    Cache of serialized responses, bounded by the number of entries (LRU) and by time (TTL).
+    Every entry is stored with the tags of the data it was made of,
+    writes invalidate entries by tags (see `api_university.cache.invalidation`).
+
+    Settings:
+        RESPONSE_CACHE_ENABLED - off by default
+        RESPONSE_CACHE_BACKEND - 'memory' (a cache per process) or 'redis' (a cache shared by all processes)
+        RESPONSE_CACHE_REDIS_URL - url of the redis server for the 'redis' backend
+        RESPONSE_CACHE_MAX_ENTRIES - the least recently used entries are evicted above it
+        RESPONSE_CACHE_TTL - seconds an entry lives at most
+    """
+    def __init__(self, app: Flask = None, backend: CacheBackend = None):
+        self.enabled = False
+        self.ttl = 60
+        self.backend = backend or MemoryBackend()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> NoReturn:
+        self.enabled = app.config.get('RESPONSE_CACHE_ENABLED', self.enabled)
+        self.ttl = app.config.get('RESPONSE_CACHE_TTL', self.ttl)
+        max_entries = app.config.get('RESPONSE_CACHE_MAX_ENTRIES', self.backend.max_entries)
+        match app.config.get('RESPONSE_CACHE_BACKEND', 'memory'):
+            case 'redis':
+                self.backend = RedisBackend.from_url(app.config['RESPONSE_CACHE_REDIS_URL'], max_entries=max_entries)
+            case 'memory':
+                self.backend = MemoryBackend(max_entries=max_entries)
+            case backend_name:
+                raise ValueError(f"unknown response cache backend '{backend_name}'")
+        app.extensions['response_cache'] = self
+
+    @property
+    def max_entries(self) -> int:
+        return self.backend.max_entries
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far, a response made before an invalidation must not be cached."""
+        return self.backend.generation()
+
+    def get(self, key: str) -> CachedResponse | None:
+        return self.backend.get(key)
+
+    def set(self, key: str, body: bytes, status: int, headers: list[tuple[str, str]],
+            tags: Iterable[str], generation: int = None) -> NoReturn:
+        """Stores the response unless the cache has been invalidated since `generation`."""
+        self.backend.set(key, CachedResponse(body, status, headers, frozenset(tags)), self.ttl, generation)
+
+    def invalidate(self, tags: Iterable[str]) -> NoReturn:
+        """Removes every entry tagged with any of `tags`, for every process sharing the backend."""
+        self.backend.invalidate(list(tags))
+
+    def clear(self) -> NoReturn:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        stats = self.backend.stats()
+        return {'enabled': self.enabled,
+                'backend': type(self.backend).__name__,
+                'size': stats.pop('size'),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                **stats}
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,149 @@
+import zlib
+from typing import Iterable, Iterator, NoReturn
+
+from flask import Flask, Response, current_app, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional
+    zstandard = None
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# content coding: (encoder, config key of its level), in the order of preference
+ENCODERS = {
+    'br': (BrotliEncoder, 'COMPRESS_BR_LEVEL'),
+    'zstd': (ZstdEncoder, 'COMPRESS_ZSTD_LEVEL'),
+    'gzip': (GzipEncoder, 'COMPRESS_LEVEL'),
+}
+
+
+class Compress:
+    """
+    Compresses responses with the best content coding accepted by the client ('Accept-Encoding'):
+    brotli or zstd if their packages are installed, gzip otherwise.
+    Streamed responses are compressed chunk by chunk, every chunk is flushed,
+    so the client receives the list as it is being made.
+
+    Settings:
+        COMPRESS_ALGORITHMS - content codings in the order of preference
+        COMPRESS_MIMETYPES - mimetypes to compress
+        COMPRESS_MIN_SIZE - smaller responses are not compressed (streamed ones are always compressed)
+        COMPRESS_LEVEL, COMPRESS_BR_LEVEL, COMPRESS_ZSTD_LEVEL - levels of gzip, brotli and zstd
+    """
+    def __init__(self, app: Flask = None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> NoReturn:
+        app.config.setdefault('COMPRESS_ALGORITHMS', ['br', 'zstd', 'gzip'])
+        app.config.setdefault('COMPRESS_MIMETYPES', ['application/json'])
+        app.config.setdefault('COMPRESS_MIN_SIZE', 500)
+        app.config.setdefault('COMPRESS_LEVEL', 6)
+        app.config.setdefault('COMPRESS_BR_LEVEL', 4)
+        app.config.setdefault('COMPRESS_ZSTD_LEVEL', 3)
+        app.after_request(self.after_request)
+        app.extensions['compress'] = self
+
+    @staticmethod
+    def available_algorithms() -> list[str]:
+        modules = {'br': brotli, 'zstd': zstandard, 'gzip': zlib}
+        return [algorithm for algorithm in current_app.config['COMPRESS_ALGORITHMS']
+                if modules.get(algorithm) is not None]
+
+    def negotiate(self) -> str | None:
+        """Returns the accepted content coding with the highest quality, the preferred one of equal ones."""
+        accepted = [(request.accept_encodings.quality(algorithm), -preference, algorithm)
+                    for preference, algorithm in enumerate(self.available_algorithms())]
+        quality, _, algorithm = max(accepted, default=(0, 0, None))
+        return algorithm if quality > 0 else None
+
+    def after_request(self, response: Response) -> Response:
+        if response.mimetype not in current_app.config['COMPRESS_MIMETYPES']:
+            return response
+        response.vary.add('Accept-Encoding')
+
+        if (not 200 <= response.status_code < 300
+                or response.status_code == 204
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers):
+            return response
+        if not response.is_streamed and len(response.get_data()) < current_app.config['COMPRESS_MIN_SIZE']:
+            return response
+        algorithm = self.negotiate()
+        if algorithm is None:
+            return response
+
+        encoder_class, level_key = ENCODERS[algorithm]
+        encoder = encoder_class(current_app.config[level_key])
+        if response.is_streamed:
+            response.response = self._compress_stream(encoder, response.response, response.charset)
+            response.headers.pop('Content-Length', None)
+        else:
+            response.set_data(encoder.compress(response.get_data()) + encoder.finish())
+        response.headers['Content-Encoding'] = algorithm
+        return response
+
+    @staticmethod
+    def _compress_stream(encoder, chunks: Iterable[str | bytes], charset: str) -> Iterator[bytes]:
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode(charset)
+                data = encoder.compress(chunk) + encoder.flush()
+                if data:
+                    yield data
+            yield encoder.finish()
+        finally:
+            # releases the database cursor of the stream if the client has gone
+            if hasattr(chunks, 'close'):
+                chunks.close()
+
+
+compress = Compress()
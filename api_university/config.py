@@ -15,6 +15,8 @@ class Configuration:
                                f"{os.getenv('PG_HOST')}:{os.getenv('PG_PORT')}/"
                                f"{os.getenv('PG_DB')}")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # psycopg2 sends executemany UPDATE and DELETE statements in pages, INSERT ones as multi-row VALUES
+    SQLALCHEMY_ENGINE_OPTIONS = {'executemany_mode': 'values_plus_batch'}
     MIGRATION_DIR = os.path.join(api_dir, 'db', 'migrations')
     SWAGGER = {
         'doc_dir': f'{api_dir}/Swagger',
@@ -24,6 +26,23 @@ class Configuration:
     TESTING = False
     CSRF_ENABLED = True
     SECRET_KEY = 'this-really-needs-to-be-changed'
+    MAX_PAGE_LIMIT = 1000
+    SEARCH_PAGE_LIMIT = 20
+    STREAM_CHUNK_SIZE = 1000
+    IMPORT_CHUNK_SIZE = 5000
+    STATS_REFRESH_AFTER_IMPORT = True
+    RESPONSE_CACHE_ENABLED = False
+    RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory')
+    RESPONSE_CACHE_REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    RESPONSE_CACHE_MAX_ENTRIES = 1024
+    RESPONSE_CACHE_TTL = 60
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'orjson')
+    COMPRESS_ALGORITHMS = ['br', 'zstd', 'gzip']
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_MIN_SIZE = 500
+    COMPRESS_LEVEL = 6
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_ZSTD_LEVEL = 3
 
 
 class DevelopmentConfiguration(Configuration):
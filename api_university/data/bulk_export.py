@@ -0,0 +1,132 @@
+# Bulk export of whole tables as CSV or NDJSON.
+#
+# Rows are made by PostgreSQL itself with COPY (SELECT ...) TO STDOUT, Python only passes the bytes on.
+# psycopg2 pushes COPY data into a file, so the copy runs in a thread on its own connection
+# and hands the data over in chunks through a bounded queue: memory does not grow with the table,
+# and the copy waits while the client is slower than the database.
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Iterator
+
+from sqlalchemy.engine import Engine
+
+FORMATS = ('ndjson', 'csv')
+
+# kind: select of the rows, ordered by the primary key
+EXPORT_QUERIES = {
+    'students': (
+        "SELECT students.student_id, students.first_name, students.last_name, students.group_id, "
+        "groups.name AS group_name, coalesce(links.course_ids, '{}') AS course_ids "
+        "FROM students "
+        "LEFT JOIN groups ON groups.group_id = students.group_id "
+        "LEFT JOIN (SELECT student_id, array_agg(course_id ORDER BY course_id) AS course_ids "
+        "           FROM students_courses GROUP BY student_id) AS links "
+        "ON links.student_id = students.student_id "
+        "ORDER BY students.student_id"
+    ),
+    'groups': "SELECT group_id, name FROM groups ORDER BY group_id",
+    'courses': "SELECT course_id, name, description FROM courses ORDER BY course_id",
+    'enrollments': "SELECT student_id, course_id FROM students_courses ORDER BY student_id, course_id",
+}
+
+# course ids are written as '1 2 3' into CSV
+CSV_COLUMNS = {
+    'students': "student_id, first_name, last_name, group_id, group_name, "
+                "array_to_string(course_ids, ' ') AS course_ids",
+}
+
+
+def copy_statement(kind: str, file_format: str) -> str:
+    query = EXPORT_QUERIES[kind]
+    if file_format == 'csv':
+        columns = CSV_COLUMNS.get(kind, '*')
+        return f"COPY (SELECT {columns} FROM ({query}) AS export) TO STDOUT WITH (FORMAT csv, HEADER)"
+    # csv format with delimiter and quote characters which are escaped in JSON leaves JSON as it is,
+    # the text format would escape its backslashes
+    return (f"COPY (SELECT row_to_json(export) FROM ({query}) AS export) TO STDOUT "
+            f"WITH (FORMAT csv, DELIMITER E'\\x1f', QUOTE E'\\x1e')")
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def _put_unless_cancelled(chunks: Queue, cancelled: Event, item) -> bool:
+    """Waits for a free place in the queue, returns False if the export is cancelled meanwhile."""
+    while not cancelled.is_set():
+        try:
+            chunks.put(item, timeout=1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+class _QueueWriter:
+    """File for COPY TO, which puts the data into the queue in chunks of at least `chunk_size` bytes."""
+    def __init__(self, chunks: Queue, cancelled: Event, chunk_size: int):
+        self.chunks = chunks
+        self.cancelled = cancelled
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+
+    def write(self, data: bytes):
+        self.buffer += data
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        chunk, self.buffer = bytes(self.buffer), bytearray()
+        if not _put_unless_cancelled(self.chunks, self.cancelled, chunk):
+            # aborts the COPY, the client has gone
+            raise _Cancelled()
+
+
+def export_chunks(engine: Engine, kind: str, file_format: str, chunk_size: int = 65536) -> Iterator[bytes]:
+    """
+    Yields the exported rows in chunks of about `chunk_size` bytes.
+    Closing the generator before the end stops the copy.
+    """
+    statement = copy_statement(kind, file_format)
+    chunks = Queue(maxsize=8)
+    cancelled = Event()
+    done = object()
+
+    def copy():
+        try:
+            connection = engine.raw_connection()
+            try:
+                writer = _QueueWriter(chunks, cancelled, chunk_size)
+                with connection.cursor() as cursor:
+                    cursor.copy_expert(statement, writer)
+                writer.flush()
+                connection.commit()
+            finally:
+                connection.close()
+        except _Cancelled:
+            return
+        except Exception as err:
+            _put_unless_cancelled(chunks, cancelled, err)
+            return
+        _put_unless_cancelled(chunks, cancelled, done)
+
+    thread = Thread(target=copy, name=f"export-{kind}", daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is done:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        cancelled.set()
+        # lets a writer waiting on the full queue see the cancellation
+        try:
+            while True:
+                chunks.get_nowait()
+        except Empty:
+            pass
@@ -0,0 +1,210 @@
+# Bulk import of whole universities from NDJSON or CSV.
+#
+# Rows are read lazily from the given lines, validated in chunks by the row schemas
+# and written with COPY FROM STDIN into a temporary staging table, so memory does not grow with the file.
+# When the file is over, rows which refer to missing groups, students or courses are reported and dropped,
+# the rest is merged into the table in the same transaction: rows with ids of existing rows update them.
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator
+
+from flask import current_app
+from marshmallow import Schema, ValidationError
+from sqlalchemy import Table, text
+
+from api_university.db.db_sqlalchemy import db
+from api_university.cache.invalidation import invalidate_tables
+from api_university.models.course import CourseModel
+from api_university.models.group import GroupModel
+from api_university.models.student import StudentModel
+from api_university.models.relationships import students_courses
+from api_university.models.table_version import TableVersionModel
+from api_university.models.id_sequence import advance_sequence, reserve_ids
+from api_university.models.stats import refresh_stats
+from api_university.responses.response_strings import gettext_
+from api_university.schemas.import_rows import (StudentRowSchema, GroupRowSchema,
+                                                CourseRowSchema, EnrollmentRowSchema)
+
+FORMATS = ('ndjson', 'csv')
+
+
+@dataclass(frozen=True)
+class ImportTarget:
+    table: Table
+    schema: Schema
+    # primary key column, new ids are reserved for the rows without it; None for link tables
+    key: str | None
+    # column: (referred table, referred column, not found message)
+    references: dict[str, tuple[str, str, str]] = field(default_factory=dict)
+
+    @property
+    def columns(self) -> list[str]:
+        # columns kept by the database (groups.student_count) are not imported
+        return [column.name for column in self.table.columns if column.name in self.schema.fields]
+
+
+TARGETS = {
+    'students': ImportTarget(StudentModel.__table__, StudentRowSchema(), 'student_id',
+                             {'group_id': ('groups', 'group_id', 'group_not_found')}),
+    'groups': ImportTarget(GroupModel.__table__, GroupRowSchema(), 'group_id'),
+    'courses': ImportTarget(CourseModel.__table__, CourseRowSchema(), 'course_id'),
+    'enrollments': ImportTarget(students_courses, EnrollmentRowSchema(), None,
+                                {'student_id': ('students', 'student_id', 'student_not_found'),
+                                 'course_id': ('courses', 'course_id', 'course_not_found')}),
+}
+
+
+def _decode_lines(lines: Iterable[str | bytes], broken: set[int]) -> Iterator[str]:
+    """Decodes UTF-8 lines, numbers of the lines which are not UTF-8 are added to `broken`."""
+    for line_number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            try:
+                line = line.decode('utf-8')
+            except UnicodeDecodeError:
+                broken.add(line_number)
+                line = line.decode('utf-8', errors='replace')
+        yield line
+
+
+def read_rows(lines: Iterable[str | bytes], file_format: str) -> Iterator[tuple[int, dict | None]]:
+    """
+    Yields (line number, row) of NDJSON or CSV lines (CSV has a header line), blank lines are skipped.
+    Empty CSV values are left out, the row is None if the line is not UTF-8 or cannot be parsed.
+    """
+    broken = set()
+    lines = _decode_lines(lines, broken)
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        last_line = 0
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error:
+                row = None
+            # a quoted value may take several lines
+            first_line, last_line = last_line + 1, reader.reader.line_num
+            if row is None or None in row or not broken.isdisjoint(range(first_line, last_line + 1)):
+                # more values than the header has, a value over the size limit or bytes which are not UTF-8
+                yield last_line, None
+            else:
+                yield last_line, {name: value for name, value in row.items() if value not in ('', None)}
+            broken.difference_update(range(first_line, last_line + 1))
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = None if line_number in broken else json.loads(line)
+        except (ValueError, RecursionError):
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+class BulkImport:
+    """
+    Imports rows into one of TARGETS, `run` yields the events of the import:
+        {'event': 'error', 'line': 7, 'errors': {...}} - a row which is not imported
+        {'event': 'progress', 'rows': 5000, 'errors': 1} - after every chunk
+        {'event': 'done', 'rows': 10000, 'imported': 9998, 'errors': 2}
+
+    Settings:
+        IMPORT_CHUNK_SIZE - rows validated and copied at a time
+        STATS_REFRESH_AFTER_IMPORT - refresh the statistics views after the import
+    """
+    def __init__(self, kind: str):
+        self.target = TARGETS[kind]
+        self.staging = f"import_{self.target.table.name}"
+        self.rows = 0
+        self.errors = 0
+
+    def run(self, rows: Iterable[tuple[int, dict | None]]) -> Iterator[dict]:
+        try:
+            self._create_staging()
+            chunk_size = current_app.config['IMPORT_CHUNK_SIZE']
+            rows = iter(rows)
+            while chunk := list(islice(rows, chunk_size)):
+                yield from self._copy_chunk(chunk)
+                yield {'event': 'progress', 'rows': self.rows, 'errors': self.errors}
+            yield from self._drop_broken_references()
+            imported = self._merge()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        invalidate_tables([self.target.table.name])
+        if current_app.config['STATS_REFRESH_AFTER_IMPORT']:
+            refresh_stats()
+        yield {'event': 'done', 'rows': self.rows, 'imported': imported, 'errors': self.errors}
+
+    def _execute(self, statement: str, parameters: dict = None):
+        return db.session.execute(text(statement), parameters or {})
+
+    def _create_staging(self):
+        columns = ', '.join(self.target.columns)
+        self._execute(f"CREATE TEMPORARY TABLE {self.staging} ON COMMIT DROP AS "
+                      f"SELECT 0 AS line, {columns} FROM {self.target.table.name} WITH NO DATA")
+
+    def _copy_chunk(self, chunk: list[tuple[int, dict | None]]) -> Iterator[dict]:
+        valid_rows = []
+        for line_number, row in chunk:
+            self.rows += 1
+            try:
+                if row is None:
+                    raise ValidationError(gettext_("import_err_row"))
+                valid_rows.append((line_number, self.target.schema.load(row)))
+            except ValidationError as err:
+                self.errors += 1
+                yield {'event': 'error', 'line': line_number, 'errors': err.messages}
+
+        key = self.target.key
+        if key:
+            missing_keys = [row for _, row in valid_rows if row.get(key) is None]
+            for row, new_key in zip(missing_keys, reserve_ids(self.target.table.c[key], len(missing_keys))):
+                row[key] = new_key
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for line_number, row in valid_rows:
+            writer.writerow([line_number, *(row.get(column) for column in self.target.columns)])
+        buffer.seek(0)
+        cursor = db.session.connection().connection.cursor()
+        cursor.copy_expert(f"COPY {self.staging} (line, {', '.join(self.target.columns)}) "
+                           f"FROM STDIN WITH (FORMAT csv)", buffer)
+
+    def _drop_broken_references(self) -> Iterator[dict]:
+        for column, (table_name, referred_column, message) in self.target.references.items():
+            broken_rows = self._execute(
+                f"DELETE FROM {self.staging} AS staging "
+                f"WHERE {column} IS NOT NULL AND NOT EXISTS "
+                f"(SELECT 1 FROM {table_name} WHERE {table_name}.{referred_column} = staging.{column}) "
+                f"RETURNING line, {column}"
+            )
+            for line_number, value in sorted(broken_rows):
+                self.errors += 1
+                yield {'event': 'error', 'line': line_number, 'errors': {column: [gettext_(message).format(value)]}}
+
+    def _merge(self) -> int:
+        """Moves rows from the staging table into the target table, the last row of the same id wins."""
+        table_name, columns, key = self.target.table.name, ', '.join(self.target.columns), self.target.key
+        if key is None:
+            # link rows are the whole primary key, the existing ones are skipped
+            result = self._execute(f"INSERT INTO {table_name} ({columns}) "
+                                   f"SELECT DISTINCT {columns} FROM {self.staging} "
+                                   f"ON CONFLICT DO NOTHING")
+        else:
+            updates = ', '.join(f"{column} = excluded.{column}" for column in self.target.columns if column != key)
+            result = self._execute(f"INSERT INTO {table_name} ({columns}) "
+                                   f"SELECT DISTINCT ON ({key}) {columns} FROM {self.staging} "
+                                   f"ORDER BY {key}, line DESC "
+                                   f"ON CONFLICT ({key}) DO UPDATE SET {updates}")
+            max_key = self._execute(f"SELECT max({key}) FROM {self.staging}").scalar()
+            if max_key is not None:
+                advance_sequence(self.target.table.c[key], max_key)
+        self._execute(f"DROP TABLE {self.staging}")
+        # COPY and the statements above bypass the ORM events
+        TableVersionModel.bump([table_name])
+        return result.rowcount
@@ -1,6 +1,10 @@
+from typing import Callable
+
 from flask_sqlalchemy import SQLAlchemy
 from flask import abort, jsonify, Response
 from flask_sqlalchemy import BaseQuery
+from sqlalchemy import Column, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
 
 
 def make_error(status_code, message):
@@ -30,5 +34,56 @@ class CustomBaseQuery(BaseQuery):
                 abort(404, description=description)
         return rv
 
+    @staticmethod
+    def _coerce_primary_key(primary_key: Column, ident):
+        """Returns the key as a value of the Python type of the column ("3" for 3), None if it is not one."""
+        python_type = primary_key.type.python_type
+        if isinstance(ident, python_type) and not isinstance(ident, bool):
+            return ident
+        if isinstance(ident, str):
+            try:
+                return python_type(ident)
+            except ValueError:
+                return None
+        return None
+
+    def _filter_by_primary_keys(self, idents: list) -> tuple[BaseQuery, Column, dict]:
+        """
+        Returns the query of the primary keys (sent as one array parameter), the key column
+        and the unique keys mapped to their values of the column type (None for keys which can not be such values).
+        """
+        primary_key, = self.column_descriptions[0]['entity'].__mapper__.primary_key
+        keys = {ident: self._coerce_primary_key(primary_key, ident) for ident in idents}
+        values = list(dict.fromkeys(key for key in keys.values() if key is not None))
+        ids = bindparam('ids', values, type_=ARRAY(primary_key.type))
+        return self.filter(primary_key == any_(ids)), primary_key, keys
+
+    @staticmethod
+    def _abort_missing(missing: list, description: Callable[[list], Response | str] = None):
+        description = description(missing) if description else None
+        if isinstance(description, Response):
+            abort(description)
+        abort(404, description=description)
+
+    def get_all_or_404(self, idents: list, description: Callable[[list], Response | str] = None) -> list:
+        """
+        Returns instances of the primary keys in the given order, fetched by one query.
+        If any of them is missing, aborts with 404, `description` makes the error from the list of missing keys.
+        """
+        query, primary_key, keys = self._filter_by_primary_keys(idents)
+        found = {getattr(rv, primary_key.key): rv for rv in query}
+        missing = [ident for ident, key in keys.items() if key not in found]
+        if missing:
+            self._abort_missing(missing, description)
+        return [found[keys[ident]] for ident in idents]
+
+    def exist_all_or_404(self, idents: list, description: Callable[[list], Response | str] = None) -> None:
+        """The same check as `get_all_or_404` does, but only the primary keys are read."""
+        query, primary_key, keys = self._filter_by_primary_keys(idents)
+        found = {ident for ident, in query.with_entities(primary_key)}
+        missing = [ident for ident, key in keys.items() if key not in found]
+        if missing:
+            self._abort_missing(missing, description)
+
 
 db = SQLAlchemy(query_class=CustomBaseQuery)
@@ -0,0 +1,62 @@
+"""stats views
+
+Revision ID: 4a1e8c7b9d20
+Revises: e6b3d0f58a27
+Create Date: 2026-10-19 00:21:36.904158
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4a1e8c7b9d20'
+down_revision = 'e6b3d0f58a27'
+branch_labels = None
+depends_on = None
+
+# view name: (query, unique key column)
+STATS_VIEWS = {
+    'stats_student_courses': (
+        "SELECT students.student_id, students.group_id, "
+        "concat(students.first_name, ' ', students.last_name) AS full_name, "
+        "count(students_courses.course_id) AS number_of_courses "
+        "FROM students LEFT JOIN students_courses USING (student_id) "
+        "GROUP BY students.student_id",
+        'student_id'
+    ),
+    'stats_course_students': (
+        "SELECT courses.course_id, courses.name, count(students_courses.student_id) AS number_of_students "
+        "FROM courses LEFT JOIN students_courses USING (course_id) "
+        "GROUP BY courses.course_id",
+        'course_id'
+    ),
+    'stats_course_counts': (
+        "SELECT number_of_courses, count(*) AS number_of_students "
+        "FROM (SELECT students.student_id, count(students_courses.course_id) AS number_of_courses "
+        "      FROM students LEFT JOIN students_courses USING (student_id) "
+        "      GROUP BY students.student_id) AS per_student "
+        "GROUP BY number_of_courses",
+        'number_of_courses'
+    ),
+}
+
+
+def upgrade():
+    op.create_table('stats_refreshes',
+    sa.Column('view_name', sa.String(length=63), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('view_name')
+    )
+    for view_name, (query, key) in STATS_VIEWS.items():
+        # made with data, so the first refresh can be a concurrent one
+        op.execute(f"CREATE MATERIALIZED VIEW {view_name} AS {query}")
+        # REFRESH ... CONCURRENTLY requires a unique index
+        op.execute(f"CREATE UNIQUE INDEX ix_{view_name}_{key} ON {view_name} ({key})")
+        op.execute(f"INSERT INTO stats_refreshes (view_name, refreshed_at) VALUES ('{view_name}', clock_timestamp())")
+
+
+def downgrade():
+    for view_name in STATS_VIEWS:
+        op.execute(f"DROP MATERIALIZED VIEW {view_name}")
+    op.drop_table('stats_refreshes')
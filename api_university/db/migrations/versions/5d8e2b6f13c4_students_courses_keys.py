@@ -0,0 +1,49 @@
+"""students_courses keys
+
+Revision ID: 5d8e2b6f13c4
+Revises: 7b1f4c2e9a06
+Create Date: 2026-10-18 21:40:52.108364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8e2b6f13c4'
+down_revision = '7b1f4c2e9a06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the table had no constraints: links without a side and repeated links are removed first
+    op.execute("DELETE FROM students_courses WHERE student_id IS NULL OR course_id IS NULL")
+    op.execute("DELETE FROM students_courses AS link USING students_courses AS kept "
+               "WHERE link.student_id = kept.student_id AND link.course_id = kept.course_id "
+               "AND link.ctid > kept.ctid")
+    op.alter_column('students_courses', 'student_id', existing_type=sa.Integer(), nullable=False)
+    op.alter_column('students_courses', 'course_id', existing_type=sa.Integer(), nullable=False)
+    op.create_primary_key('students_courses_pkey', 'students_courses', ['student_id', 'course_id'])
+    op.create_index('ix_students_courses_course_id_student_id', 'students_courses', ['course_id', 'student_id'])
+
+    op.drop_constraint('students_courses_student_id_fkey', 'students_courses', type_='foreignkey')
+    op.drop_constraint('students_courses_course_id_fkey', 'students_courses', type_='foreignkey')
+    op.create_foreign_key('students_courses_student_id_fkey', 'students_courses', 'students',
+                          ['student_id'], ['student_id'], ondelete='CASCADE')
+    op.create_foreign_key('students_courses_course_id_fkey', 'students_courses', 'courses',
+                          ['course_id'], ['course_id'], ondelete='CASCADE')
+
+
+def downgrade():
+    op.drop_constraint('students_courses_student_id_fkey', 'students_courses', type_='foreignkey')
+    op.drop_constraint('students_courses_course_id_fkey', 'students_courses', type_='foreignkey')
+    op.create_foreign_key('students_courses_student_id_fkey', 'students_courses', 'students',
+                          ['student_id'], ['student_id'])
+    op.create_foreign_key('students_courses_course_id_fkey', 'students_courses', 'courses',
+                          ['course_id'], ['course_id'])
+
+    op.drop_index('ix_students_courses_course_id_student_id', table_name='students_courses')
+    op.drop_constraint('students_courses_pkey', 'students_courses', type_='primary')
+    op.alter_column('students_courses', 'course_id', existing_type=sa.Integer(), nullable=True)
+    op.alter_column('students_courses', 'student_id', existing_type=sa.Integer(), nullable=True)
@@ -0,0 +1,42 @@
+"""id sequences
+
+Revision ID: 7b1f4c2e9a06
+Revises: 3c5e0a7d91b2
+Create Date: 2026-10-18 18:02:15.417230
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7b1f4c2e9a06'
+down_revision = '3c5e0a7d91b2'
+branch_labels = None
+depends_on = None
+
+# table: primary key column
+tables = {
+    'students': 'student_id',
+    'groups': 'group_id',
+    'courses': 'course_id',
+}
+
+
+def upgrade():
+    for table, column in tables.items():
+        sequence = f"{table}_{column}_seq"
+        # the tables were created with explicit ids, their sequences (if any) have never been used
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {sequence} OWNED BY {table}.{column}")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT nextval('{sequence}')")
+        op.execute(f"SELECT setval('{sequence}', coalesce(max({column}), 1), max({column}) IS NOT NULL) "
+                   f"FROM {table}")
+
+
+def downgrade():
+    # There is nothing to reverse:
+    # - the integer primary keys of the first revision are serial columns already, so the sequences
+    #   and the nextval defaults the upgrade makes sure of are the ones the first revision has created,
+    #   dropping them would break the tables of that revision;
+    # - the sequences can not be moved back to their former values (never called), ids handed out
+    #   since the upgrade would be handed out once again.
+    pass
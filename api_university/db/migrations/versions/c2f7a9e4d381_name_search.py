@@ -0,0 +1,29 @@
+"""name search
+
+Revision ID: c2f7a9e4d381
+Revises: 9a4c7e1d2b58
+Create Date: 2026-10-18 23:05:41.287310
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2f7a9e4d381'
+down_revision = '9a4c7e1d2b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_students_first_name_trgm', 'students', ['first_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'})
+    op.create_index('ix_students_last_name_trgm', 'students', ['last_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'})
+
+
+def downgrade():
+    op.drop_index('ix_students_last_name_trgm', table_name='students')
+    op.drop_index('ix_students_first_name_trgm', table_name='students')
+    # the extension may be used by other database objects, it is kept
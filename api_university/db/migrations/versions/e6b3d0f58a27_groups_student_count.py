@@ -0,0 +1,78 @@
+"""groups student count
+
+Revision ID: e6b3d0f58a27
+Revises: c2f7a9e4d381
+Create Date: 2026-10-18 23:48:19.530672
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6b3d0f58a27'
+down_revision = 'c2f7a9e4d381'
+branch_labels = None
+depends_on = None
+
+count_function = """
+CREATE OR REPLACE FUNCTION groups_count_students() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE groups SET student_count = groups.student_count + changes.delta
+        FROM (SELECT group_id, count(*) AS delta FROM new_students
+              WHERE group_id IS NOT NULL GROUP BY group_id) AS changes
+        WHERE groups.group_id = changes.group_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE groups SET student_count = groups.student_count - changes.delta
+        FROM (SELECT group_id, count(*) AS delta FROM old_students
+              WHERE group_id IS NOT NULL GROUP BY group_id) AS changes
+        WHERE groups.group_id = changes.group_id;
+    ELSE
+        UPDATE groups SET student_count = groups.student_count + changes.delta
+        FROM (SELECT group_id, sum(delta) AS delta
+              FROM (SELECT old_students.group_id, -1 AS delta
+                    FROM old_students JOIN new_students USING (student_id)
+                    WHERE old_students.group_id IS DISTINCT FROM new_students.group_id
+                    UNION ALL
+                    SELECT new_students.group_id, 1 AS delta
+                    FROM old_students JOIN new_students USING (student_id)
+                    WHERE old_students.group_id IS DISTINCT FROM new_students.group_id) AS moves
+              WHERE group_id IS NOT NULL GROUP BY group_id) AS changes
+        WHERE groups.group_id = changes.group_id AND changes.delta <> 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+count_triggers = """
+CREATE TRIGGER students_count_insert AFTER INSERT ON students
+    REFERENCING NEW TABLE AS new_students
+    FOR EACH STATEMENT EXECUTE FUNCTION groups_count_students();
+CREATE TRIGGER students_count_update AFTER UPDATE ON students
+    REFERENCING OLD TABLE AS old_students NEW TABLE AS new_students
+    FOR EACH STATEMENT EXECUTE FUNCTION groups_count_students();
+CREATE TRIGGER students_count_delete AFTER DELETE ON students
+    REFERENCING OLD TABLE AS old_students
+    FOR EACH STATEMENT EXECUTE FUNCTION groups_count_students();
+"""
+
+
+def upgrade():
+    op.add_column('groups', sa.Column('student_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute("UPDATE groups SET student_count = counts.student_count "
+               "FROM (SELECT group_id, count(*) AS student_count FROM students "
+               "      WHERE group_id IS NOT NULL GROUP BY group_id) AS counts "
+               "WHERE groups.group_id = counts.group_id")
+    op.create_index(op.f('ix_groups_student_count'), 'groups', ['student_count'], unique=False)
+    op.execute(count_function)
+    op.execute(count_triggers)
+
+
+def downgrade():
+    for event in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER students_count_{event} ON students")
+    op.execute("DROP FUNCTION groups_count_students()")
+    op.drop_index(op.f('ix_groups_student_count'), table_name='groups')
+    op.drop_column('groups', 'student_count')
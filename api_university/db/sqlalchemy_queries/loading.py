@@ -0,0 +1,61 @@
+# Loader options which make a query fetch exactly what a schema dumps:
+# only the dumped columns, and every dumped relationship in one go,
+# so that dumping N objects neither reads unused columns nor fires N lazy loads.
+from marshmallow import Schema, fields
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload, load_only
+from sqlalchemy.orm.strategy_options import Load
+
+
+def _relationship_loader(model, relationship_name: str) -> Load:
+    relationship = inspect(model).relationships[relationship_name]
+    attribute = getattr(model, relationship_name)
+    # many-to-one is one LEFT JOIN, collections are one extra "IN" query
+    return selectinload(attribute) if relationship.uselist else joinedload(attribute)
+
+
+def _column_loader(model, column_names) -> Load:
+    mapper = inspect(model)
+    column_names = dict.fromkeys([*(column.key for column in mapper.primary_key), *column_names])
+    return load_only(*(getattr(model, column_name) for column_name in column_names))
+
+
+def _loaders(model, schema: Schema) -> list[Load]:
+    mapper = inspect(model)
+    relationship_fields = getattr(schema, 'relationship_fields', {})
+
+    column_names = []
+    loaders = []
+    for field_name, field in schema.dump_fields.items():
+        attribute_name = field.attribute or field_name
+        relationship_name, _, related_column = relationship_fields.get(field_name, attribute_name).partition('.')
+
+        if attribute_name in mapper.column_attrs:
+            column_names.append(attribute_name)
+            continue
+        if relationship_name not in mapper.relationships:
+            continue
+
+        relationship = mapper.relationships[relationship_name]
+        related_model = relationship.mapper.class_
+        # local foreign keys let the ORM match the eager loaded rows
+        column_names.extend(column.key for column in relationship.local_columns
+                            if column.key in mapper.column_attrs)
+        if isinstance(field, fields.Nested):
+            related_loaders = _loaders(related_model, field.schema)
+        else:
+            # related primary keys (Related fields) or a named column (computed fields)
+            related_loaders = [_column_loader(related_model, [related_column] if related_column else [])]
+        loaders.append(_relationship_loader(model, relationship_name).options(*related_loaders))
+
+    return [_column_loader(model, column_names), *loaders]
+
+
+def schema_loaders(schema: Schema) -> list[Load]:
+    """
+    Returns loader options for the model of `schema`:
+    `load_only` of the dumped columns and eager loaders for every relationship read while dumping,
+    that is relationship fields (Nested, Related) and computed fields listed in
+    `schema.relationship_fields` as `{field_name: 'relationship.column'}`.
+    """
+    return _loaders(schema.opts.model, schema)
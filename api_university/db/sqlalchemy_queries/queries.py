@@ -1,30 +1,61 @@
 # This module contains flask-sqlalchemy queries.
 # It is needed to avoid circular imports in models.
-from sqlalchemy import func
+from functools import reduce
+from operator import add
+
+from flask_sqlalchemy import BaseQuery
+from sqlalchemy import and_, case, cast, func, or_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+from sqlalchemy.sql import ColumnElement
 
 from api_university.models.student import StudentModel
 from api_university.models.group import GroupModel
-from api_university.models.course import CourseModel
 from api_university.models.relationships import students_courses
 
 
 class ComplexQuery:
     @staticmethod
-    def get_students_filter_by_group_and_course(group_id: int, course_id: int) -> StudentModel:
-        query = StudentModel.query\
-                            .outerjoin(GroupModel)\
-                            .outerjoin(students_courses)\
-                            .outerjoin(CourseModel)\
-                            .where(GroupModel.group_id == group_id,
-                                   CourseModel.course_id == course_id)\
-                            .order_by(StudentModel.student_id)
-        return query.all()
+    def query_students(group_id: int = None, course_id: int = None) -> BaseQuery:
+        query = StudentModel.query
+        if group_id is not None:
+            query = query.filter(StudentModel.group_id == group_id)
+        if course_id is not None:
+            query = query.join(students_courses)\
+                         .filter(students_courses.c.course_id == course_id)
+        return query.order_by(StudentModel.student_id)
+
+    @staticmethod
+    def query_students_by_name(words: list[str]) -> tuple[BaseQuery, ColumnElement]:
+        """
+        Students whose first or last name starts with every word or is similar to it (pg_trgm `%` operator),
+        both conditions are served by the trigram indexes of the name columns.
+        :return: (query, rank of the student): a prefix match of a word counts 1,
+                 a similar name counts its similarity, the ranks of the words are summed up.
+        """
+        names = (StudentModel.first_name, StudentModel.last_name)
+        conditions, ranks = [], []
+        for word in words:
+            prefix = word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            prefix_match = or_(*(name.ilike(prefix) for name in names))
+            conditions.append(or_(prefix_match, *(name.bool_op('%')(word) for name in names)))
+            ranks.append(func.greatest(case((prefix_match, 1.0), else_=0.0),
+                                       *(func.similarity(name, word) for name in names)))
+        rank = cast(reduce(add, ranks), DOUBLE_PRECISION)
+        return StudentModel.query.filter(and_(*conditions)), rank
+
+    @staticmethod
+    def get_students_filter_by_group_and_course(group_id: int, course_id: int) -> list[StudentModel]:
+        return ComplexQuery.query_students(group_id, course_id).all()
+
+    @staticmethod
+    def query_groups_filter_by_student_count(max_count: int = None, min_count: int = None) -> BaseQuery:
+        query = GroupModel.query
+        if max_count is not None:
+            query = query.filter(GroupModel.student_count <= max_count)
+        if min_count is not None:
+            query = query.filter(GroupModel.student_count >= min_count)
+        return query.order_by(GroupModel.group_id)
 
     @staticmethod
-    def get_groups_filter_by_student_count(student_count: int) -> GroupModel:
-        query = GroupModel.query\
-                          .outerjoin(StudentModel)\
-                          .group_by(GroupModel.group_id)\
-                          .having(func.count(StudentModel.student_id) <= student_count)\
-                          .order_by(GroupModel.group_id)
-        return query.all()
+    def get_groups_filter_by_student_count(max_count: int = None, min_count: int = None) -> list[GroupModel]:
+        return ComplexQuery.query_groups_filter_by_student_count(max_count, min_count).all()
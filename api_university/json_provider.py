@@ -0,0 +1,76 @@
+from typing import Any, NoReturn
+
+from flask import Flask
+from flask.json import JSONDecoder, JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json is used without it
+    orjson = None
+
+
+class OrjsonEncoder(JSONEncoder):
+    """
+    Encodes with orjson, falls back to the stdlib encoder for options orjson does not have
+    (indent other than 2, skipkeys) and for values it cannot encode (e.g. integers over 64 bits).
+    Non ASCII characters are written as UTF-8 whatever `ensure_ascii` is.
+    Types unknown to orjson and dates are encoded by `default` the same way as Flask does.
+    """
+    def _orjson_option(self) -> int | None:
+        if orjson is None or self.skipkeys or self.indent not in (None, 2):
+            return None
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def encode(self, o: Any) -> str:
+        option = self._orjson_option()
+        if option is not None:
+            try:
+                return orjson.dumps(o, default=self.default, option=option).decode()
+            except TypeError:
+                pass
+        return super().encode(o)
+
+
+class OrjsonDecoder(JSONDecoder):
+    """Decodes with orjson, falls back to the stdlib decoder if any hook is given."""
+    def decode(self, s: str, *args) -> Any:
+        if (orjson is None or self.object_hook or self.object_pairs_hook
+                or self.parse_float is not float or self.parse_int is not int):
+            return super().decode(s, *args)
+        return orjson.loads(s)
+
+
+class JSONProvider:
+    """
+    Sets the JSON encoder and decoder of the app: of `jsonify` (error responses),
+    of flask-restful representations (resource responses, streamed lists, cached responses)
+    and of `request.get_json()`.
+
+    Settings:
+        JSON_PROVIDER - 'orjson' (the stdlib json is used if orjson is not installed) or 'stdlib'
+    """
+    def __init__(self, app: Flask = None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> NoReturn:
+        match app.config.get('JSON_PROVIDER', 'orjson'):
+            case 'orjson' if orjson is not None:
+                encoder, decoder = OrjsonEncoder, OrjsonDecoder
+            case 'orjson' | 'stdlib':
+                encoder, decoder = JSONEncoder, JSONDecoder
+            case provider:
+                raise ValueError(f"unknown JSON provider '{provider}'")
+        app.json_encoder = encoder
+        app.json_decoder = decoder
+        # flask-restful passes these settings to `json.dumps`
+        app.config['RESTFUL_JSON'] = {'cls': encoder, **app.config.get('RESTFUL_JSON', {})}
+        app.extensions['json_provider'] = self
+
+
+json_provider = JSONProvider()
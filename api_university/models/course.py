@@ -11,7 +11,7 @@ class CourseModel(db.Model):
     __tablename__ = "courses"
 
     course_id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.Text)
 
     students = db.relationship('StudentModel',
@@ -40,10 +40,10 @@ class CourseModel(db.Model):
         return cls.query.filter_by(course_id=course_id).first()
 
     @classmethod
-    def find_by_id_or_404(cls, course_id: int) -> "CourseModel":
+    def find_by_id_or_404(cls, course_id: int, options: list = ()) -> "CourseModel":
         message = gettext_("course_not_found").format(course_id)
         status = 404
-        return cls.query.get_or_404(course_id, make_error(status, message))
+        return cls.query.options(*options).get_or_404(course_id, make_error(status, message))
 
     @classmethod
     def not_find_by_id_or_400(cls, course_id: int) -> None:
@@ -56,9 +56,19 @@ class CourseModel(db.Model):
         if course_ids is None:
             selected_courses = None
         else:
-            selected_courses = [cls.find_by_id_or_404(course) for course in course_ids]
+            status = 404
+            selected_courses = cls.query.get_all_or_404(
+                course_ids, lambda missing_ids: make_error(status, gettext_("course_list_not_found").format(missing_ids))
+            )
         return selected_courses
 
+    @classmethod
+    def check_ids_or_404(cls, course_ids: list) -> None:
+        status = 404
+        cls.query.exist_all_or_404(
+            course_ids, lambda missing_ids: make_error(status, gettext_("course_list_not_found").format(missing_ids))
+        )
+
     def save_to_db(self) -> NoReturn:
         db.session.add(self)
         db.session.commit()
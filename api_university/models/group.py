@@ -1,16 +1,21 @@
-from sqlalchemy import asc
+from sqlalchemy import and_, asc, any_, bindparam, delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from typing import NoReturn
 
 from api_university.handlers import make_error
 from api_university.db.db_sqlalchemy import db
 from api_university.responses.response_strings import gettext_
+from .student import StudentModel
+from .relationships import students_courses
 
 
 class GroupModel(db.Model):
     __tablename__ = "groups"
 
     group_id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String, nullable=False)
+    name = db.Column(db.String, nullable=False, index=True)
+    # kept by the triggers of models/student_count.py
+    student_count = db.Column(db.Integer, nullable=False, server_default='0', index=True)
 
     students = db.relationship('StudentModel',
                                backref=db.backref('group'),
@@ -37,10 +42,10 @@ class GroupModel(db.Model):
         return cls.query.filter_by(group_id=group_id).first()
 
     @classmethod
-    def find_by_id_or_404(cls, group_id: int) -> "GroupModel":
+    def find_by_id_or_404(cls, group_id: int, options: list = ()) -> "GroupModel":
         message = gettext_("group_not_found").format(group_id)
         status = 404
-        return cls.query.get_or_404(group_id, make_error(status, message))
+        return cls.query.options(*options).get_or_404(group_id, make_error(status, message))
 
     @classmethod
     def not_find_by_id_or_400(cls, group_id: int) -> None:
@@ -48,6 +53,97 @@ class GroupModel(db.Model):
         status = 400
         return cls.query.not_exists_or_400(group_id, make_error(status, message))
 
+    @classmethod
+    def check_ids_or_404(cls, group_ids: list) -> None:
+        status = 404
+        cls.query.exist_all_or_404(
+            group_ids, lambda missing_ids: make_error(status, gettext_("group_list_not_found").format(missing_ids))
+        )
+
+    def add_students(self, student_ids: list[int]) -> NoReturn:
+        """Moves the students into the group by one UPDATE, the members are not loaded."""
+        students = StudentModel.__table__
+        db.session.execute(update(students)
+                           .where(students.c.student_id == any_(self._ids_array(student_ids)))
+                           .values(group_id=self.group_id))
+
+    def remove_students(self, student_ids: list[int]) -> NoReturn:
+        """Takes the students out of the group by one UPDATE, students of other groups stay where they are."""
+        students = StudentModel.__table__
+        db.session.execute(update(students)
+                           .where(students.c.student_id == any_(self._ids_array(student_ids)),
+                                  students.c.group_id == self.group_id)
+                           .values(group_id=None))
+
+    def move_students(self, target_id: int, student_ids: list[int] = None, course_id: int = None) -> int:
+        """
+        Moves the students of the group into the group `target_id` by one UPDATE,
+        only the given students and/or the students enrolled in the course if they are given.
+        Returns the number of the moved students.
+        """
+        students = StudentModel.__table__
+        conditions = [students.c.group_id == self.group_id]
+        if student_ids is not None:
+            conditions.append(students.c.student_id == any_(self._ids_array(student_ids)))
+        if course_id is not None:
+            conditions.append(exists().where(and_(students_courses.c.student_id == students.c.student_id,
+                                                  students_courses.c.course_id == course_id)))
+        result = db.session.execute(update(students).where(*conditions).values(group_id=target_id))
+        db.session.commit()
+        return result.rowcount
+
+    def merge_groups(self, group_ids: list[int], delete_groups: bool = False) -> tuple[int, list[int]]:
+        """
+        Moves all the students of the groups into this group by one UPDATE,
+        the emptied groups are deleted in the same transaction if `delete_groups` is set.
+        Returns the number of the moved students and the ids of the deleted groups.
+        """
+        group_ids = [group_id for group_id in dict.fromkeys(group_ids) if group_id != self.group_id]
+        students, groups = StudentModel.__table__, self.__table__
+        groups_array = bindparam('group_ids', group_ids, type_=ARRAY(db.Integer))
+        result = db.session.execute(update(students)
+                                    .where(students.c.group_id == any_(groups_array))
+                                    .values(group_id=self.group_id))
+        deleted_ids = []
+        if delete_groups:
+            deleted_ids = sorted(group_id for group_id, in db.session.execute(
+                delete(groups).where(groups.c.group_id == any_(groups_array)).returning(groups.c.group_id)
+            ))
+        db.session.commit()
+        return result.rowcount, deleted_ids
+
+    def split_students(self, target_id: int, rule: str) -> int:
+        """
+        Moves a part of the students, ordered by name, into the group `target_id` by one UPDATE:
+            'half' - the second half of the list, the smaller one for an odd number of students
+            'alternate' - every second student of the list
+        Returns the number of the moved students.
+        """
+        students = StudentModel.__table__
+        ranked = select(students.c.student_id,
+                        func.row_number().over(order_by=[students.c.last_name,
+                                                         students.c.first_name,
+                                                         students.c.student_id]).label('position'),
+                        func.count().over().label('total'))\
+            .where(students.c.group_id == self.group_id)\
+            .cte('ranked')
+        match rule:
+            case 'half':
+                condition = ranked.c.position * 2 > ranked.c.total + 1
+            case 'alternate':
+                condition = ranked.c.position % 2 == 0
+            case _:
+                raise ValueError(f"unknown split rule {rule!r}")
+        result = db.session.execute(update(students)
+                                    .where(students.c.student_id == ranked.c.student_id, condition)
+                                    .values(group_id=target_id))
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def _ids_array(student_ids: list[int]):
+        return bindparam('student_ids', list(student_ids), type_=ARRAY(db.Integer))
+
     def save_to_db(self) -> NoReturn:
         db.session.add(self)
         db.session.commit()
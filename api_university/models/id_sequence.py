@@ -0,0 +1,83 @@
+# Sequences behind the integer primary keys of the tables (serial columns).
+#
+# Bulk inserts reserve their ids from the sequence in one round trip, so concurrent inserts never collide.
+# Rows can also be inserted with ids given by the client (POST /students/<id>, prepared data),
+# such ids move the sequence forward, so it never hands them out again.
+from typing import NoReturn
+
+from sqlalchemy import Column, Integer, event, func, inspect, select, text
+from sqlalchemy.engine import Connection
+
+from api_university.db.db_sqlalchemy import db
+
+RESERVE_IDS = text("SELECT nextval(pg_get_serial_sequence(:table_name, :column_name)) "
+                   "FROM generate_series(1, :count)")
+
+# the sequence is never moved back, it may have handed out larger ids to transactions not committed yet.
+# Concurrent advances of a sequence are serialized by an advisory lock on it (held by the transaction),
+# taken in the CTE before the check, so a smaller setval can not land after a larger one
+ADVANCE_SEQUENCE = text("WITH locked_sequence AS MATERIALIZED ("
+                        "    SELECT sequence_name::regclass AS sequence_id, "
+                        "           pg_advisory_xact_lock(sequence_name::regclass::oid::bigint) "
+                        "    FROM pg_get_serial_sequence(:table_name, :column_name) AS sequence_name) "
+                        "SELECT setval(sequence_id, :value) FROM locked_sequence "
+                        "WHERE :value > coalesce(pg_sequence_last_value(sequence_id), 0)")
+
+
+def reserve_ids(column: Column, count: int) -> list[int]:
+    """Takes `count` new ids from the sequence of the primary key column."""
+    if count <= 0:
+        return []
+    rows = db.session.execute(RESERVE_IDS, {'table_name': column.table.name,
+                                            'column_name': column.name,
+                                            'count': count})
+    return sorted(id_ for id_, in rows)
+
+
+def advance_sequence(column: Column, value: int, connection: Connection = None) -> NoReturn:
+    """
+    Moves the sequence of the primary key column to the value if it is behind.
+    Other transactions advancing the same sequence wait for the end of the current one.
+    """
+    connection = connection or db.session.connection()
+    connection.execute(ADVANCE_SEQUENCE, {'table_name': column.table.name,
+                                          'column_name': column.name,
+                                          'value': value})
+
+
+def reset_sequence(column: Column) -> NoReturn:
+    """Moves the sequence of the primary key column back to the largest id of the table."""
+    sequence_name = func.pg_get_serial_sequence(column.table.name, column.name)
+    # the sequence of an empty table is left not called, pg_sequence_last_value is NULL for it
+    max_id = func.max(column)
+    db.session.execute(select(func.setval(sequence_name, func.coalesce(max_id, 1), max_id.isnot(None))))
+
+
+def _given_ids(session) -> dict[Column, int]:
+    """Returns the largest id given to the new objects of the flush per serial primary key column."""
+    given_ids = {}
+    for obj in session.new:
+        mapper = inspect(obj).mapper
+        if len(mapper.primary_key) != 1:
+            continue
+        column, = mapper.primary_key
+        if not isinstance(column.type, Integer) or column.autoincrement not in (True, 'auto'):
+            continue
+        value = getattr(obj, mapper.get_property_by_column(column).key)
+        if value is not None:
+            given_ids[column] = max(value, given_ids.get(column, value))
+    return given_ids
+
+
+@event.listens_for(db.session, 'before_flush')
+def collect_given_ids(session, flush_context, instances) -> NoReturn:
+    # ids generated by the sequence during the flush are not given ones, so they are collected before it
+    session.info['given_ids'] = _given_ids(session)
+
+
+@event.listens_for(db.session, 'after_flush')
+def advance_flushed_sequences(session, flush_context) -> NoReturn:
+    # the sequences are locked in the same order by every transaction, so concurrent flushes do not deadlock
+    given_ids = session.info.pop('given_ids', {})
+    for column in sorted(given_ids, key=lambda column_: column_.table.name):
+        advance_sequence(column, given_ids[column], session.connection())
@@ -1,7 +1,55 @@
+from sqlalchemy import Integer, any_, bindparam, delete, func, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
 from api_university.db.db_sqlalchemy import db
 
-# relationship many to many
+# relationship many to many,
+# the primary key serves the joins from students, the reverse index the joins from courses
 students_courses = db.Table('students_courses',
-                            db.Column('student_id', db.Integer, db.ForeignKey('students.student_id')),
-                            db.Column('course_id', db.Integer, db.ForeignKey('courses.course_id'))
+                            db.Column('student_id', db.Integer,
+                                      db.ForeignKey('students.student_id', ondelete='CASCADE'),
+                                      primary_key=True),
+                            db.Column('course_id', db.Integer,
+                                      db.ForeignKey('courses.course_id', ondelete='CASCADE'),
+                                      primary_key=True),
+                            db.Index('ix_students_courses_course_id_student_id', 'course_id', 'student_id')
                             )
+
+
+def _ids_array(name: str, ids: list[int]):
+    return bindparam(name, list(dict.fromkeys(ids)), type_=ARRAY(Integer))
+
+
+def enroll(student_ids: list[int], course_ids: list[int]) -> list[tuple[int, int]]:
+    """
+    Links every student to every course by one INSERT ... SELECT from the unnested id arrays,
+    the links which already exist are skipped by ON CONFLICT DO NOTHING. Collections of the students and courses are not loaded.
+    Returns the added (student_id, course_id) links.
+    """
+    new_students = func.unnest(_ids_array('student_ids', student_ids))\
+        .table_valued('student_id').render_derived(name='new_students')
+    new_courses = func.unnest(_ids_array('course_ids', course_ids))\
+        .table_valued('course_id').render_derived(name='new_courses')
+    new_links = select(new_students.c.student_id, new_courses.c.course_id)\
+        .select_from(new_students.join(new_courses, true()))
+    statement = insert(students_courses)\
+        .from_select(['student_id', 'course_id'], new_links)\
+        .on_conflict_do_nothing()\
+        .returning(students_courses.c.student_id, students_courses.c.course_id)
+    added_links = [tuple(link) for link in db.session.execute(statement)]
+    db.session.commit()
+    return added_links
+
+
+def unenroll(student_ids: list[int], course_ids: list[int]) -> list[tuple[int, int]]:
+    """
+    Unlinks every student from every course by one DELETE.
+    Returns the deleted (student_id, course_id) links.
+    """
+    statement = delete(students_courses)\
+        .where(students_courses.c.student_id == any_(_ids_array('student_ids', student_ids)),
+               students_courses.c.course_id == any_(_ids_array('course_ids', course_ids)))\
+        .returning(students_courses.c.student_id, students_courses.c.course_id)
+    deleted_links = [tuple(link) for link in db.session.execute(statement)]
+    db.session.commit()
+    return deleted_links
@@ -0,0 +1,102 @@
+# Statistics of the university served from materialized views,
+# the analytic queries run on refresh only instead of on every request.
+#
+# The views are refreshed CONCURRENTLY (readers are not blocked, a unique index per view is required)
+# by `refresh_stats`: on a schedule (scripts/refresh_stats.py), after bulk imports and by POST /stats/refresh.
+# Every refresh is recorded in stats_refreshes through the session, so the version of that table
+# changes the ETags of the statistics and invalidates their cached responses.
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import DDL, Column, Integer, BigInteger, MetaData, String, Table, event, func, text
+from sqlalchemy.dialects.postgresql import insert
+
+from api_university.db.db_sqlalchemy import db
+
+# view name: (query, unique key column)
+STATS_VIEWS = {
+    'stats_student_courses': (
+        "SELECT students.student_id, students.group_id, "
+        "concat(students.first_name, ' ', students.last_name) AS full_name, "
+        "count(students_courses.course_id) AS number_of_courses "
+        "FROM students LEFT JOIN students_courses USING (student_id) "
+        "GROUP BY students.student_id",
+        'student_id'
+    ),
+    'stats_course_students': (
+        "SELECT courses.course_id, courses.name, count(students_courses.student_id) AS number_of_students "
+        "FROM courses LEFT JOIN students_courses USING (course_id) "
+        "GROUP BY courses.course_id",
+        'course_id'
+    ),
+    'stats_course_counts': (
+        "SELECT number_of_courses, count(*) AS number_of_students "
+        "FROM (SELECT students.student_id, count(students_courses.course_id) AS number_of_courses "
+        "      FROM students LEFT JOIN students_courses USING (student_id) "
+        "      GROUP BY students.student_id) AS per_student "
+        "GROUP BY number_of_courses",
+        'number_of_courses'
+    ),
+}
+
+# the views to read from, they are not a part of db.Model.metadata, so create_all does not make tables of them
+views_metadata = MetaData()
+stats_student_courses = Table('stats_student_courses', views_metadata,
+                              Column('student_id', Integer, primary_key=True),
+                              Column('group_id', Integer),
+                              Column('full_name', String),
+                              Column('number_of_courses', BigInteger))
+stats_course_students = Table('stats_course_students', views_metadata,
+                              Column('course_id', Integer, primary_key=True),
+                              Column('name', String),
+                              Column('number_of_students', BigInteger))
+stats_course_counts = Table('stats_course_counts', views_metadata,
+                            Column('number_of_courses', BigInteger, primary_key=True),
+                            Column('number_of_students', BigInteger))
+
+
+class StatsRefreshModel(db.Model):
+    """Time of the last refresh of a statistics view."""
+    __tablename__ = "stats_refreshes"
+
+    view_name = db.Column(db.String(63), primary_key=True)
+    refreshed_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"StatsRefreshModel {self.view_name}={self.refreshed_at}"
+
+    @classmethod
+    def get_refresh_times(cls) -> dict[str, datetime | None]:
+        """Returns refresh times of the views, None for views which have never been refreshed."""
+        refresh_times = dict.fromkeys(STATS_VIEWS)
+        refresh_times.update(db.session.query(cls.view_name, cls.refreshed_at))
+        return refresh_times
+
+
+def refresh_stats(view_names: Iterable[str] = None) -> dict[str, datetime]:
+    """
+    Refreshes the views (all of them by default) concurrently, a transaction per view.
+    Returns refresh times of the refreshed views.
+    """
+    refresh_times = {}
+    for view_name in view_names or STATS_VIEWS:
+        db.session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}"))
+        table = StatsRefreshModel.__table__
+        statement = insert(table).values(view_name=view_name, refreshed_at=func.clock_timestamp())
+        statement = statement.on_conflict_do_update(index_elements=[table.c.view_name],
+                                                    set_={'refreshed_at': statement.excluded.refreshed_at})
+        refresh_times[view_name] = db.session.execute(statement.returning(table.c.refreshed_at)).scalar()
+        db.session.commit()
+    return refresh_times
+
+
+def _create_views() -> str:
+    return ';\n'.join(f"CREATE MATERIALIZED VIEW {view_name} AS {query};\n"
+                      f"CREATE UNIQUE INDEX ix_{view_name}_{key} ON {view_name} ({key})"
+                      for view_name, (query, key) in STATS_VIEWS.items())
+
+
+# the views depend on the tables: they are made after the tables and dropped before them
+event.listen(db.Model.metadata, 'after_create', DDL(_create_views()))
+event.listen(db.Model.metadata, 'before_drop',
+             DDL(';\n'.join(f"DROP MATERIALIZED VIEW IF EXISTS {view_name}" for view_name in STATS_VIEWS)))
@@ -1,10 +1,13 @@
-from sqlalchemy import func, asc
+from flask import abort
+from sqlalchemy import DDL, event, func, asc, insert, update, delete, bindparam, tuple_, any_
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from typing import NoReturn
 
 from api_university.handlers import make_error
 from api_university.db.db_sqlalchemy import db
 from api_university.responses.response_strings import gettext_
 from .relationships import students_courses
+from .id_sequence import reserve_ids
 
 
 class StudentModel(db.Model):
@@ -14,7 +17,15 @@ class StudentModel(db.Model):
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
 
-    group_id = db.Column(db.Integer, db.ForeignKey("groups.group_id"))
+    group_id = db.Column(db.Integer, db.ForeignKey("groups.group_id"), index=True)
+
+    # trigram indexes of the name search (pg_trgm)
+    __table_args__ = (
+        db.Index('ix_students_first_name_trgm', 'first_name',
+                 postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'}),
+        db.Index('ix_students_last_name_trgm', 'last_name',
+                 postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'}),
+    )
 
     def __repr__(self):
         return f"StudentModel {self.student_id}"
@@ -39,10 +50,10 @@ class StudentModel(db.Model):
         return cls.query.filter_by(student_id=student_id).first()
    
     @classmethod
-    def find_by_id_or_404(cls, student_id: int) -> "StudentModel":
+    def find_by_id_or_404(cls, student_id: int, options: list = ()) -> "StudentModel":
         message = gettext_("student_not_found").format(student_id)
         status = 404
-        return cls.query.get_or_404(student_id, make_error(status, message))
+        return cls.query.options(*options).get_or_404(student_id, make_error(status, message))
 
     @classmethod
     def not_find_by_id_or_400(cls, student_id: int) -> None:
@@ -55,9 +66,110 @@ class StudentModel(db.Model):
         if student_ids is None:
             selected_students = None
         else:
-            selected_students = [cls.find_by_id_or_404(student) for student in student_ids]
+            status = 404
+            selected_students = cls.query.get_all_or_404(
+                student_ids, lambda missing_ids: make_error(status, gettext_("student_list_not_found").format(missing_ids))
+            )
         return selected_students
 
+    @classmethod
+    def bulk_insert(cls, students: list[dict]) -> list[int]:
+        """
+        Inserts the students and their course links in one transaction
+        with multi-row INSERTs, instead of a flush and a commit per student.
+        Ids are reserved from the sequence of the table, so concurrent inserts do not collide.
+        Students are dicts of the columns and 'courses' - course ids.
+        Returns ids of the new students.
+        """
+        if not students:
+            return []
+        student_ids = reserve_ids(cls.__table__.c.student_id, len(students))
+        rows, links = [], []
+        for student_id, student in zip(student_ids, students):
+            rows.append({'student_id': student_id,
+                         'first_name': student['first_name'],
+                         'last_name': student['last_name'],
+                         'group_id': student.get('group_id')})
+            links.extend({'student_id': student_id, 'course_id': course_id}
+                         for course_id in dict.fromkeys(student.get('courses') or ()))
+        db.session.execute(insert(cls.__table__), rows)
+        if links:
+            db.session.execute(insert(students_courses), links)
+        db.session.commit()
+        return [row['student_id'] for row in rows]
+
+    @classmethod
+    def bulk_update(cls, updates: list[dict]) -> list[int]:
+        """
+        Updates the students in one transaction: the students are checked with one query,
+        the columns are written by an UPDATE per set of changed columns (executed in batches),
+        'add_courses' and 'delete_courses' by one INSERT and one DELETE of their course links.
+        Updates are dicts of 'student_id', the changed columns, 'add_courses' and 'delete_courses'.
+        Returns ids of the updated students.
+        """
+        student_ids = list(dict.fromkeys(student.get('student_id') for student in updates))
+        existing_ids = {student_id for student_id, in
+                        db.session.query(cls.student_id).filter(cls.student_id.in_(student_ids))}
+        for student_id in student_ids:
+            if student_id not in existing_ids:
+                abort(make_error(404, gettext_("student_not_found").format(student_id)))
+
+        # later updates of the same student override earlier ones, as they do one by one
+        changed_columns = {}
+        added_links, deleted_links = set(), set()
+        for student in updates:
+            student_id = student['student_id']
+            changed_columns.setdefault(student_id, {}).update(
+                {column: student[column] for column in ('first_name', 'last_name', 'group_id') if column in student})
+            for course_id in student.get('add_courses') or ():
+                added_links.add((student_id, course_id))
+                deleted_links.discard((student_id, course_id))
+            for course_id in student.get('delete_courses') or ():
+                deleted_links.add((student_id, course_id))
+                added_links.discard((student_id, course_id))
+
+        statements = {}
+        for student_id, columns in changed_columns.items():
+            if columns:
+                statements.setdefault(tuple(sorted(columns)), []).append({'id': student_id, **columns})
+        # the SET clause is made of the columns of the parameters
+        statement = update(cls.__table__).where(cls.__table__.c.student_id == bindparam('id'))
+        for rows in statements.values():
+            db.session.execute(statement, rows)
+
+        links = tuple_(students_courses.c.student_id, students_courses.c.course_id)
+        if deleted_links:
+            db.session.execute(delete(students_courses).where(links.in_(sorted(deleted_links))))
+        if added_links:
+            db.session.execute(pg_insert(students_courses).on_conflict_do_nothing(),
+                               [{'student_id': student_id, 'course_id': course_id}
+                                for student_id, course_id in sorted(added_links)])
+        db.session.commit()
+        return [student['student_id'] for student in updates]
+
+    @classmethod
+    def bulk_delete(cls, student_ids: list[int]) -> list[int]:
+        """
+        Deletes the students and their course links in one transaction
+        by two DELETE statements, the ids are sent as one array parameter.
+        Returns ids of the deleted students in the given order, missing students are skipped.
+        """
+        ids = bindparam('ids', list(student_ids), type_=ARRAY(db.Integer))
+        db.session.execute(delete(students_courses).where(students_courses.c.student_id == any_(ids)))
+        result = db.session.execute(delete(cls.__table__)
+                                    .where(cls.__table__.c.student_id == any_(ids))
+                                    .returning(cls.__table__.c.student_id))
+        deleted_ids = {student_id for student_id, in result}
+        db.session.commit()
+        return [student_id for student_id in dict.fromkeys(student_ids) if student_id in deleted_ids]
+
+    @classmethod
+    def check_ids_or_404(cls, student_ids: list) -> None:
+        status = 404
+        cls.query.exist_all_or_404(
+            student_ids, lambda missing_ids: make_error(status, gettext_("student_list_not_found").format(missing_ids))
+        )
+
     def save_to_db(self) -> NoReturn:
         db.session.add(self)
         db.session.commit()
@@ -66,3 +178,6 @@ class StudentModel(db.Model):
         db.session.delete(self)
         db.session.commit()
 
+
+# the operator class of the trigram indexes comes from the extension
+event.listen(StudentModel.__table__, 'before_create', DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
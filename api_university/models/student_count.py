@@ -0,0 +1,95 @@
+# groups.student_count is kept by statement level triggers on students,
+# so every way of writing students (ORM, Core bulk statements, COPY of the import) keeps it right.
+# The triggers see all the rows of a statement at once (transition tables)
+# and change every touched group once per statement, not once per student.
+from typing import Iterator
+
+from sqlalchemy import DDL, event, func, select, update
+
+from api_university.db.db_sqlalchemy import db
+from .group import GroupModel
+from .student import StudentModel
+
+COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION groups_count_students() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE groups SET student_count = groups.student_count + changes.delta
+        FROM (SELECT group_id, count(*) AS delta FROM new_students
+              WHERE group_id IS NOT NULL GROUP BY group_id) AS changes
+        WHERE groups.group_id = changes.group_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE groups SET student_count = groups.student_count - changes.delta
+        FROM (SELECT group_id, count(*) AS delta FROM old_students
+              WHERE group_id IS NOT NULL GROUP BY group_id) AS changes
+        WHERE groups.group_id = changes.group_id;
+    ELSE
+        UPDATE groups SET student_count = groups.student_count + changes.delta
+        FROM (SELECT group_id, sum(delta) AS delta
+              FROM (SELECT old_students.group_id, -1 AS delta
+                    FROM old_students JOIN new_students USING (student_id)
+                    WHERE old_students.group_id IS DISTINCT FROM new_students.group_id
+                    UNION ALL
+                    SELECT new_students.group_id, 1 AS delta
+                    FROM old_students JOIN new_students USING (student_id)
+                    WHERE old_students.group_id IS DISTINCT FROM new_students.group_id) AS moves
+              WHERE group_id IS NOT NULL GROUP BY group_id) AS changes
+        WHERE groups.group_id = changes.group_id AND changes.delta <> 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+# a trigger with transition tables handles one event
+COUNT_TRIGGERS = """
+CREATE TRIGGER students_count_insert AFTER INSERT ON students
+    REFERENCING NEW TABLE AS new_students
+    FOR EACH STATEMENT EXECUTE FUNCTION groups_count_students();
+CREATE TRIGGER students_count_update AFTER UPDATE ON students
+    REFERENCING OLD TABLE AS old_students NEW TABLE AS new_students
+    FOR EACH STATEMENT EXECUTE FUNCTION groups_count_students();
+CREATE TRIGGER students_count_delete AFTER DELETE ON students
+    REFERENCING OLD TABLE AS old_students
+    FOR EACH STATEMENT EXECUTE FUNCTION groups_count_students();
+"""
+
+event.listen(StudentModel.__table__, 'after_create', DDL(COUNT_FUNCTION))
+event.listen(StudentModel.__table__, 'after_create', DDL(COUNT_TRIGGERS))
+
+
+def repair_student_counts(batch_size: int = 1000) -> Iterator[tuple[int, list[int]]]:
+    """
+    Recounts the students of the groups batch by batch, a transaction per batch,
+    and yields (number of the checked groups, ids of the groups whose count was wrong) of every batch.
+    The groups of a batch are locked before they are counted, so students written meanwhile
+    are counted either by the repair or by the triggers once the lock is released.
+    """
+    groups, students = GroupModel.__table__, StudentModel.__table__
+    last_group_id = 0
+    while True:
+        group_ids = [group_id for group_id, in db.session.execute(
+            select(groups.c.group_id)
+            .where(groups.c.group_id > last_group_id)
+            .order_by(groups.c.group_id)
+            .limit(batch_size)
+            .with_for_update(key_share=True)
+        )]
+        if not group_ids:
+            db.session.commit()
+            return
+        counts = select(groups.c.group_id, func.count(students.c.student_id).label('student_count'))\
+            .select_from(groups.outerjoin(students, students.c.group_id == groups.c.group_id))\
+            .where(groups.c.group_id.between(group_ids[0], group_ids[-1]))\
+            .group_by(groups.c.group_id)\
+            .subquery('counts')
+        repaired_ids = [group_id for group_id, in db.session.execute(
+            update(groups)
+            .where(groups.c.group_id == counts.c.group_id,
+                   groups.c.student_count != counts.c.student_count)
+            .values(student_count=counts.c.student_count)
+            .returning(groups.c.group_id)
+        )]
+        db.session.commit()
+        last_group_id = group_ids[-1]
+        yield len(group_ids), sorted(repaired_ids)
@@ -0,0 +1,138 @@
+from itertools import chain
+from typing import Iterable, NoReturn
+
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects.postgresql import insert
+
+from api_university.db.db_sqlalchemy import db
+
+# session.info keys: names of the changed tables by the (nested) transaction which has changed them
+# and the flag of a commit in progress
+SESSION_TABLES_KEY = 'changed_tables'
+SESSION_COMMITTING_KEY = 'committing_tables'
+
+
+class TableVersionModel(db.Model):
+    """
+    Change counter of a table, incremented right after every commit which has changed the table.
+    Readers compare versions instead of rows to find out whether anything has changed.
+    """
+    __tablename__ = "table_versions"
+
+    table_name = db.Column(db.String(63), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"TableVersionModel {self.table_name}={self.version}"
+
+    @classmethod
+    def get_versions(cls, table_names: Iterable[str]) -> dict[str, int]:
+        """Returns versions of the tables, 0 for tables which have never been changed."""
+        table_names = list(table_names)
+        rows = db.session.query(cls.table_name, cls.version).filter(cls.table_name.in_(table_names))
+        versions = dict.fromkeys(table_names, 0)
+        versions.update(rows)
+        return versions
+
+    @classmethod
+    def bump(cls, table_names: Iterable[str], session=None) -> NoReturn:
+        """
+        Marks the tables as changed by the current transaction (or SAVEPOINT) of the session,
+        their versions are incremented once the outermost transaction is committed.
+        Has to be called by the code which changes tables bypassing the ORM (Core statements, COPY).
+        """
+        session = session or db.session
+        if session.get_transaction() is None:
+            session.connection()  # the tables are marked in the transaction which is going to change them
+        transaction = session.get_nested_transaction() or session.get_transaction()
+        changed_tables = session.info.setdefault(SESSION_TABLES_KEY, {})
+        changed_tables.setdefault(transaction, set()).update(table_names)
+
+    @classmethod
+    def increment(cls, table_names: Iterable[str], bind) -> NoReturn:
+        """
+        Increments versions of the tables in a transaction of its own. The row of a table is locked
+        for this single statement only, so writers of the same table do not wait for each other's commits.
+        """
+        table_names = sorted(set(table_names))
+        if not table_names:
+            return
+        # rows are locked in the same order by every statement, so concurrent increments do not deadlock
+        statement = insert(cls.__table__).values([{'table_name': table_name, 'version': 1}
+                                                 for table_name in table_names])
+        statement = statement.on_conflict_do_update(index_elements=[cls.__table__.c.table_name],
+                                                    set_={'version': cls.__table__.c.version + 1})
+        # the engine of the session gives a connection of its own (a connection bind only a branch of itself)
+        with bind.connect() as connection:
+            with connection.begin():
+                connection.execute(statement)
+
+
+def _changed_tables(session) -> set[str]:
+    """Returns names of the tables written by the flush of the new, dirty and deleted objects."""
+    table_names = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        state = inspect(obj)
+        mapper = state.mapper
+        if obj not in session.dirty or session.is_modified(obj, include_collections=False):
+            table_names.update(table.name for table in mapper.tables)
+        # many to many collections are written to their secondary tables
+        for relationship in mapper.relationships:
+            if relationship.secondary is None:
+                continue
+            if obj in session.deleted or state.attrs[relationship.key].history.has_changes():
+                table_names.add(relationship.secondary.name)
+    return table_names
+
+
+@event.listens_for(db.session, 'after_flush')
+def collect_flushed_tables(session, flush_context) -> NoReturn:
+    TableVersionModel.bump(_changed_tables(session), session)
+
+
+@event.listens_for(db.session, 'do_orm_execute')
+def collect_executed_tables(orm_execute_state) -> NoReturn:
+    # INSERT, UPDATE and DELETE statements executed through the session (bulk operations)
+    statement = orm_execute_state.statement
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table_name = getattr(statement.table, 'name', None)
+        if table_name and table_name != TableVersionModel.__tablename__:
+            TableVersionModel.bump([table_name], orm_execute_state.session)
+
+
+@event.listens_for(db.session, 'before_commit')
+def mark_committing(session) -> NoReturn:
+    session.info[SESSION_COMMITTING_KEY] = True
+
+
+@event.listens_for(db.session, 'after_rollback')
+def forget_committing(session) -> NoReturn:
+    session.info.pop(SESSION_COMMITTING_KEY, None)
+
+
+def _enclosing_transaction(transaction):
+    """Returns the SAVEPOINT or the outermost transaction the given SAVEPOINT is released into."""
+    parent = transaction.parent
+    while parent.parent is not None and not parent.nested:
+        parent = parent.parent
+    return parent
+
+
+@event.listens_for(db.session, 'after_transaction_end')
+def increment_committed_tables(session, transaction) -> NoReturn:
+    if transaction.parent is not None and not transaction.nested:
+        return  # the inner transaction of a flush
+    committed = session.info.pop(SESSION_COMMITTING_KEY, False)
+    changed_tables = session.info.get(SESSION_TABLES_KEY, {})
+    table_names = changed_tables.pop(transaction, set())
+    if transaction.nested:
+        # the changes of a released SAVEPOINT are committed with the transaction it is released into,
+        # the changes of a rolled back one are gone
+        if committed and table_names:
+            changed_tables.setdefault(_enclosing_transaction(transaction), set()).update(table_names)
+        return
+    session.info.pop(SESSION_TABLES_KEY, None)
+    # runs once the outermost transaction is committed, so the versions are incremented
+    # after the changes are visible: readers never take a new version along with the old rows
+    if committed and table_names:
+        TableVersionModel.increment(table_names, session.get_bind())
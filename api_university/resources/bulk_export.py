@@ -0,0 +1,36 @@
+from flask import Response, request
+from flask_restful import Resource
+from flasgger import swag_from
+
+from api_university.config import swag_dir
+from api_university.db.db_sqlalchemy import db
+from api_university.data.bulk_export import EXPORT_QUERIES, FORMATS, export_chunks
+from api_university.handlers import make_error
+from api_university.responses.response_strings import gettext_
+from api_university.resources.type_hintings import Query_parameter_value
+from api_university.resources.conditional import conditional_get
+
+EXPORT_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+# tables the exports are read from
+export_tables = ('students', 'groups', 'courses', 'students_courses')
+
+
+class Export(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/Export/get.yml")
+    @conditional_get(*export_tables)
+    def get(cls, kind: str) -> Response:
+        if kind not in EXPORT_QUERIES:
+            return make_error(404, gettext_("export_err_kind").format(kind, list(EXPORT_QUERIES)))
+        file_format: Query_parameter_value = request.args.get('format', 'ndjson').lower()
+        if file_format not in FORMATS:
+            return make_error(400, gettext_("export_err_format").format(file_format, list(FORMATS)))
+        # the generator is not bound to the request, the copy runs on its own connection
+        chunks = export_chunks(db.engine, kind, file_format)
+        response = Response(chunks, mimetype=EXPORT_MIMETYPES[file_format])
+        response.headers['Content-Disposition'] = f'attachment; filename="{kind}.{file_format}"'
+        return response
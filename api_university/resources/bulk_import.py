@@ -0,0 +1,40 @@
+from flask import Response, json, request, stream_with_context
+from flask_restful import Resource
+from flasgger import swag_from
+from sqlalchemy.exc import SQLAlchemyError
+
+from api_university.config import swag_dir
+from api_university.data.bulk_import import TARGETS, BulkImport, read_rows
+from api_university.handlers import make_error
+from api_university.responses.response_strings import gettext_
+
+# content type: format of the body
+IMPORT_MIMETYPES = {
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+    'text/csv': 'csv',
+}
+
+
+class Import(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/Import/post.yml")
+    def post(cls, kind: str) -> Response:
+        if kind not in TARGETS:
+            return make_error(404, gettext_("import_err_kind").format(kind, list(TARGETS)))
+        file_format = IMPORT_MIMETYPES.get(request.mimetype)
+        if file_format is None:
+            return make_error(415, gettext_("import_err_format").format(list(IMPORT_MIMETYPES)))
+        bulk_import = BulkImport(kind)
+        # the body is read while the events are being sent
+        rows = read_rows(request.stream, file_format)
+
+        def generate():
+            try:
+                for event in bulk_import.run(rows):
+                    yield json.dumps(event) + '\n'
+            except SQLAlchemyError as err:
+                message = str(getattr(err, 'orig', None) or err)
+                yield json.dumps({'event': 'failed', 'message': message}) + '\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
@@ -0,0 +1,12 @@
+from flask_restful import Resource
+from flasgger import swag_from
+
+from api_university.config import swag_dir
+from api_university.cache.response_cache import response_cache
+
+
+class CacheStats(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/CacheStats/get.yml")
+    def get(cls) -> tuple[dict, int]:
+        return response_cache.stats(), 200
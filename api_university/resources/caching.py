@@ -0,0 +1,72 @@
+from functools import wraps
+from typing import Callable, NoReturn
+from urllib.parse import urlencode
+
+from flask import Response, g, request
+from flask_restful.representations.json import output_json
+from flask_restful.utils import unpack
+
+from api_university.cache.response_cache import response_cache
+from api_university.cache.invalidation import entity_tags, table_wide_tag
+
+
+def cache_key() -> str:
+    """
+    Returns the path with normalized query args: sorted, 'full' in lower case and left out if false,
+    integers without leading zeros and '?fields=' as a sorted set, so equal requests share an entry.
+    """
+    args = []
+    for name, value in sorted(request.args.items(multi=True)):
+        value = value.strip()
+        if name == 'full':
+            value = value.lower()
+            if value == 'false':
+                continue
+        elif name == 'fields':
+            value = ','.join(sorted({field_name.strip() for field_name in value.split(',')} - {''}))
+        elif value.isdigit():
+            value = str(int(value))
+        args.append((name, value))
+    return f"{request.path}?{urlencode(args)}"
+
+
+def tag_response(*objs) -> NoReturn:
+    """
+    Marks the response being made as a response about the instances (and about their relationships),
+    it is invalidated by changes of these instances only. Responses without instances are lists,
+    which are invalidated by any change of their tables.
+    """
+    g.setdefault('cache_objects', []).extend(objs)
+
+
+def cached_get(*table_names: str) -> Callable:
+    """
+    Caches the serialized responses of a GET resource method in `response_cache`, if it is enabled.
+    `table_names` are the tables the response is read from. Streamed responses are not cached.
+    """
+    def decorator(get: Callable) -> Callable:
+        @wraps(get)
+        def wrapper(*args, **kwargs):
+            if not response_cache.enabled or request.args.get('stream', 'false').lower() == 'true':
+                return get(*args, **kwargs)
+
+            key = cache_key()
+            entry = response_cache.get(key)
+            if entry is not None:
+                response = Response(entry.body, entry.status, entry.headers)
+                response.headers['X-Cache'] = 'HIT'
+                return response
+
+            generation = response_cache.generation
+            g.cache_objects = []
+            data, code, headers = unpack(get(*args, **kwargs))
+            response = output_json(data, code, headers)
+            if code == 200:
+                # the instances are tagged after the dump, when everything it shows has been loaded
+                own_tags = entity_tags(*g.cache_objects) if g.cache_objects else table_names
+                tags = {*map(table_wide_tag, table_names), *own_tags}
+                response_cache.set(key, response.get_data(), code, list(response.headers), tags, generation)
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,46 @@
+from functools import wraps
+from hashlib import sha1
+from typing import Callable
+
+from flask import Response, request
+from flask_restful.utils import unpack
+
+from api_university.models.table_version import TableVersionModel
+
+
+def make_etag(table_names: tuple[str]) -> str:
+    """
+    Returns the tag of the current state of the tables for the requested url.
+    The tag changes on every committed change of any of the tables.
+    """
+    versions = TableVersionModel.get_versions(table_names)
+    state = ','.join(f"{table_name}={versions[table_name]}" for table_name in table_names)
+    return sha1(f"{request.full_path}|{state}".encode()).hexdigest()
+
+
+def conditional_get(*table_names: str) -> Callable:
+    """
+    Makes a GET resource method conditional.
+    Responses get a weak 'ETag' made from the versions of the tables the response is read from,
+    a request with a matching 'If-None-Match' gets '304 Not Modified' without running the method.
+    """
+    def decorator(get: Callable) -> Callable:
+        @wraps(get)
+        def wrapper(*args, **kwargs):
+            etag = make_etag(table_names)
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+                response.set_etag(etag, weak=True)
+                return response
+
+            result = get(*args, **kwargs)
+            if isinstance(result, Response):
+                if result.status_code == 200:
+                    result.set_etag(etag, weak=True)
+                return result
+            data, code, headers = unpack(result)
+            if code == 200:
+                headers = {**headers, 'ETag': f'W/"{etag}"'}
+            return data, code, headers
+        return wrapper
+    return decorator
@@ -7,8 +7,15 @@ from typing import OrderedDict
 from api_university.config import swag_dir
 from api_university.models.course import CourseModel
 from api_university.schemas.course import CourseSchema
+from api_university.db.sqlalchemy_queries.loading import schema_loaders
 from api_university.responses.response_strings import gettext_
 from api_university.resources.type_hintings import Query_parameter_value
+from api_university.resources.pagination import get_page_args, paginate, page_headers
+from api_university.resources.streaming import stream_json_list
+from api_university.resources.fieldsets import select_fields
+from api_university.schemas.compiler import compile_schema
+from api_university.resources.conditional import conditional_get
+from api_university.resources.caching import cached_get, tag_response
 
 short_course_schema = CourseSchema(only=('course_id', 'name',))
 full_course_schema = CourseSchema()
@@ -16,18 +23,26 @@ full_course_schema = CourseSchema()
 short_course_list_schema = CourseSchema(many=True, only=('course_id', 'name',))
 full_course_list_schema = CourseSchema(many=True)
 
+# tables the course dumps are read from
+course_tables = ('courses', 'students_courses', 'students')
+
 
 class Course(Resource):
     @classmethod
     @swag_from(f"{swag_dir}/Course/get.yml")
+    @conditional_get(*course_tables)
+    @cached_get(*course_tables)
     def get(cls, course_id: int) -> tuple[OrderedDict, int]:
-        course = CourseModel.find_by_id_or_404(course_id)
         full: Query_parameter_value = request.args.get('full', 'false').lower()
         match full:
             case 'true':
-                return full_course_schema.dump(course), 200
+                schema = full_course_schema
             case _:
-                return short_course_schema.dump(course), 200
+                schema = short_course_schema
+        schema = select_fields(schema)
+        course = CourseModel.find_by_id_or_404(course_id, schema_loaders(schema))
+        tag_response(course)
+        return compile_schema(schema)(course), 200
 
     @classmethod
     @swag_from(f"{swag_dir}/Course/post.yml")
@@ -58,11 +73,25 @@ class Course(Resource):
 class CourseList(Resource):
     @classmethod
     @swag_from(f"{swag_dir}/CourseList/get.yml")
-    def get(cls) -> tuple[OrderedDict, int]:
-        course_list = CourseModel.get_all_courses()
+    @conditional_get(*course_tables)
+    @cached_get(*course_tables)
+    def get(cls) -> tuple[OrderedDict, int, dict]:
+        after, limit = get_page_args()
         full: Query_parameter_value = request.args.get('full', 'false').lower()
         match full:
             case 'true':
-                return full_course_list_schema.dump(course_list), 200
+                schema = full_course_list_schema
             case _:
-                return short_course_list_schema.dump(course_list), 200
+                schema = short_course_list_schema
+        schema = select_fields(schema)
+        query = CourseModel.query.options(*schema_loaders(schema))
+        name = request.args.get('name')
+        if name is not None:
+            query = query.filter(CourseModel.name == name)
+
+        stream: Query_parameter_value = request.args.get('stream', 'false').lower()
+        if stream == 'true':
+            return stream_json_list(query, CourseModel.course_id, schema)
+
+        course_list, next_cursor = paginate(query, CourseModel.course_id, after, limit)
+        return compile_schema(schema)(course_list), 200, page_headers(next_cursor)
@@ -0,0 +1,66 @@
+from flask import request
+from flask_restful import Resource
+from flasgger import swag_from
+from marshmallow import EXCLUDE
+
+from api_university.config import swag_dir
+from api_university.models.student import StudentModel
+from api_university.models.course import CourseModel
+from api_university.models.relationships import enroll, unenroll
+from api_university.schemas.enrollment import StudentIdsSchema, CourseIdsSchema
+from api_university.responses.response_strings import gettext_
+
+student_ids_schema = StudentIdsSchema()
+course_ids_schema = CourseIdsSchema()
+
+
+def _changed_ids(ids: list[int], links: list[tuple[int, int]], position: int) -> list[int]:
+    """Returns the ids of the changed links in the given order."""
+    changed = {link[position] for link in links}
+    return [id_ for id_ in dict.fromkeys(ids) if id_ in changed]
+
+
+class CourseStudents(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/CourseStudents/post.yml")
+    def post(cls, course_id: int) -> tuple[dict, int]:
+        CourseModel.find_by_id_or_404(course_id)
+        student_ids = student_ids_schema.load(request.get_json(), unknown=EXCLUDE)['student_ids']
+        StudentModel.check_ids_or_404(student_ids)
+        added_links = enroll(student_ids, [course_id])
+        return {'status': 200,
+                'message': gettext_("course_students_post").format(_changed_ids(student_ids, added_links, 0),
+                                                                   course_id)}, 200
+
+    @classmethod
+    @swag_from(f"{swag_dir}/CourseStudents/delete.yml")
+    def delete(cls, course_id: int) -> tuple[dict, int]:
+        CourseModel.find_by_id_or_404(course_id)
+        student_ids = student_ids_schema.load(request.get_json(), unknown=EXCLUDE)['student_ids']
+        deleted_links = unenroll(student_ids, [course_id])
+        return {'status': 200,
+                'message': gettext_("course_students_delete").format(_changed_ids(student_ids, deleted_links, 0),
+                                                                     course_id)}, 200
+
+
+class StudentCourses(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/StudentCourses/post.yml")
+    def post(cls, student_id: int) -> tuple[dict, int]:
+        StudentModel.find_by_id_or_404(student_id)
+        course_ids = course_ids_schema.load(request.get_json(), unknown=EXCLUDE)['course_ids']
+        CourseModel.check_ids_or_404(course_ids)
+        added_links = enroll([student_id], course_ids)
+        return {'status': 200,
+                'message': gettext_("student_courses_post").format(student_id,
+                                                                   _changed_ids(course_ids, added_links, 1))}, 200
+
+    @classmethod
+    @swag_from(f"{swag_dir}/StudentCourses/delete.yml")
+    def delete(cls, student_id: int) -> tuple[dict, int]:
+        StudentModel.find_by_id_or_404(student_id)
+        course_ids = course_ids_schema.load(request.get_json(), unknown=EXCLUDE)['course_ids']
+        deleted_links = unenroll([student_id], course_ids)
+        return {'status': 200,
+                'message': gettext_("student_courses_delete").format(student_id,
+                                                                     _changed_ids(course_ids, deleted_links, 1))}, 200
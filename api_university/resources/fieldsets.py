@@ -0,0 +1,32 @@
+from functools import lru_cache
+
+from flask import request, abort
+from marshmallow import Schema
+
+from api_university.handlers import make_error
+from api_university.responses.response_strings import gettext_
+
+
+@lru_cache(maxsize=256)
+def _narrow_schema(schema: Schema, field_names: tuple[str]) -> Schema:
+    return type(schema)(only=field_names, many=schema.many)
+
+
+def select_fields(schema: Schema) -> Schema:
+    """
+    Narrows `schema` to the comma separated field names given in '?fields='.
+    The names are validated against the dump fields of `schema`, aborts with 400 otherwise.
+    Returns `schema` itself if '?fields=' is not given.
+    """
+    fields_arg = request.args.get('fields')
+    if fields_arg is None:
+        return schema
+
+    requested_fields = {field_name.strip() for field_name in fields_arg.split(',')} - {''}
+    unknown_fields = sorted(requested_fields - set(schema.dump_fields))
+    if not requested_fields or unknown_fields:
+        message = gettext_("fields_err_unknown").format(unknown_fields, list(schema.dump_fields))
+        abort(make_error(400, message))
+    # keeps the field order of the schema
+    field_names = tuple(field_name for field_name in schema.dump_fields if field_name in requested_fields)
+    return _narrow_schema(schema, field_names)
@@ -8,8 +8,16 @@ from api_university.config import swag_dir
 from api_university.models.group import GroupModel
 from api_university.schemas.group import GroupSchema
 from api_university.db.sqlalchemy_queries.queries import ComplexQuery
+from api_university.db.sqlalchemy_queries.loading import schema_loaders
 from api_university.responses.response_strings import gettext_
 from api_university.resources.type_hintings import Query_parameter_value
+from api_university.resources.query_args import get_int_arg
+from api_university.resources.pagination import get_page_args, paginate, page_headers
+from api_university.resources.streaming import stream_json_list
+from api_university.resources.fieldsets import select_fields
+from api_university.schemas.compiler import compile_schema
+from api_university.resources.conditional import conditional_get
+from api_university.resources.caching import cached_get, tag_response
 
 
 short_group_schema = GroupSchema(only=('group_id', 'name',))
@@ -18,18 +26,26 @@ full_group_schema = GroupSchema()
 short_group_list_schema = GroupSchema(many=True, only=('group_id', 'name',))
 full_group_list_schema = GroupSchema(many=True)
 
+# tables the group dumps are read from
+group_tables = ('groups', 'students')
+
 
 class Group(Resource):
     @classmethod
     @swag_from(f"{swag_dir}/Group/get.yml")
+    @conditional_get(*group_tables)
+    @cached_get(*group_tables)
     def get(cls, group_id: int) -> tuple[OrderedDict, int]:
-        group = GroupModel.find_by_id_or_404(group_id)
         full: Query_parameter_value = request.args.get('full', 'false').lower()
         match full:
             case 'true':
-                return full_group_schema.dump(group), 200
+                schema = full_group_schema
             case _:
-                return short_group_schema.dump(group), 200
+                schema = short_group_schema
+        schema = select_fields(schema)
+        group = GroupModel.find_by_id_or_404(group_id, schema_loaders(schema))
+        tag_response(group)
+        return compile_schema(schema)(group), 200
 
     @classmethod
     @swag_from(f"{swag_dir}/Group/post.yml")
@@ -61,20 +77,34 @@ class Group(Resource):
 class GroupList(Resource):
     @classmethod
     @swag_from(f"{swag_dir}/GroupList/get.yml")
-    def get(cls) -> tuple[OrderedDict, int]:
-        student_count = request.args.get('student_count')
-        if student_count:
-            try:
-                student_count = int(student_count)
-            except Exception as err:
-                print(err)
-            groups = ComplexQuery.get_groups_filter_by_student_count(student_count)
+    @conditional_get(*group_tables)
+    @cached_get(*group_tables)
+    def get(cls) -> tuple[OrderedDict, int, dict]:
+        # 'student_count' is the former name of 'max_student_count'
+        max_count = get_int_arg('max_student_count', 'student_count')
+        min_count = get_int_arg('min_student_count')
+        after, limit = get_page_args()
+        if max_count is not None or min_count is not None:
+            query = ComplexQuery.query_groups_filter_by_student_count(max_count, min_count)
         else:
-            groups = GroupModel.get_all_groups()
+            query = GroupModel.query
+
+        name = request.args.get('name')
+        if name is not None:
+            query = query.filter(GroupModel.name == name)
 
         full: Query_parameter_value = request.args.get('full', 'false').lower()
         match full:
             case 'true':
-                return full_group_list_schema.dump(groups), 200
+                schema = full_group_list_schema
             case _:
-                return short_group_list_schema.dump(groups), 200
+                schema = short_group_list_schema
+        schema = select_fields(schema)
+        query = query.options(*schema_loaders(schema))
+
+        stream: Query_parameter_value = request.args.get('stream', 'false').lower()
+        if stream == 'true':
+            return stream_json_list(query, GroupModel.group_id, schema)
+
+        groups, next_cursor = paginate(query, GroupModel.group_id, after, limit)
+        return compile_schema(schema)(groups), 200, page_headers(next_cursor)
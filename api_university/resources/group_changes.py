@@ -0,0 +1,63 @@
+from flask import request, abort
+from flask_restful import Resource
+from flasgger import swag_from
+from marshmallow import EXCLUDE
+
+from api_university.config import swag_dir
+from api_university.handlers import make_error
+from api_university.models.group import GroupModel
+from api_university.models.course import CourseModel
+from api_university.schemas.group_changes import GroupMoveSchema, GroupMergeSchema, GroupSplitSchema
+from api_university.responses.response_strings import gettext_
+
+group_move_schema = GroupMoveSchema()
+group_merge_schema = GroupMergeSchema()
+group_split_schema = GroupSplitSchema()
+
+
+def _check_target_or_404(group_id: int, target_id: int) -> None:
+    if target_id == group_id:
+        abort(make_error(400, gettext_("group_err_same_target").format(group_id)))
+    GroupModel.find_by_id_or_404(target_id)
+
+
+class GroupMove(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/GroupMove/post.yml")
+    def post(cls, group_id: int) -> tuple[dict, int]:
+        group = GroupModel.find_by_id_or_404(group_id)
+        move = group_move_schema.load(request.get_json(), unknown=EXCLUDE)
+        _check_target_or_404(group_id, move['to_group_id'])
+        if move.get('course_id') is not None:
+            CourseModel.find_by_id_or_404(move['course_id'])
+        moved = group.move_students(move['to_group_id'], move.get('student_ids'), move.get('course_id'))
+        return {'status': 200,
+                'message': gettext_("group_move").format(moved, group_id, move['to_group_id']),
+                'moved': moved}, 200
+
+
+class GroupMerge(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/GroupMerge/post.yml")
+    def post(cls, group_id: int) -> tuple[dict, int]:
+        group = GroupModel.find_by_id_or_404(group_id)
+        merge = group_merge_schema.load(request.get_json(), unknown=EXCLUDE)
+        GroupModel.check_ids_or_404(merge['group_ids'])
+        moved, deleted_ids = group.merge_groups(merge['group_ids'], merge['delete_groups'])
+        return {'status': 200,
+                'message': gettext_("group_merge").format(moved, group_id),
+                'moved': moved,
+                'deleted_groups': deleted_ids}, 200
+
+
+class GroupSplit(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/GroupSplit/post.yml")
+    def post(cls, group_id: int) -> tuple[dict, int]:
+        group = GroupModel.find_by_id_or_404(group_id)
+        split = group_split_schema.load(request.get_json(), unknown=EXCLUDE)
+        _check_target_or_404(group_id, split['to_group_id'])
+        moved = group.split_students(split['to_group_id'], split['rule'])
+        return {'status': 200,
+                'message': gettext_("group_move").format(moved, group_id, split['to_group_id']),
+                'moved': moved}, 200
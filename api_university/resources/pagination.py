@@ -0,0 +1,140 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from urllib.parse import urlencode
+
+from flask import request, abort, current_app
+from flask_sqlalchemy import BaseQuery
+from sqlalchemy import asc, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import ColumnElement
+
+from api_university.handlers import make_error
+from api_university.responses.response_strings import gettext_
+
+
+def encode_cursor(*values) -> str:
+    """Packs the key values of the last row of a page into an opaque url-safe string."""
+    raw = json.dumps(values, separators=(',', ':')).encode()
+    return urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> list:
+    """Unpacks a cursor created by `encode_cursor` or aborts with 400."""
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        values = json.loads(urlsafe_b64decode(cursor + padding))
+    except ValueError:
+        values = None
+    if not isinstance(values, list):
+        abort(make_error(400, gettext_("pagination_err_cursor").format(cursor)))
+    return values
+
+
+def get_limit() -> int | None:
+    """Reads '?limit=' query parameter, None if it is not given."""
+    max_limit = current_app.config['MAX_PAGE_LIMIT']
+    limit = request.args.get('limit')
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= max_limit:
+            abort(make_error(400, gettext_("pagination_err_limit").format(max_limit)))
+    return limit
+
+
+def get_page_args() -> tuple[int | None, int | None]:
+    """
+    Reads '?after=' and '?limit=' query parameters.
+    :return: (primary key after which the page starts, page size),
+             each of them is None if the parameter is not given.
+    """
+    limit = get_limit()
+
+    after = request.args.get('after')
+    if after is not None:
+        match decode_cursor(after):
+            case [int() as key] if not isinstance(key, bool):
+                after = key
+            case _:
+                abort(make_error(400, gettext_("pagination_err_cursor").format(after)))
+    return after, limit
+
+
+def paginate(query: BaseQuery,
+             key_column: InstrumentedAttribute,
+             after: int | None,
+             limit: int | None) -> tuple[list, str | None]:
+    """
+    Keyset pagination: seeks past `after` through the primary key index instead of OFFSET,
+    so every page costs the same however deep the client goes.
+    :return: (rows of the page, cursor of the next page or None if it is the last page)
+    """
+    query = query.order_by(None).order_by(asc(key_column))
+    if after is not None:
+        query = query.filter(key_column > after)
+    if limit is None:
+        return query.all(), None
+
+    # one extra row tells whether there is a next page
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(getattr(rows[-1], key_column.key))
+
+
+def get_ranked_page_args(default_limit: int) -> tuple[tuple[float, int] | None, int]:
+    """
+    Reads '?after=' and '?limit=' query parameters of a ranked list.
+    :return: ((rank, primary key) after which the page starts or None, page size or `default_limit`)
+    """
+    limit = get_limit() or default_limit
+
+    after = request.args.get('after')
+    if after is not None:
+        match decode_cursor(after):
+            case [int() | float() as rank, int() as key] if not isinstance(rank, bool) and not isinstance(key, bool):
+                after = (rank, key)
+            case _:
+                abort(make_error(400, gettext_("pagination_err_cursor").format(after)))
+    return after, limit
+
+
+def paginate_ranked(query: BaseQuery,
+                    rank: ColumnElement,
+                    key_column: InstrumentedAttribute,
+                    after: tuple[float, int] | None,
+                    limit: int) -> tuple[list, str | None]:
+    """
+    Keyset pagination of rows ordered by descending rank, ties by the primary key:
+    seeks past the (rank, key) of the last row of the previous page.
+    The rank has to be a double precision value, so it is the same after the round trip through the cursor.
+    :return: (rows of the page, cursor of the next page or None if it is the last page)
+    """
+    query = query.add_columns(rank).order_by(None).order_by(rank.desc(), asc(key_column))
+    if after is not None:
+        after_rank, after_key = after
+        query = query.filter(or_(rank < after_rank, and_(rank == after_rank, key_column > after_key)))
+
+    # one extra row tells whether there is a next page
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row, last_rank = rows[-1]
+        next_cursor = encode_cursor(last_rank, getattr(last_row, key_column.key))
+    return [row for row, _ in rows], next_cursor
+
+
+def page_headers(next_cursor: str | None) -> dict:
+    """Headers pointing to the next page, empty if there is no next page."""
+    if next_cursor is None:
+        return {}
+    args = [(key, value) for key, value in request.args.items(multi=True) if key != 'after']
+    args.append(('after', next_cursor))
+    return {
+        'X-Next-Cursor': next_cursor,
+        'Link': f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    }
@@ -0,0 +1,19 @@
+from flask import request, abort
+
+from api_university.handlers import make_error
+from api_university.responses.response_strings import gettext_
+
+
+def get_int_arg(*names: str) -> int | None:
+    """
+    Reads the first given of the integer query parameters (a parameter and its former names),
+    None if none of them is given. A value which is not an integer aborts with 400.
+    """
+    for name in names:
+        value = request.args.get(name)
+        if value:
+            try:
+                return int(value)
+            except ValueError:
+                abort(make_error(400, gettext_("query_err_int").format(name)))
+    return None
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import OrderedDict
+
+from flask_restful import Resource
+from flasgger import swag_from
+
+from api_university.config import swag_dir
+from api_university.db.db_sqlalchemy import db
+from api_university.models.stats import (STATS_VIEWS, StatsRefreshModel, refresh_stats,
+                                         stats_student_courses, stats_course_students, stats_course_counts)
+from api_university.responses.response_strings import gettext_
+from api_university.resources.query_args import get_int_arg
+from api_university.resources.pagination import get_page_args, paginate, page_headers
+from api_university.resources.conditional import conditional_get
+from api_university.resources.caching import cached_get
+
+# the statistics change with the refreshes of the views only
+stats_tables = ('stats_refreshes',)
+
+
+def _isoformat(refreshed_at: datetime | None) -> str | None:
+    return None if refreshed_at is None else refreshed_at.isoformat()
+
+
+def _stats_response(query, key_column, view_name: str) -> tuple[list[dict], int, dict]:
+    """Returns a page of the view rows, 'Last-Modified' header is the time of the last refresh of the view."""
+    after, limit = get_page_args()
+    rows, next_cursor = paginate(query, key_column, after, limit)
+    headers = page_headers(next_cursor)
+    refreshed_at = StatsRefreshModel.get_refresh_times()[view_name]
+    if refreshed_at is not None:
+        headers['Last-Modified'] = format_datetime(refreshed_at.astimezone(timezone.utc), usegmt=True)
+    return [dict(row._mapping) for row in rows], 200, headers
+
+
+class Stats(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/Stats/get.yml")
+    @conditional_get(*stats_tables)
+    def get(cls) -> tuple[dict, int]:
+        refresh_times = StatsRefreshModel.get_refresh_times()
+        return {'refreshed_at': {view_name.removeprefix('stats_'): _isoformat(refreshed_at)
+                                 for view_name, refreshed_at in refresh_times.items()}}, 200
+
+
+class StatsStudentCourses(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/StatsStudentCourses/get.yml")
+    @conditional_get(*stats_tables)
+    @cached_get(*stats_tables)
+    def get(cls) -> tuple[list[OrderedDict], int, dict]:
+        query = db.session.query(stats_student_courses)
+        group_id = get_int_arg('group')
+        if group_id is not None:
+            query = query.filter(stats_student_courses.c.group_id == group_id)
+        number_of_courses = get_int_arg('number_of_courses')
+        if number_of_courses is not None:
+            query = query.filter(stats_student_courses.c.number_of_courses == number_of_courses)
+        return _stats_response(query, stats_student_courses.c.student_id, stats_student_courses.name)
+
+
+class StatsCourseStudents(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/StatsCourseStudents/get.yml")
+    @conditional_get(*stats_tables)
+    @cached_get(*stats_tables)
+    def get(cls) -> tuple[list[OrderedDict], int, dict]:
+        query = db.session.query(stats_course_students)
+        return _stats_response(query, stats_course_students.c.course_id, stats_course_students.name)
+
+
+class StatsCourseCounts(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/StatsCourseCounts/get.yml")
+    @conditional_get(*stats_tables)
+    @cached_get(*stats_tables)
+    def get(cls) -> tuple[list[OrderedDict], int, dict]:
+        query = db.session.query(stats_course_counts)
+        number_of_courses = get_int_arg('number_of_courses')
+        if number_of_courses is not None:
+            query = query.filter(stats_course_counts.c.number_of_courses == number_of_courses)
+        return _stats_response(query, stats_course_counts.c.number_of_courses, stats_course_counts.name)
+
+
+class StatsRefresh(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/StatsRefresh/post.yml")
+    def post(cls) -> tuple[dict, int]:
+        refresh_times = refresh_stats()
+        return {'status': 200,
+                'message': gettext_("stats_refresh").format(list(STATS_VIEWS)),
+                'refreshed_at': {view_name.removeprefix('stats_'): _isoformat(refreshed_at)
+                                 for view_name, refreshed_at in refresh_times.items()}}, 200
@@ -0,0 +1,42 @@
+from json import dumps
+
+from flask import Response, current_app, stream_with_context
+from flask_sqlalchemy import BaseQuery
+from marshmallow import Schema
+from sqlalchemy.orm import InstrumentedAttribute
+
+from api_university.schemas.compiler import compile_schema, Dumper
+
+
+def _dump_chunk(dump: Dumper, rows: list, settings: dict) -> str:
+    """Serializes rows as the inner part of a JSON array, without brackets."""
+    return dumps(dump(rows), **settings)[1:-1].strip()
+
+
+def stream_json_list(query: BaseQuery, key_column: InstrumentedAttribute, schema: Schema) -> Response:
+    """
+    Writes the query result as a JSON array chunk by chunk.
+    Rows are read through a server-side cursor `STREAM_CHUNK_SIZE` rows at a time
+    and are released after their chunk has been sent,
+    so memory usage does not grow with the size of the result.
+    """
+    chunk_size = current_app.config['STREAM_CHUNK_SIZE']
+    settings = current_app.config.get('RESTFUL_JSON', {})
+    query = query.order_by(None).order_by(key_column).yield_per(chunk_size)
+    dump = compile_schema(schema, many=True)
+
+    def generate():
+        yield '['
+        separator = ''
+        rows = []
+        for row in query:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield separator + _dump_chunk(dump, rows, settings)
+                separator = ','
+                rows.clear()
+        if rows:
+            yield separator + _dump_chunk(dump, rows, settings)
+        yield ']\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
@@ -1,36 +1,60 @@
-from flask import request
+from flask import request, abort, current_app
 from flask_restful import Resource
 from flasgger import swag_from
-from marshmallow import INCLUDE
+from marshmallow import EXCLUDE, INCLUDE
 from typing import OrderedDict
 
 from api_university.config import swag_dir
+from api_university.handlers import make_error
 from api_university.models.student import StudentModel
 from api_university.models.course import CourseModel
 from api_university.models.group import GroupModel
-from api_university.schemas.student import ShortStudentSchema, FullStudentSchema
+from api_university.schemas.student import (ShortStudentSchema, FullStudentSchema, NewStudentSchema,
+                                            UpdateStudentSchema, DeleteStudentListSchema)
 from api_university.db.sqlalchemy_queries.queries import ComplexQuery
+from api_university.db.sqlalchemy_queries.loading import schema_loaders
 from api_university.responses.response_strings import gettext_
 from api_university.resources.type_hintings import Query_parameter_value
+from api_university.resources.pagination import (get_page_args, paginate, page_headers,
+                                                 get_ranked_page_args, paginate_ranked)
+from api_university.resources.streaming import stream_json_list
+from api_university.resources.fieldsets import select_fields
+from api_university.schemas.compiler import compile_schema
+from api_university.resources.conditional import conditional_get
+from api_university.resources.caching import cached_get, tag_response
 
 short_student_schema = ShortStudentSchema()
 full_student_schema = FullStudentSchema()
 
 short_student_list_schema = ShortStudentSchema(many=True)
 full_student_list_schema = FullStudentSchema(many=True)
+new_student_list_schema = NewStudentSchema(many=True)
+update_student_list_schema = UpdateStudentSchema(many=True)
+delete_student_list_schema = DeleteStudentListSchema()
+
+# tables the student dumps are read from
+student_tables = ('students', 'groups', 'courses', 'students_courses')
+
+# shorter queries have no trigrams to look up in the indexes
+search_min_length = 3
 
 
 class Student(Resource):
     @classmethod
     @swag_from(f"{swag_dir}/Student/get.yml")
+    @conditional_get(*student_tables)
+    @cached_get(*student_tables)
     def get(cls, student_id) -> tuple[OrderedDict, int]:
-        student = StudentModel.find_by_id_or_404(student_id)
         full: Query_parameter_value = request.args.get('full', 'false').lower()
         match full:
             case 'true':
-                return full_student_schema.dump(student), 200
+                schema = full_student_schema
             case _:
-                return short_student_schema.dump(student), 200
+                schema = short_student_schema
+        schema = select_fields(schema)
+        student = StudentModel.find_by_id_or_404(student_id, schema_loaders(schema))
+        tag_response(student)
+        return compile_schema(schema)(student), 200
 
     @classmethod
     @swag_from(f"{swag_dir}/Student/post.yml")
@@ -62,43 +86,48 @@ class Student(Resource):
 class StudentList(Resource):
     @classmethod
     @swag_from(f"{swag_dir}/StudentList/get.yml")
-    def get(cls) -> tuple[OrderedDict, int]:
+    @conditional_get(*student_tables)
+    @cached_get(*student_tables)
+    def get(cls) -> tuple[OrderedDict, int, dict]:
         full: Query_parameter_value = request.args.get('full', 'false').lower()
         group_id: Query_parameter_value = request.args.get('group')
         course_id: Query_parameter_value = request.args.get('course')
+        after, limit = get_page_args()
 
         if group_id and course_id:
-            student_list = ComplexQuery.get_students_filter_by_group_and_course(int(group_id), int(course_id))
+            query = ComplexQuery.query_students(int(group_id), int(course_id))
         elif group_id:
             group_obj = GroupModel.find_by_id_or_404(int(group_id))
-            student_list = group_obj.students
+            query = ComplexQuery.query_students(group_id=group_obj.group_id)
         elif course_id:
             course_obj = CourseModel.find_by_id_or_404(int(course_id))
-            student_list = course_obj.students
+            query = ComplexQuery.query_students(course_id=course_obj.course_id)
         else:
-            student_list = StudentModel.get_all_students()
-
+            query = ComplexQuery.query_students()
         match full:
             case 'true':
-                return full_student_list_schema.dump(student_list), 200
+                schema = full_student_list_schema
             case _:
-                return short_student_list_schema.dump(student_list), 200
+                schema = short_student_list_schema
+        schema = select_fields(schema)
+        query = query.options(*schema_loaders(schema))
+
+        stream: Query_parameter_value = request.args.get('stream', 'false').lower()
+        if stream == 'true':
+            return stream_json_list(query, StudentModel.student_id, schema)
+
+        student_list, next_cursor = paginate(query, StudentModel.student_id, after, limit)
+        return compile_schema(schema)(student_list), 200, page_headers(next_cursor)
 
     @classmethod
     @swag_from(f"{swag_dir}/StudentList/post.yml")
     def post(cls) -> tuple[dict, int]:
-        max_student_id = StudentModel.get_max_student_id()
         student_list_json = request.get_json()
-
-        for student_json in student_list_json:
-            max_student_id += 1
-            student_json['student_id'] = max_student_id
-
-        new_students = full_student_list_schema.load(student_list_json, unknown=INCLUDE)
-        added_students_counter = []
-        for student in new_students:
-            student.save_to_db()
-            added_students_counter.append(student.student_id)
+        new_students = new_student_list_schema.load(student_list_json, unknown=EXCLUDE)
+        course_ids = dict.fromkeys(course_id for student in new_students
+                                   for course_id in student.get('courses') or ())
+        CourseModel.check_ids_or_404(list(course_ids))
+        added_students_counter = StudentModel.bulk_insert(new_students)
 
         return {'status': 200,
                 'message': gettext_("student_list_post").format(added_students_counter)}, 200
@@ -107,11 +136,11 @@ class StudentList(Resource):
     @swag_from(f"{swag_dir}/StudentList/put.yml")
     def put(cls) -> tuple[dict, int]:
         student_list_json = request.get_json()
-        updated_students = full_student_list_schema.load(student_list_json, partial=True, unknown=INCLUDE)
-        updated_students_counter = []
-        for student in updated_students:
-            student.save_to_db()
-            updated_students_counter.append(student.student_id)
+        updated_students = update_student_list_schema.load(student_list_json, unknown=EXCLUDE)
+        course_ids = dict.fromkeys(course_id for student in updated_students
+                                   for course_id in [*student.get('add_courses', ()), *student.get('delete_courses', ())])
+        CourseModel.check_ids_or_404(list(course_ids))
+        updated_students_counter = StudentModel.bulk_update(updated_students)
 
         return {'status': 200,
                 'message': gettext_("student_list_put").format(updated_students_counter)}, 200
@@ -120,17 +149,12 @@ class StudentList(Resource):
     @swag_from(f"{swag_dir}/StudentList/delete.yml")
     def delete(cls) -> tuple[dict, int]:
         student_list_json = request.get_json()
-        student_id_list = student_list_json.get('student_id_list')
+        student_id_list = delete_student_list_schema.load(student_list_json, unknown=EXCLUDE).get('student_id_list')
         if not student_id_list:
             response = {'status': 400,
                         'message': gettext_("student_list_delete_err_missing")}, 400
         else:
-            deleted_students_counter = []
-            for student_id in student_list_json.get('student_id_list'):
-                student = StudentModel.find_by_id(student_id)
-                if student:
-                    student.delete_from_db()
-                    deleted_students_counter.append(student.student_id)
+            deleted_students_counter = StudentModel.bulk_delete(student_id_list)
             if deleted_students_counter:
                 response = {'status': 200,
                             'message': gettext_("student_list_delete").format(deleted_students_counter)}, 200
@@ -138,3 +162,22 @@ class StudentList(Resource):
                 response = {'status': 400,
                             'message': gettext_("student_list_delete_err_no_one").format(deleted_students_counter)}, 400
         return response
+
+
+class StudentSearch(Resource):
+    @classmethod
+    @swag_from(f"{swag_dir}/StudentSearch/get.yml")
+    @conditional_get(*student_tables)
+    @cached_get(*student_tables)
+    def get(cls) -> tuple[OrderedDict, int, dict]:
+        search_query = request.args.get('q', '').strip()
+        if len(search_query) < search_min_length:
+            abort(make_error(400, gettext_("search_err_query").format(search_min_length)))
+        after, limit = get_ranked_page_args(current_app.config['SEARCH_PAGE_LIMIT'])
+
+        query, rank = ComplexQuery.query_students_by_name(list(dict.fromkeys(search_query.split())))
+        schema = select_fields(short_student_list_schema)
+        query = query.options(*schema_loaders(schema))
+
+        student_list, next_cursor = paginate_ranked(query, rank, StudentModel.student_id, after, limit)
+        return compile_schema(schema)(student_list), 200, page_headers(next_cursor)
@@ -1,4 +1,4 @@
-from marshmallow import validate, pre_load
+from marshmallow import pre_load
 from flask import request, abort
 
 from api_university.db.db_sqlalchemy import db
@@ -7,11 +7,12 @@ from api_university.handlers import make_error
 from api_university.responses.response_strings import gettext_
 from api_university.models.course import CourseModel
 from api_university.models.student import StudentModel
+from .validators import COURSE_NAME_LENGTH, COURSE_DESCRIPTION_LENGTH
 
 
 class CourseSchema(ma.SQLAlchemyAutoSchema):
-    name = ma.auto_field(validate=[validate.Length(min=1, max=100)])
-    description = ma.auto_field(validate=[validate.Length(min=1, max=300)])
+    name = ma.auto_field(validate=[COURSE_NAME_LENGTH])
+    description = ma.auto_field(validate=[COURSE_DESCRIPTION_LENGTH])
 
     class Meta:
         model = CourseModel
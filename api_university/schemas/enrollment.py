@@ -0,0 +1,11 @@
+from marshmallow import validate
+
+from api_university.ma import ma
+
+
+class StudentIdsSchema(ma.Schema):
+    student_ids = ma.List(ma.Integer(), required=True, validate=[validate.Length(min=1)])
+
+
+class CourseIdsSchema(ma.Schema):
+    course_ids = ma.List(ma.Integer(), required=True, validate=[validate.Length(min=1)])
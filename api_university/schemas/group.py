@@ -1,4 +1,4 @@
-from marshmallow import validate, pre_load
+from marshmallow import pre_load
 from flask import request, abort
 
 from api_university.db.db_sqlalchemy import db
@@ -7,10 +7,11 @@ from api_university.handlers import make_error
 from api_university.responses.response_strings import gettext_
 from api_university.models.group import GroupModel
 from api_university.models.student import StudentModel
+from .validators import GROUP_NAME_LENGTH
 
 
 class GroupSchema(ma.SQLAlchemyAutoSchema):
-    name = ma.auto_field(validate=[validate.Length(min=1, max=100)])
+    name = ma.auto_field(validate=[GROUP_NAME_LENGTH])
 
     class Meta:
         model = GroupModel
@@ -36,14 +37,12 @@ class GroupSchema(ma.SQLAlchemyAutoSchema):
                         status = 400
                         abort(make_error(status, message))
 
+                    # the members are changed set-wise, `group.students` is never loaded
                     if data.get('add_students'):
-                        new_students = StudentModel.get_students_by_ids_or_404(data['add_students'])
-                        group.students.extend(new_students)
+                        StudentModel.check_ids_or_404(data['add_students'])
+                        group.add_students(data['add_students'])
 
                     if data.get('delete_students'):
-                        deletion_students = StudentModel.get_students_by_ids_or_404(data['delete_students'])
-                        group_student_dict = dict.fromkeys(group.students, True)
-                        for student in deletion_students:
-                            group_student_dict.pop(student, None)
-                        group.students = list(group_student_dict)
+                        StudentModel.check_ids_or_404(data['delete_students'])
+                        group.remove_students(data['delete_students'])
         return data
@@ -0,0 +1,21 @@
+from marshmallow import validate
+
+from api_university.ma import ma
+
+SPLIT_RULES = ('half', 'alternate')
+
+
+class GroupMoveSchema(ma.Schema):
+    to_group_id = ma.Integer(required=True)
+    student_ids = ma.List(ma.Integer(), validate=[validate.Length(min=1)])
+    course_id = ma.Integer()
+
+
+class GroupMergeSchema(ma.Schema):
+    group_ids = ma.List(ma.Integer(), required=True, validate=[validate.Length(min=1)])
+    delete_groups = ma.Boolean(load_default=False)
+
+
+class GroupSplitSchema(ma.Schema):
+    to_group_id = ma.Integer(required=True)
+    rule = ma.String(required=True, validate=[validate.OneOf(SPLIT_RULES)])
@@ -0,0 +1,29 @@
+from marshmallow import validate
+
+from api_university.ma import ma
+from .validators import STUDENT_NAME_LENGTH, GROUP_NAME_LENGTH, COURSE_NAME_LENGTH, COURSE_DESCRIPTION_LENGTH
+
+
+# rows of the bulk import, ids are optional (new ids are taken from the sequences) for everything but links
+
+class StudentRowSchema(ma.Schema):
+    student_id = ma.Integer(validate=[validate.Range(min=1)])
+    first_name = ma.String(required=True, validate=[STUDENT_NAME_LENGTH])
+    last_name = ma.String(required=True, validate=[STUDENT_NAME_LENGTH])
+    group_id = ma.Integer(allow_none=True)
+
+
+class GroupRowSchema(ma.Schema):
+    group_id = ma.Integer(validate=[validate.Range(min=1)])
+    name = ma.String(required=True, validate=[GROUP_NAME_LENGTH])
+
+
+class CourseRowSchema(ma.Schema):
+    course_id = ma.Integer(validate=[validate.Range(min=1)])
+    name = ma.String(required=True, validate=[COURSE_NAME_LENGTH])
+    description = ma.String(allow_none=True, validate=[COURSE_DESCRIPTION_LENGTH])
+
+
+class EnrollmentRowSchema(ma.Schema):
+    student_id = ma.Integer(required=True)
+    course_id = ma.Integer(required=True)
@@ -1,4 +1,4 @@
-from marshmallow import validate, pre_load
+from marshmallow import pre_load
 from flask import request, abort
 
 from api_university.db.db_sqlalchemy import db
@@ -9,16 +9,20 @@ from api_university.models.student import StudentModel
 from api_university.models.course import CourseModel
 from .group import GroupSchema
 from .course import CourseSchema
+from .validators import STUDENT_NAME_LENGTH
 
 
 class ShortStudentSchema(ma.SQLAlchemySchema):
+    # computed fields and the relationship columns they read
+    relationship_fields = {'group_name': 'group.name', 'course_names': 'courses.name'}
+
     class Meta:
         model = StudentModel
         ordered = True
 
     student_id = ma.auto_field()
-    first_name = ma.auto_field(validate=[validate.Length(min=1, max=50)])
-    last_name = ma.auto_field(validate=[validate.Length(min=1, max=50)])
+    first_name = ma.auto_field(validate=[STUDENT_NAME_LENGTH])
+    last_name = ma.auto_field(validate=[STUDENT_NAME_LENGTH])
     group_name = ma.Function(lambda obj: None if obj.group is None else obj.group.name)
     course_names = ma.Function(lambda obj: ", ".join(list(map(lambda course: course.name, obj.courses)))
                                if obj.courses else None)
@@ -26,8 +30,8 @@ class ShortStudentSchema(ma.SQLAlchemySchema):
 
 class FullStudentSchema(ma.SQLAlchemyAutoSchema):
     student_id = ma.auto_field()
-    first_name = ma.auto_field(validate=[validate.Length(min=1, max=50)])
-    last_name = ma.auto_field(validate=[validate.Length(min=1, max=50)])
+    first_name = ma.auto_field(validate=[STUDENT_NAME_LENGTH])
+    last_name = ma.auto_field(validate=[STUDENT_NAME_LENGTH])
     group_id = ma.auto_field()
     group = ma.Nested(GroupSchema(only=('group_id', 'name',)))
     courses = ma.Nested(CourseSchema(only=('course_id', 'name')), many=True)
@@ -70,3 +74,40 @@ class FullStudentSchema(ma.SQLAlchemyAutoSchema):
                             student_courses_dict.pop(course, None)
                         student.courses = list(student_courses_dict)
         return data
+
+
+class NewStudentSchema(ma.Schema):
+    """Validates the students of bulk inserts, which write plain rows instead of model instances."""
+    first_name = ma.String(required=True, validate=[STUDENT_NAME_LENGTH])
+    last_name = ma.String(required=True, validate=[STUDENT_NAME_LENGTH])
+    group_id = ma.Integer(allow_none=True)
+    courses = ma.List(ma.Integer())
+
+    class Meta:
+        ordered = True
+
+
+class UpdateStudentSchema(ma.Schema):
+    """Validates the students of bulk updates, which write plain rows instead of model instances."""
+    student_id = ma.Integer(required=True)
+    first_name = ma.String(validate=[STUDENT_NAME_LENGTH])
+    last_name = ma.String(validate=[STUDENT_NAME_LENGTH])
+    group_id = ma.Integer(allow_none=True)
+    add_courses = ma.List(ma.Integer())
+    delete_courses = ma.List(ma.Integer())
+
+    class Meta:
+        ordered = True
+
+    @pre_load
+    def process_data(self, data: dict, **kwargs):
+        if isinstance(data, dict) and data.get('courses'):
+            message = gettext_("student_err_put_courses")
+            status = 400
+            abort(make_error(status, message))
+        return data
+
+
+class DeleteStudentListSchema(ma.Schema):
+    """Validates the body of bulk deletes, ids are sent as one array parameter of the column type."""
+    student_id_list = ma.List(ma.Integer(), allow_none=True)
@@ -0,0 +1,7 @@
+from marshmallow import validate
+
+# rules of the fields shared by every schema which loads them (models, bulk writes, bulk import rows)
+STUDENT_NAME_LENGTH = validate.Length(min=1, max=50)
+GROUP_NAME_LENGTH = validate.Length(min=1, max=100)
+COURSE_NAME_LENGTH = validate.Length(min=1, max=100)
+COURSE_DESCRIPTION_LENGTH = validate.Length(min=1, max=300)
@@ -0,0 +1,37 @@
+import argparse
+import sys
+
+from api_university.app import create_app
+from api_university.db.db_sqlalchemy import db
+from api_university.data.bulk_export import EXPORT_QUERIES, FORMATS, export_chunks
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(
+        prog="Bulk export",
+        description="Exports students (with group names and course ids), groups, courses or enrollments "
+                    "as NDJSON or CSV.",
+        epilog="Try 'students -f csv -o students.csv'"
+    )
+    parser.add_argument('kind', choices=list(EXPORT_QUERIES), help='what to export')
+    parser.add_argument('-f', '--format', choices=FORMATS, default='ndjson', help='file format')
+    parser.add_argument('-o', '--output', default='-', help="file path, '-' for stdout")
+    parser.add_argument('--dev', action='store_true', help='use the development configuration')
+    return parser.parse_args()
+
+
+def main():
+    args = create_arguments()
+    app = create_app(dev_config=args.dev)
+    with app.app_context():
+        file = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+        try:
+            for chunk in export_chunks(db.engine, args.kind, args.format):
+                file.write(chunk)
+        finally:
+            if file is not sys.stdout.buffer:
+                file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import os
+import sys
+from contextlib import nullcontext
+
+from flask import json
+
+from api_university.app import create_app
+from api_university.data.bulk_import import FORMATS, TARGETS, BulkImport, read_rows
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(
+        prog="Bulk import",
+        description="Imports students, groups, courses or enrollments from NDJSON or CSV file. "
+                    "Events of the import are printed as NDJSON.",
+        epilog="Try 'students students.csv'"
+    )
+    parser.add_argument('kind', choices=list(TARGETS), help='what the file contains')
+    parser.add_argument('path', help="file path, '-' for stdin")
+    parser.add_argument('-f', '--format', choices=FORMATS, default=None,
+                        help='file format, by default it is taken from the file extension')
+    parser.add_argument('--dev', action='store_true', help='use the development configuration')
+    parser.add_argument('-q', '--quiet', action='store_true', help='print errors and the result only')
+    return parser.parse_args()
+
+
+def main():
+    args = create_arguments()
+    file_format = args.format or ('csv' if os.path.splitext(args.path)[1].lower() == '.csv' else 'ndjson')
+
+    app = create_app(dev_config=args.dev)
+    with app.app_context():
+        # lines are read as bytes and decoded by read_rows, which reports the lines which are not UTF-8;
+        # stdin is not closed, it is not opened by the script
+        source = nullcontext(sys.stdin.buffer) if args.path == '-' else open(args.path, 'rb')
+        with source as file:
+            for event in BulkImport(args.kind).run(read_rows(file, file_format)):
+                if args.quiet and event['event'] == 'progress':
+                    continue
+                print(json.dumps(event), flush=True)
+
+
+if __name__ == '__main__':
+    main()
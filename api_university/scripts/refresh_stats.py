@@ -0,0 +1,40 @@
+import argparse
+import time
+
+from api_university.app import create_app
+from api_university.models.stats import STATS_VIEWS, refresh_stats
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(
+        prog="Refresh statistics",
+        description="Refreshes the materialized views of the statistics concurrently, "
+                    "once or on a schedule (for cron, systemd or a container of its own).",
+        epilog="Try '--every 300'"
+    )
+    parser.add_argument('views', nargs='*', metavar='VIEW',
+                        help=f"views to refresh ({', '.join(STATS_VIEWS)}), all of them by default")
+    parser.add_argument('--every', type=float, default=None, metavar='SECONDS',
+                        help='refresh repeatedly with this interval instead of once')
+    parser.add_argument('--dev', action='store_true', help='use the development configuration')
+    args = parser.parse_args()
+    unknown_views = [view_name for view_name in args.views if view_name not in STATS_VIEWS]
+    if unknown_views:
+        parser.error(f"unknown views {unknown_views}")
+    return args
+
+
+def main():
+    args = create_arguments()
+    app = create_app(dev_config=args.dev)
+    with app.app_context():
+        while True:
+            for view_name, refreshed_at in refresh_stats(args.views).items():
+                print(f"{view_name} refreshed at {refreshed_at.isoformat()}", flush=True)
+            if args.every is None:
+                return
+            time.sleep(args.every)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+import argparse
+
+from api_university.app import create_app
+from api_university.models.student_count import repair_student_counts
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(
+        prog="Repair student counts",
+        description="Recounts the students of every group and fixes the wrong groups.student_count values. "
+                    "Groups are processed in batches, a transaction per batch.",
+        epilog="Try '--batch-size 5000'"
+    )
+    parser.add_argument('--batch-size', type=int, default=1000, help='groups recounted in one transaction')
+    parser.add_argument('--dev', action='store_true', help='use the development configuration')
+    return parser.parse_args()
+
+
+def main():
+    args = create_arguments()
+    app = create_app(dev_config=args.dev)
+    with app.app_context():
+        checked, repaired = 0, []
+        for batch_checked, batch_repaired in repair_student_counts(args.batch_size):
+            checked += batch_checked
+            repaired.extend(batch_repaired)
+            if batch_repaired:
+                print(f"repaired groups: {batch_repaired}", flush=True)
+        print(f"{checked} groups checked, {len(repaired)} repaired")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of the student bulk insert: a commit per student against StudentModel.bulk_insert.
+Writes into the test database (TestingConfiguration), which has to exist, and removes the students it has added.
+
+Usage (from the root of the project):
+    python -m benchmarks.bulk_insert [--sizes 1000 10000 100000] [--per-row-limit 10000]
+"""
+import argparse
+from random import choice, randint, sample
+from time import perf_counter
+
+from api_university.app import create_app
+from api_university.data.input_data import first_names_list, last_names_list
+from api_university.db.db_sqlalchemy import db
+from api_university.models.course import CourseModel
+from api_university.models.group import GroupModel
+from api_university.models.student import StudentModel
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(description="Compares per row and bulk inserts of students.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='numbers of students to insert')
+    parser.add_argument('--per-row-limit', type=int, default=10000,
+                        help='larger sizes are inserted in bulk only, row by row takes minutes')
+    return parser.parse_args()
+
+
+def generate_rows(number_of_students: int, group_ids: list, course_ids: list) -> list[dict]:
+    return [{'first_name': choice(first_names_list).title(),
+             'last_name': choice(last_names_list).title(),
+             'group_id': choice(group_ids + [None]),
+             'courses': sample(course_ids, randint(1, 3))}
+            for _ in range(number_of_students)]
+
+
+def insert_per_row(rows: list[dict]) -> list[int]:
+    """The former StudentList.post: an ORM instance, a flush and a commit per student."""
+    courses = {course.course_id: course for course in CourseModel.query}
+    student_id = StudentModel.get_max_student_id()
+    student_ids = []
+    for row in rows:
+        student_id += 1
+        student = StudentModel(student_id=student_id,
+                               first_name=row['first_name'],
+                               last_name=row['last_name'],
+                               group_id=row['group_id'],
+                               courses=[courses[course_id] for course_id in row['courses']])
+        student.save_to_db()
+        student_ids.append(student_id)
+    return student_ids
+
+
+def measure(insert, rows: list[dict]) -> float:
+    """Returns the rows/sec rate of the insert, the inserted students are deleted afterwards."""
+    start = perf_counter()
+    student_ids = insert(rows)
+    elapsed = perf_counter() - start
+    db.session.expunge_all()
+    for student in StudentModel.query.filter(StudentModel.student_id.in_(student_ids)):
+        student.courses = []
+        db.session.delete(student)
+    db.session.commit()
+    return len(rows) / elapsed
+
+
+def main():
+    args = create_arguments()
+    app = create_app(test_config=True)
+    with app.app_context():
+        group_ids = [group_id for group_id, in db.session.query(GroupModel.group_id)]
+        course_ids = [course_id for course_id, in db.session.query(CourseModel.course_id)]
+        print(f"{'students':>10}{'per row, rows/s':>20}{'bulk, rows/s':>20}{'speedup':>10}")
+        for size in args.sizes:
+            rows = generate_rows(size, group_ids, course_ids)
+            bulk_rate = measure(StudentModel.bulk_insert, rows)
+            if size > args.per_row_limit:
+                print(f"{size:>10,}{'-':>20}{bulk_rate:>20,.0f}{'-':>10}")
+                continue
+            per_row_rate = measure(insert_per_row, rows)
+            print(f"{size:>10,}{per_row_rate:>20,.0f}{bulk_rate:>20,.0f}{bulk_rate / per_row_rate:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
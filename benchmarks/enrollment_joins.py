@@ -0,0 +1,91 @@
+"""
+Benchmark of the joins through students_courses: a link table without keys (as the first migration made it)
+against the one with the (student_id, course_id) primary key and the (course_id, student_id) index.
+Both are filled with the same enrollments in temporary tables of the test database (TestingConfiguration),
+which has to exist, the real tables are not touched.
+
+Usage (from the root of the project):
+    python -m benchmarks.enrollment_joins [--enrollments 1000000] [--courses 100] [--queries 200]
+"""
+import argparse
+from random import randint
+from time import perf_counter
+
+from sqlalchemy import text
+
+from api_university.app import create_app
+from api_university.db.db_sqlalchemy import db
+
+# the table is named {links} in the queries
+QUERIES = {
+    'student.courses': "SELECT bench_courses.* FROM bench_courses JOIN {links} AS links "
+                       "ON links.course_id = bench_courses.course_id WHERE links.student_id = :student_id",
+    'course.students': "SELECT bench_students.* FROM bench_students JOIN {links} AS links "
+                       "ON links.student_id = bench_students.student_id WHERE links.course_id = :course_id",
+    'is enrolled': "SELECT EXISTS (SELECT 1 FROM {links} "
+                   "WHERE student_id = :student_id AND course_id = :course_id)",
+}
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(description="Compares joins through link tables without and with keys.")
+    parser.add_argument('--enrollments', type=int, default=1_000_000, help='number of links')
+    parser.add_argument('--courses', type=int, default=100, help='number of courses')
+    parser.add_argument('--queries', type=int, default=200, help='queries per case, the mean latency is taken')
+    return parser.parse_args()
+
+
+def create_tables(enrollments: int, courses: int) -> int:
+    """Creates the temporary tables, every student is enrolled in 4 courses. Returns the number of students."""
+    students = max(enrollments // 4, 1)
+    statements = [
+        "CREATE TEMPORARY TABLE bench_students AS "
+        "SELECT student_id, 'First' || student_id AS first_name, 'Last' || student_id AS last_name "
+        "FROM generate_series(1, :students) AS student_id",
+        "ALTER TABLE bench_students ADD PRIMARY KEY (student_id)",
+        "CREATE TEMPORARY TABLE bench_courses AS "
+        "SELECT course_id, 'Course' || course_id AS name FROM generate_series(1, :courses) AS course_id",
+        "ALTER TABLE bench_courses ADD PRIMARY KEY (course_id)",
+        "CREATE TEMPORARY TABLE bench_links_bare AS "
+        "SELECT student_id, 1 + (student_id * 7 + offsets.shift * 13) % :courses AS course_id "
+        "FROM generate_series(1, :students) AS student_id, generate_series(0, 3) AS offsets(shift) "
+        "ORDER BY random() LIMIT :enrollments",
+        "CREATE TEMPORARY TABLE bench_links_keyed AS SELECT DISTINCT * FROM bench_links_bare",
+        "ALTER TABLE bench_links_keyed ADD PRIMARY KEY (student_id, course_id)",
+        "CREATE INDEX ON bench_links_keyed (course_id, student_id)",
+        "ANALYZE bench_students, bench_courses, bench_links_bare, bench_links_keyed",
+    ]
+    for statement in statements:
+        db.session.execute(text(statement), {'students': students, 'courses': courses, 'enrollments': enrollments})
+    return students
+
+
+def measure(query: str, parameters: list[dict]) -> float:
+    """Returns the mean latency of the query in milliseconds."""
+    statement = text(query)
+    start = perf_counter()
+    for params in parameters:
+        db.session.execute(statement, params).fetchall()
+    return (perf_counter() - start) / len(parameters) * 1000
+
+
+def main():
+    args = create_arguments()
+    app = create_app(test_config=True)
+    with app.app_context():
+        try:
+            students = create_tables(args.enrollments, args.courses)
+            parameters = [{'student_id': randint(1, students), 'course_id': randint(1, args.courses)}
+                          for _ in range(args.queries)]
+            print(f"{args.enrollments:,} enrollments, {students:,} students, {args.courses} courses")
+            print(f"{'query':<18}{'no keys, ms':>14}{'keys, ms':>14}{'speedup':>10}")
+            for name, query in QUERIES.items():
+                bare = measure(query.format(links='bench_links_bare'), parameters)
+                keyed = measure(query.format(links='bench_links_keyed'), parameters)
+                print(f"{name:<18}{bare:>14.3f}{keyed:>14.3f}{bare / keyed:>9.1f}x")
+        finally:
+            db.session.rollback()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark of the JSON providers: stdlib encoder/decoder against the orjson ones on API payloads.
+
+Usage (from the root of the project):
+    python -m benchmarks.json_provider [--objects 20000] [--repeat 5]
+"""
+import argparse
+import json
+from time import perf_counter
+
+from api_university.data.data_preparation import generate_group_instances, generate_course_instances
+from api_university.data.input_data import courses_dict
+from api_university.json_provider import OrjsonDecoder, OrjsonEncoder
+from api_university.schemas.compiler import compile_schema
+from api_university.schemas.student import ShortStudentSchema, FullStudentSchema
+from benchmarks.serializers import generate_students
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(description="Compares stdlib and orjson encoding and decoding.")
+    parser.add_argument('--objects', type=int, default=20000, help='number of students in a payload')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs is taken')
+    return parser.parse_args()
+
+
+def measure(function, payload, repeat: int, runs: int) -> float:
+    """Returns the best MB/sec rate of `repeat` runs, each calls the function `runs` times."""
+    size = len(payload if isinstance(payload, str) else json.dumps(payload)) * runs
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(runs):
+            function(payload)
+        best = min(best, perf_counter() - start)
+    return size / best / 1_000_000
+
+
+def main():
+    args = create_arguments()
+    groups = generate_group_instances(number_of_groups=10)
+    courses = generate_course_instances(courses=courses_dict)
+    students = generate_students(args.objects, groups, courses)
+
+    short_students = compile_schema(ShortStudentSchema(many=True))(students)
+    full_students = compile_schema(FullStudentSchema(many=True))(students)
+    # body of StudentList.post
+    new_students = [{'first_name': student['first_name'],
+                     'last_name': student['last_name'],
+                     'group_id': student['group_id'],
+                     'courses': [course['course_id'] for course in student['courses']]}
+                    for student in full_students]
+    error = {'status': 404, 'message': 'Not found'}
+
+    stdlib_encoder, orjson_encoder = json.JSONEncoder(), OrjsonEncoder()
+    stdlib_decoder, orjson_decoder = json.JSONDecoder(), OrjsonDecoder()
+    cases = [
+        ('encode', 'short students', stdlib_encoder.encode, orjson_encoder.encode, short_students),
+        ('encode', 'full students', stdlib_encoder.encode, orjson_encoder.encode, full_students),
+        ('encode', 'error', stdlib_encoder.encode, orjson_encoder.encode, error),
+        ('decode', 'new students', stdlib_decoder.decode, orjson_decoder.decode, json.dumps(new_students)),
+        ('decode', 'full students', stdlib_decoder.decode, orjson_decoder.decode, json.dumps(full_students)),
+    ]
+    print(f"{'payload':<24}{'stdlib, MB/s':>16}{'orjson, MB/s':>16}{'speedup':>10}")
+    for operation, name, stdlib_function, orjson_function, payload in cases:
+        # small payloads are repeated to get measurable times
+        runs = args.objects if isinstance(payload, dict) else 1
+        stdlib_rate = measure(stdlib_function, payload, args.repeat, runs)
+        orjson_rate = measure(orjson_function, payload, args.repeat, runs)
+        print(f"{operation + ' ' + name:<24}{stdlib_rate:>16,.1f}{orjson_rate:>16,.1f}"
+              f"{orjson_rate / stdlib_rate:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
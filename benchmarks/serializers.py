@@ -0,0 +1,68 @@
+"""
+Benchmark of the read path serializers: marshmallow `schema.dump` against compiled dumpers.
+
+Usage (from the root of the project):
+    python -m benchmarks.serializers [--objects 20000] [--repeat 5]
+"""
+import argparse
+from random import choice, randint, sample
+from time import perf_counter
+
+from api_university.data.data_preparation import generate_group_instances, generate_course_instances
+from api_university.data.input_data import courses_dict, first_names_list, last_names_list
+from api_university.models.student import StudentModel
+from api_university.schemas.compiler import compile_schema
+from api_university.schemas.course import CourseSchema
+from api_university.schemas.group import GroupSchema
+from api_university.schemas.student import ShortStudentSchema, FullStudentSchema
+
+
+def create_arguments():
+    parser = argparse.ArgumentParser(description="Compares marshmallow and compiled dumpers.")
+    parser.add_argument('--objects', type=int, default=20000, help='number of students to dump')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs is taken')
+    return parser.parse_args()
+
+
+def generate_students(number_of_students: int, groups: list, courses: list) -> list[StudentModel]:
+    return [StudentModel(student_id=student_id,
+                         first_name=choice(first_names_list).title(),
+                         last_name=choice(last_names_list).title(),
+                         group=choice(groups + [None]),
+                         courses=sample(courses, randint(1, 3)))
+            for student_id in range(1, number_of_students + 1)]
+
+
+def measure(dump, objects: list, repeat: int) -> float:
+    """Returns the best objects/sec rate of `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        dump(objects)
+        best = min(best, perf_counter() - start)
+    return len(objects) / best
+
+
+def main():
+    args = create_arguments()
+    groups = generate_group_instances(number_of_groups=10)
+    courses = generate_course_instances(courses=courses_dict)
+    students = generate_students(args.objects, groups, courses)
+    for course in courses:
+        course.students = [student for student in students if course in student.courses][:50]
+
+    cases = [
+        ('ShortStudentSchema', ShortStudentSchema(many=True), students),
+        ('FullStudentSchema', FullStudentSchema(many=True), students),
+        ('GroupSchema (short)', GroupSchema(many=True, only=('group_id', 'name')), groups * (args.objects // 10)),
+        ('CourseSchema (full)', CourseSchema(many=True), courses * (args.objects // 10)),
+    ]
+    print(f"{'schema':<22}{'marshmallow, obj/s':>20}{'compiled, obj/s':>20}{'speedup':>10}")
+    for name, schema, objects in cases:
+        marshmallow_rate = measure(schema.dump, objects, args.repeat)
+        compiled_rate = measure(compile_schema(schema), objects, args.repeat)
+        print(f"{name:<22}{marshmallow_rate:>20,.0f}{compiled_rate:>20,.0f}{compiled_rate / marshmallow_rate:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
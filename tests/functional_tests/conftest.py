@@ -1,8 +1,15 @@
 import pytest
+from sqlalchemy import event
 
 from api_university.app import create_app
 from api_university.db.db_sqlalchemy import db as db_
 from api_university.ma import ma as ma_
+from api_university.cache.response_cache import response_cache as response_cache_
+from api_university.cache.backends import RedisBackend
+from api_university.models.id_sequence import reset_sequence
+from api_university.models.student import StudentModel
+from api_university.models.group import GroupModel
+from api_university.models.course import CourseModel
 from tests.test_data.data import group_list, course_list, student_list
 from api_university.config import TestingConfiguration
 from api_university.db.db_operations import DatabaseOperation
@@ -50,11 +57,65 @@ def db(app):
 
 @pytest.fixture(scope="function", autouse=True)
 def session(db, app):
-    session_ = db.session
-    session_.begin_nested()
-
-    yield session_
-
-    session_.rollback()
-    session_.close()
-    session_.remove()
+    """
+    Runs the test in a transaction of its own connection, which is rolled back after the test.
+    The session works in a SAVEPOINT of it, started again whenever the session commits or rolls it back,
+    so commits of the session end its outermost transaction (and fire its commit hooks) without writing anything.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    savepoint = connection.begin_nested()
+
+    def restart_savepoint(session_, transaction_):
+        nonlocal savepoint
+        if not savepoint.is_active:
+            savepoint = connection.begin_nested()
+
+    db.session.remove()
+    db.session.configure(bind=connection, binds={})
+    event.listen(db.session, 'after_transaction_end', restart_savepoint)
+
+    yield db.session
+
+    event.remove(db.session, 'after_transaction_end', restart_savepoint)
+    db.session.remove()
+    transaction.rollback()
+    connection.close()
+    db.session.configure(bind=db.engine, binds=db.get_binds(app))
+    # sequences are not rolled back, ids taken by the test are given back
+    for model in (StudentModel, GroupModel, CourseModel):
+        reset_sequence(model.__table__.primary_key.columns[0])
+    db.session.remove()
+
+
+@pytest.fixture(scope="function")
+def select_statements(db):
+    """Collects SELECT statements sent to the database during a test."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    yield statements
+
+    event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.fixture(scope="function", params=['memory', 'redis'])
+def response_cache(request):
+    """Enables the response cache (it is off in the test configuration) for a test, once per backend."""
+    default_backend = response_cache_.backend
+    if request.param == 'redis':
+        fakeredis = pytest.importorskip('fakeredis')
+        response_cache_.backend = RedisBackend(fakeredis.FakeRedis(), max_entries=default_backend.max_entries)
+    response_cache_.clear()
+    response_cache_.enabled = True
+
+    yield response_cache_
+
+    response_cache_.enabled = False
+    response_cache_.clear()
+    response_cache_.backend = default_backend
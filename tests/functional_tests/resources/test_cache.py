@@ -0,0 +1,90 @@
+import pytest
+
+from api_university.config import Configuration as Config
+
+api_url = Config.API_URL
+
+
+class TestResponseCache:
+    @pytest.mark.parametrize("url", [
+        "{}/students", "{}/students?full=true&group=2", "{}/students/1",
+        "{}/groups?full=true", "{}/groups/2", "{}/courses", "{}/courses/1?full=true",
+    ])
+    def test_get_cached(self, url, client, response_cache, select_statements):
+        url = url.format(api_url)
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers['X-Cache'] == 'MISS'
+        select_statements.clear()
+        cached_response = client.get(url)
+        assert cached_response.status_code == 200
+        assert cached_response.headers['X-Cache'] == 'HIT'
+        assert cached_response.data == response.data
+        assert cached_response.headers['ETag'] == response.headers['ETag']
+        # only the table versions are read for the ETag
+        assert len(select_statements) == 1
+
+    @pytest.mark.parametrize("url, same_url", [
+        ("{}/students?full=false", "{}/students"),
+        ("{}/students?group=02&full=TRUE", "{}/students?full=true&group=2"),
+        ("{}/students?fields=last_name,student_id", "{}/students?fields=student_id, last_name"),
+    ])
+    # equal requests share an entry
+    def test_get_normalized_key(self, url, same_url, client, response_cache):
+        client.get(url.format(api_url))
+        response = client.get(same_url.format(api_url))
+        assert response.headers['X-Cache'] == 'HIT'
+
+    @pytest.mark.parametrize("url", ["{}/students?stream=true", "{}/students/1000"])
+    # streamed and error responses are not cached
+    def test_get_not_cached(self, url, client, response_cache):
+        client.get(url.format(api_url))
+        client.get(url.format(api_url))
+        assert response_cache.stats()['size'] == 0
+
+    def test_get_disabled(self, client):
+        response = client.get(f"{api_url}/students")
+        assert response.status_code == 200
+        assert 'X-Cache' not in response.headers
+
+    @pytest.mark.parametrize("method, url, json_to_send, invalidated_urls, cached_urls", [
+        # student 2 is in group 1 and takes courses 2 and 3
+        ('put', "{}/students/2", {"first_name": "Somebody"},
+         ["{}/students/2", "{}/groups/1?full=true", "{}/courses/2?full=true", "{}/students"],
+         ["{}/students/1", "{}/groups/2?full=true", "{}/courses/1?full=true"]),
+        # moves student 2 to group 3 and enrolls it in course 1, student 1 takes course 1 too
+        ('put', "{}/students/2", {"group_id": 3, "add_courses": [1]},
+         ["{}/students/2", "{}/groups/1?full=true", "{}/groups/3?full=true", "{}/courses/1?full=true"],
+         ["{}/students/1", "{}/groups/2?full=true"]),
+        ('delete', "{}/students/5", None,
+         ["{}/students/5", "{}/students", "{}/groups?full=true"],
+         ["{}/students/1", "{}/groups/1?full=true", "{}/courses/1?full=true"]),
+        # group 2 shows in the pages of its students 1 and 3
+        ('put', "{}/groups/2", {"name": "ZZ-99"},
+         ["{}/groups/2", "{}/students/1", "{}/students/3", "{}/students", "{}/groups"],
+         ["{}/groups/1", "{}/students/2", "{}/courses/1?full=true"]),
+        ('put', "{}/courses/3", {"name": "Spanish"},
+         ["{}/courses/3", "{}/students/2", "{}/courses"],
+         ["{}/courses/1", "{}/students/1", "{}/groups/2?full=true"]),
+    ])
+    # writes invalidate exactly the responses which show the changed data
+    def test_invalidation(self, method, url, json_to_send, invalidated_urls, cached_urls, client, response_cache):
+        for cached_url in invalidated_urls + cached_urls:
+            assert client.get(cached_url.format(api_url)).status_code == 200
+        response = getattr(client, method)(url.format(api_url), json=json_to_send)
+        assert response.status_code == 200
+        for invalidated_url in invalidated_urls:
+            # a deleted entity is not found, so its response is not cached at all
+            assert client.get(invalidated_url.format(api_url)).headers.get('X-Cache') != 'HIT', invalidated_url
+        for cached_url in cached_urls:
+            assert client.get(cached_url.format(api_url)).headers['X-Cache'] == 'HIT', cached_url
+
+    def test_get_stats(self, client, response_cache):
+        client.get(f"{api_url}/students")
+        client.get(f"{api_url}/students")
+        client.get(f"{api_url}/groups")
+        response = client.get(f"{api_url}/cache/stats")
+        assert response.status_code == 200
+        assert response.json == {'enabled': True, 'backend': type(response_cache.backend).__name__,
+                                 'size': 2, 'max_entries': 1024, 'ttl': 60,
+                                 'hits': 1, 'misses': 2, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
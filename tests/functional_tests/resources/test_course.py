@@ -14,6 +14,8 @@ course_resources = {
 
     'course_list': "{}/courses",
     'full_course_list': "{}/courses?full={}",
+    'paginated_course_list': "{}/courses?full=true&limit={}",
+    'course_list_by_name': "{}/courses?name={}",
 }
 
 
@@ -172,7 +174,7 @@ class TestCourseException:
                 4,
                 {"name": "some_course", "students": [1000, 2000]},
                 404,
-                {'message': gettext_("student_not_found").format(1000),
+                {'message': gettext_("student_list_not_found").format([1000, 2000]),
                  'status': 404}
         )
     ])
@@ -210,7 +212,7 @@ class TestCourseException:
                 3,
                 {"add_students": [1000, 2000]},
                 404,
-                {'message': gettext_("student_not_found").format(1000),
+                {'message': gettext_("student_list_not_found").format([1000, 2000]),
                  'status': 404}
         )
     ])
@@ -276,6 +278,76 @@ class TestCourseList:
             assert isinstance(full_course['students'], list) is True
 
 
+    @pytest.mark.parametrize("url, attrs", [
+        ("{}/courses", ['course_id', 'name']),
+        ("{}/courses?full=true&fields=course_id,name", ['course_id', 'name']),
+        ("{}/courses?full=true&fields=students", ['students']),
+    ])
+    # sparse fieldsets: the description column is not read unless it is requested
+    def test_get_fields(self, url, attrs, client, select_statements):
+        response = client.get(url.format(api_url))
+        assert response.status_code == 200
+        assert len(response.json) == course_count
+        for course in response.json:
+            assert list(course.keys()) == attrs
+        assert not any('description' in statement for statement in select_statements)
+
+    def test_get_wrong_fields(self, client):
+        url = f"{course_resources['course_list'].format(api_url)}?fields=description"
+        response = client.get(url)
+        assert response.status_code == 400
+        assert response.json == {
+            'message': gettext_("fields_err_unknown").format(['description'], ['course_id', 'name']),
+            'status': 400
+        }
+
+    @pytest.mark.parametrize("full", ['true', 'false'])
+    # streaming gives the same list as the regular response
+    def test_get_stream(self, full, app, client, monkeypatch):
+        monkeypatch.setitem(app.config, 'STREAM_CHUNK_SIZE', 2)
+        url = course_resources['full_course_list'].format(api_url, full)
+        expected_json = client.get(url).json
+        response = client.get(f"{url}&stream=true")
+        assert response.status_code == 200
+        assert response.is_streamed is True
+        assert response.json == expected_json
+
+    @pytest.mark.parametrize("limit", [1, 2, 3])
+    # keyset pagination
+    def test_get_paginated(self, limit, client):
+        url = course_resources['paginated_course_list'].format(api_url, limit)
+        received_ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            assert 0 < len(response.json) <= limit
+            for full_course in response.json:
+                assert list(full_course.keys()) == ['course_id', 'name', 'description', 'students']
+                received_ids.append(full_course['course_id'])
+            next_cursor = response.headers.get('X-Next-Cursor')
+            url = f"{url.split('&after=')[0]}&after={next_cursor}" if next_cursor else None
+        assert received_ids == list(range(1, course_count + 1))
+
+    # enrolling a student changes the ETag of the full course list
+    def test_get_modified(self, client):
+        url = f"{api_url}/courses?full=true"
+        etag = client.get(url).headers['ETag']
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        assert client.put(f"{api_url}/students/3", json={"add_courses": [2]}).status_code == 200
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    @pytest.mark.parametrize("name, result_json", [
+        ('Chemistry', [{'course_id': 2, 'name': 'Chemistry'}]),
+        ('Physics', []),
+    ])
+    def test_get_filter_by_name(self, name, result_json, client):
+        response = client.get(course_resources['course_list_by_name'].format(api_url, name))
+        assert response.status_code == 200
+        assert response.json == result_json
+
+
 @pytest.mark.parametrize("wrong_data", ['smth_wrong', 1000])
 class TestCourseListException:
     # wrong query string "?full="
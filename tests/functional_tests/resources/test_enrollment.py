@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import delete, select
+
+from api_university.config import Configuration as Config
+from api_university.models.student import StudentModel
+from api_university.models.course import CourseModel
+from api_university.models.relationships import students_courses
+from api_university.responses.response_strings import gettext_
+
+api_url = Config.API_URL
+
+enrollment_resources = {
+    'course_students': "{}/courses/{}/students",
+    'student_courses': "{}/students/{}/courses",
+}
+
+
+class TestCourseStudents:
+    def test_post(self, client):
+        url = enrollment_resources['course_students'].format(api_url, 3)
+        # students 2 and 9 are enrolled already (and 4, 7)
+        response = client.post(url, json={"student_ids": [1, 2, 9, 1]})
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("course_students_post").format([1], 3), 'status': 200}
+        students = CourseModel.get_course_students(3)
+        assert [student.student_id for student in students].count(1) == 1
+        assert StudentModel.find_by_id(2) in students
+
+    def test_delete(self, client):
+        url = enrollment_resources['course_students'].format(api_url, 3)
+        response = client.delete(url, json={"student_ids": [1, 2, 9]})
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("course_students_delete").format([2, 9], 3), 'status': 200}
+        assert [student.student_id for student in CourseModel.get_course_students(3)] == [4, 7]
+
+    @pytest.mark.parametrize("course_id, json_to_send, status, result_json", [
+        (100, {"student_ids": [1]}, 404,
+         {'message': gettext_("course_not_found").format(100), 'status': 404}),
+        (3, {"student_ids": [1, 1000, 2000]}, 404,
+         {'message': gettext_("student_list_not_found").format([1000, 2000]), 'status': 404}),
+        (3, {"student_ids": []}, 400,
+         {'message': {'student_ids': ['Shorter than minimum length 1.']}, 'err_name': 'ValidationError',
+          'status': 400}),
+    ])
+    def test_post_wrong_data(self, course_id, json_to_send, status, result_json, client):
+        url = enrollment_resources['course_students'].format(api_url, course_id)
+        response = client.post(url, json=json_to_send)
+        assert response.status_code == status
+        assert response.json == result_json
+
+
+class TestStudentCourses:
+    def test_post(self, client):
+        url = enrollment_resources['student_courses'].format(api_url, 1)
+        response = client.post(url, json={"course_ids": [1, 2]})
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("student_courses_post").format(1, [2]), 'status': 200}
+        assert [course.course_id for course in StudentModel.find_by_id(1).courses] == [1, 2]
+
+    def test_delete(self, client):
+        url = enrollment_resources['student_courses'].format(api_url, 2)
+        response = client.delete(url, json={"course_ids": [1, 2]})
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("student_courses_delete").format(2, [2]), 'status': 200}
+        assert [course.course_id for course in StudentModel.find_by_id(2).courses] == [3]
+
+    @pytest.mark.parametrize("student_id, json_to_send, status, result_json", [
+        (1000, {"course_ids": [1]}, 404,
+         {'message': gettext_("student_not_found").format(1000), 'status': 404}),
+        (1, {"course_ids": [1000, 20]}, 404,
+         {'message': gettext_("course_list_not_found").format([1000, 20]), 'status': 404}),
+        (1, {}, 400,
+         {'message': {'course_ids': ['Missing data for required field.']}, 'err_name': 'ValidationError',
+          'status': 400}),
+    ])
+    def test_post_wrong_data(self, student_id, json_to_send, status, result_json, client):
+        url = enrollment_resources['student_courses'].format(api_url, student_id)
+        response = client.post(url, json=json_to_send)
+        assert response.status_code == status
+        assert response.json == result_json
+
+
+class TestEnrollmentTable:
+    # links of a deleted course are removed by the database
+    def test_delete_course_cascade(self, session):
+        session.execute(delete(CourseModel.__table__).where(CourseModel.course_id == 3))
+        links = session.execute(select(students_courses).where(students_courses.c.course_id == 3)).all()
+        assert links == []
+        assert [course.course_id for course in StudentModel.find_by_id(2).courses] == [2]
@@ -0,0 +1,59 @@
+import csv
+import json
+
+import pytest
+
+from api_university.config import Configuration as Config
+from api_university.responses.response_strings import gettext_
+
+from tests.test_data.data import student_count, group_count, course_count
+
+api_url = Config.API_URL
+export_url = "{}/export/{}"
+
+
+class TestExport:
+    def test_export_students_ndjson(self, client):
+        response = client.get(export_url.format(api_url, 'students'))
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert len(rows) == student_count
+        assert rows[0] == {'student_id': 1, 'first_name': 'Joseph', 'last_name': 'Anderson',
+                           'group_id': 2, 'group_name': 'BB-22', 'course_ids': [1]}
+        assert [row['student_id'] for row in rows] == sorted(row['student_id'] for row in rows)
+
+    def test_export_students_csv(self, client):
+        response = client.get(f"{export_url.format(api_url, 'students')}?format=csv")
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        rows = list(csv.DictReader(response.get_data(as_text=True).splitlines()))
+        assert len(rows) == student_count
+        assert rows[1] == {'student_id': '2', 'first_name': 'Maria', 'last_name': 'Johnson',
+                           'group_id': '1', 'group_name': 'AA-11', 'course_ids': '2 3'}
+
+    @pytest.mark.parametrize("kind, file_format, row_count", [
+        ('groups', 'csv', group_count + 1),
+        ('courses', 'ndjson', course_count),
+        ('courses', 'csv', course_count + 1),
+    ])
+    def test_export_tables(self, kind, file_format, row_count, client):
+        response = client.get(f"{export_url.format(api_url, kind)}?format={file_format}")
+        assert response.status_code == 200
+        assert len(response.get_data(as_text=True).splitlines()) == row_count
+
+    def test_export_not_modified(self, client):
+        url = export_url.format(api_url, 'enrollments')
+        etag = client.get(url).headers['ETag']
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize("url_params, status, message", [
+        ("teachers", 404, gettext_("export_err_kind").format('teachers', ['students', 'groups', 'courses',
+                                                                          'enrollments'])),
+        ("students?format=xml", 400, gettext_("export_err_format").format('xml', ['ndjson', 'csv'])),
+    ])
+    def test_export_wrong_request(self, url_params, status, message, client):
+        response = client.get(f"{api_url}/export/{url_params}")
+        assert response.status_code == status
+        assert response.json == {'status': status, 'message': message}
@@ -3,6 +3,7 @@ import pytest
 from api_university.config import Configuration as Config
 from api_university.responses.response_strings import gettext_
 from api_university.models.group import GroupModel
+from api_university.models.student import StudentModel
 
 from tests.test_data.data import group_count
 
@@ -14,7 +15,10 @@ group_resources = {
 
     'group_list': "{}/groups",
     'full_group_list': "{}/groups?full={}",
-    'group_list_by_student_count': "{}/groups?student_count={}"
+    'group_list_by_student_count': "{}/groups?student_count={}",
+    'group_list_by_student_count_range': "{}/groups?{}",
+    'paginated_group_list': "{}/groups?limit={}",
+    'group_list_by_name': "{}/groups?name={}",
 }
 
 
@@ -31,6 +35,17 @@ class TestGroup:
         assert response.json['group_id'] == group_id
         assert isinstance(response.json['name'], str) is True
 
+    @pytest.mark.parametrize("group_id, fields, attrs", [
+        (1, 'name', ['name']),
+        (2, 'students,group_id', ['group_id', 'students']),
+    ])
+    # sparse fieldsets
+    def test_get_fields(self, group_id, fields, attrs, client):
+        url = f"{group_resources['full_group'].format(api_url, group_id, 'true')}&fields={fields}"
+        response = client.get(url)
+        assert response.status_code == 200
+        assert list(response.json.keys()) == attrs
+
     @pytest.mark.parametrize("group_id", [1, 2, 3])
     # full schema
     def test_get_full_default_group_schema(self, group_id, client):
@@ -106,6 +121,14 @@ class TestGroup:
         assert response.json == result_json
         assert len(GroupModel.get_group_students(group_id)) == student_count
 
+    # students of other groups are moved by 'add_students' and left where they are by 'delete_students'
+    def test_put_members_of_other_groups(self, client):
+        url = group_resources['group'].format(api_url, 1)
+        response = client.put(url, json={"add_students": [1], "delete_students": [3]})
+        assert response.status_code == 200
+        assert StudentModel.find_by_id(1).group_id == 1
+        assert StudentModel.find_by_id(3).group_id == 2
+
     @pytest.mark.parametrize("group_id, result_json, remaining_group_count", [
         (
                 1,
@@ -168,7 +191,7 @@ class TestGroupException:
                 4,
                 {"name": "some_course", "students": [1000, 2000]},
                 404,
-                {'message': gettext_("student_not_found").format(1000),
+                {'message': gettext_("student_list_not_found").format([1000, 2000]),
                  'status': 404}
         )
     ])
@@ -206,7 +229,7 @@ class TestGroupException:
                 3,
                 {"add_students": [1000, 2000]},
                 404,
-                {'message': gettext_("student_not_found").format(1000),
+                {'message': gettext_("student_list_not_found").format([1000, 2000]),
                  'status': 404}
         )
     ])
@@ -257,6 +280,28 @@ class TestGroupList:
             assert attrs_ == ['group_id', 'name']
             assert isinstance(group['name'], str) is True
 
+    # groups 1 and 2 have 3 students, group 3 has 2 students
+    @pytest.mark.parametrize("url_params, group_ids", [
+        ("min_student_count=3", [1, 2]),
+        ("min_student_count=1&max_student_count=2", [3]),
+        ("max_student_count=2", [3]),
+        ("student_count=2&min_student_count=3", []),
+    ])
+    def test_get_groups_filter_by_student_count_range(self, url_params, group_ids, client):
+        url = group_resources['group_list_by_student_count_range'].format(api_url, url_params)
+        response = client.get(url)
+        assert response.status_code == 200
+        assert [group['group_id'] for group in response.json] == group_ids
+
+    @pytest.mark.parametrize("name, result_json", [
+        ('BB-22', [{'group_id': 2, 'name': 'BB-22'}]),
+        ('ZZ-99', []),
+    ])
+    def test_get_groups_filter_by_name(self, name, result_json, client):
+        response = client.get(group_resources['group_list_by_name'].format(api_url, name))
+        assert response.status_code == 200
+        assert response.json == result_json
+
     # full schema
     def test_get_full_schema(self, client):
         url = group_resources['full_group_list'].format(api_url, 'true')
@@ -270,6 +315,41 @@ class TestGroupList:
             assert isinstance(full_group['name'], str) is True
             assert isinstance(full_group['students'], list) is True
 
+    @pytest.mark.parametrize("url", ["{}/groups?full=true", "{}/groups?student_count=3"])
+    # streaming gives the same list as the regular response
+    def test_get_stream(self, url, app, client, monkeypatch):
+        monkeypatch.setitem(app.config, 'STREAM_CHUNK_SIZE', 2)
+        url = url.format(api_url)
+        expected_json = client.get(url).json
+        response = client.get(f"{url}&stream=true")
+        assert response.status_code == 200
+        assert response.is_streamed is True
+        assert response.json == expected_json
+
+    @pytest.mark.parametrize("limit", [1, 2, 3])
+    # keyset pagination
+    def test_get_paginated(self, limit, client):
+        url = group_resources['paginated_group_list'].format(api_url, limit)
+        received_ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            assert 0 < len(response.json) <= limit
+            received_ids.extend(group['group_id'] for group in response.json)
+            next_cursor = response.headers.get('X-Next-Cursor')
+            url = f"{url.split('&')[0]}&after={next_cursor}" if next_cursor else None
+        assert received_ids == list(range(1, group_count + 1))
+
+    # moving a student to another group changes the ETag of the full group list
+    def test_get_modified(self, client):
+        url = f"{api_url}/groups?full=true"
+        etag = client.get(url).headers['ETag']
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        assert client.put(f"{api_url}/students/1", json={"group_id": 1}).status_code == 200
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
     @pytest.mark.parametrize("student_count, number_of_group", [(1, 0), (3, 3), (6, 3)])
     def test_get_groups_filter_by_student_count(self, student_count, number_of_group, client):
         url = group_resources['group_list_by_student_count'].format(api_url, student_count)
@@ -301,8 +381,7 @@ class TestGroupListException:
         (
                 'smth_wrong',
                 400,
-                {'message': {'student_count': "invalid literal for int() with base 10: "
-                                              "'smth_wrong'"}}
+                {'message': gettext_("query_err_int").format('student_count'), 'status': 400}
         ),
         (
                 1000,
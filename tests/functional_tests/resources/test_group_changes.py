@@ -0,0 +1,92 @@
+import pytest
+
+from api_university.config import Configuration as Config
+from api_university.models.group import GroupModel
+from api_university.models.student import StudentModel
+from api_university.responses.response_strings import gettext_
+
+api_url = Config.API_URL
+
+group_change_resources = {
+    'move': "{}/groups/{}/move",
+    'merge': "{}/groups/{}/merge",
+    'split': "{}/groups/{}/split",
+}
+
+
+def member_ids(group_id: int) -> list[int]:
+    return [student.student_id for student in GroupModel.get_group_students(group_id)]
+
+
+class TestGroupMove:
+    # group 1: students 2, 6, 9; group 2: students 1, 3, 7
+    @pytest.mark.parametrize("json_to_send, moved_ids", [
+        ({"to_group_id": 3}, [2, 6, 9]),
+        ({"to_group_id": 3, "student_ids": [2, 9, 1]}, [2, 9]),
+        ({"to_group_id": 3, "course_id": 2}, [2, 6, 9]),
+        ({"to_group_id": 3, "course_id": 3}, [2, 9]),
+        ({"to_group_id": 3, "course_id": 3, "student_ids": [6, 9]}, [9]),
+    ])
+    def test_post(self, json_to_send, moved_ids, client):
+        url = group_change_resources['move'].format(api_url, 1)
+        response = client.post(url, json=json_to_send)
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("group_move").format(len(moved_ids), 1, 3),
+                                 'moved': len(moved_ids), 'status': 200}
+        assert member_ids(3) == sorted([8, 10, *moved_ids])
+        assert StudentModel.find_by_id(1).group_id == 2
+
+    @pytest.mark.parametrize("group_id, json_to_send, status, message", [
+        (100, {"to_group_id": 1}, 404, gettext_("group_not_found").format(100)),
+        (1, {"to_group_id": 100}, 404, gettext_("group_not_found").format(100)),
+        (1, {"to_group_id": 1}, 400, gettext_("group_err_same_target").format(1)),
+        (1, {"to_group_id": 2, "course_id": 100}, 404, gettext_("course_not_found").format(100)),
+    ])
+    def test_post_wrong_data(self, group_id, json_to_send, status, message, client):
+        url = group_change_resources['move'].format(api_url, group_id)
+        response = client.post(url, json=json_to_send)
+        assert response.status_code == status
+        assert response.json == {'message': message, 'status': status}
+
+
+class TestGroupMerge:
+    @pytest.mark.parametrize("delete_groups, remaining_group_ids", [
+        (False, [1, 2, 3]),
+        (True, [1]),
+    ])
+    def test_post(self, delete_groups, remaining_group_ids, client):
+        url = group_change_resources['merge'].format(api_url, 1)
+        response = client.post(url, json={"group_ids": [2, 3, 1, 2], "delete_groups": delete_groups})
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("group_merge").format(5, 1), 'moved': 5, 'status': 200,
+                                 'deleted_groups': [2, 3] if delete_groups else []}
+        assert member_ids(1) == [1, 2, 3, 6, 7, 8, 9, 10]
+        assert [group.group_id for group in GroupModel.get_all_groups()] == remaining_group_ids
+
+    def test_post_missing_groups(self, client):
+        url = group_change_resources['merge'].format(api_url, 1)
+        response = client.post(url, json={"group_ids": [2, 100, 200]})
+        assert response.status_code == 404
+        assert response.json == {'message': gettext_("group_list_not_found").format([100, 200]), 'status': 404}
+        assert member_ids(1) == [2, 6, 9]
+
+
+class TestGroupSplit:
+    # group 2 ordered by name: Anderson (1), Brown (7), Johnson (3)
+    @pytest.mark.parametrize("rule, moved_ids", [
+        ('half', [3]),
+        ('alternate', [7]),
+    ])
+    def test_post(self, rule, moved_ids, client):
+        url = group_change_resources['split'].format(api_url, 2)
+        response = client.post(url, json={"to_group_id": 3, "rule": rule})
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("group_move").format(len(moved_ids), 2, 3),
+                                 'moved': len(moved_ids), 'status': 200}
+        assert member_ids(3) == sorted([8, 10, *moved_ids])
+
+    def test_post_unknown_rule(self, client):
+        url = group_change_resources['split'].format(api_url, 2)
+        response = client.post(url, json={"to_group_id": 3, "rule": "random"})
+        assert response.status_code == 400
+        assert response.json['err_name'] == 'ValidationError'
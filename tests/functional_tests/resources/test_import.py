@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from api_university.config import Configuration as Config
+from api_university.models.student import StudentModel
+from api_university.models.course import CourseModel
+from api_university.models.group import GroupModel
+from api_university.responses.response_strings import gettext_
+
+from tests.test_data.data import student_count, group_count
+
+api_url = Config.API_URL
+import_url = "{}/import/{}"
+
+
+def read_events(response) -> list[dict]:
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+class TestImport:
+    def test_import_students_csv(self, client):
+        body = ("first_name,last_name,group_id\n"
+                "John,Marlin,3\n"
+                "Alex,Brown,\n"
+                ",Smith,1\n"
+                "Mary,Clark,1000\n")
+        response = client.post(import_url.format(api_url, 'students'), data=body, content_type='text/csv')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        events = read_events(response)
+        assert events[0] == {'event': 'error', 'line': 4,
+                             'errors': {'first_name': ['Missing data for required field.']}}
+        assert {'event': 'error', 'line': 5,
+                'errors': {'group_id': [gettext_("group_not_found").format(1000)]}} in events
+        assert events[-1] == {'event': 'done', 'rows': 4, 'imported': 2, 'errors': 2}
+        assert StudentModel.find_by_id(student_count + 1).first_name == 'John'
+        assert StudentModel.find_by_id(student_count + 2).group_id is None
+        assert StudentModel.find_by_id(student_count + 3) is None
+
+    # rows with existing ids update them, the last row of the same id wins
+    def test_import_groups_ndjson(self, client):
+        body = "\n".join(json.dumps(row) for row in [{"group_id": 1, "name": "XX-00"},
+                                                     {"group_id": 50, "name": "YY-11"},
+                                                     {"group_id": 50, "name": "ZZ-22"}])
+        response = client.post(import_url.format(api_url, 'groups'), data=body,
+                               content_type='application/x-ndjson')
+        assert read_events(response)[-1] == {'event': 'done', 'rows': 3, 'imported': 2, 'errors': 0}
+        assert GroupModel.find_by_id(1).name == 'XX-00'
+        assert GroupModel.find_by_id(50).name == 'ZZ-22'
+        assert GroupModel.query.count() == group_count + 1
+
+    def test_import_enrollments(self, client):
+        body = ("student_id,course_id\n"
+                "1,1\n"
+                "1,3\n"
+                "1,3\n"
+                "1000,1\n")
+        response = client.post(import_url.format(api_url, 'enrollments'), data=body, content_type='text/csv')
+        events = read_events(response)
+        assert events[-1] == {'event': 'done', 'rows': 4, 'imported': 1, 'errors': 1}
+        assert [course.course_id for course in StudentModel.find_by_id(1).courses] == [1, 3]
+        assert StudentModel.find_by_id(1) in CourseModel.get_course_students(3)
+
+    @pytest.mark.parametrize("kind, content_type, status", [
+        ('teachers', 'text/csv', 404),
+        ('students', 'application/json', 415),
+    ])
+    def test_import_wrong_request(self, kind, content_type, status, client):
+        response = client.post(import_url.format(api_url, kind), data="", content_type=content_type)
+        assert response.status_code == status
+        assert response.json['status'] == status
@@ -0,0 +1,81 @@
+import pytest
+
+from api_university.config import Configuration as Config
+from api_university.responses.response_strings import gettext_
+
+api_url = Config.API_URL
+
+stats_resources = {
+    'stats': "{}/stats",
+    'student_courses': "{}/stats/student-courses",
+    'course_students': "{}/stats/course-students",
+    'course_counts': "{}/stats/course-counts",
+    'refresh': "{}/stats/refresh",
+}
+
+
+@pytest.fixture
+def refreshed(client):
+    response = client.post(stats_resources['refresh'].format(api_url))
+    assert response.status_code == 200
+    return response
+
+
+class TestStats:
+    def test_refresh(self, refreshed):
+        assert refreshed.json['message'] == gettext_("stats_refresh").format(
+            ['stats_student_courses', 'stats_course_students', 'stats_course_counts'])
+        assert list(refreshed.json['refreshed_at']) == ['student_courses', 'course_students', 'course_counts']
+
+    def test_get_course_students(self, client, refreshed):
+        response = client.get(stats_resources['course_students'].format(api_url))
+        assert response.status_code == 200
+        assert response.json == [{'course_id': 1, 'name': 'Math', 'number_of_students': 6},
+                                 {'course_id': 2, 'name': 'Chemistry', 'number_of_students': 5},
+                                 {'course_id': 3, 'name': 'English', 'number_of_students': 4}]
+        assert 'Last-Modified' in response.headers
+
+    @pytest.mark.parametrize("url_params, student_ids", [
+        ("number_of_courses=3", [4, 9]),
+        ("number_of_courses=0", [5, 8]),
+        ("group=1&number_of_courses=1", [6]),
+    ])
+    def test_get_student_courses(self, url_params, student_ids, client, refreshed):
+        response = client.get(f"{stats_resources['student_courses'].format(api_url)}?{url_params}")
+        assert response.status_code == 200
+        assert [student['student_id'] for student in response.json] == student_ids
+
+    def test_get_student_courses_paginated(self, client, refreshed):
+        response = client.get(f"{stats_resources['student_courses'].format(api_url)}?limit=1")
+        assert response.status_code == 200
+        assert response.json == [{'student_id': 1, 'group_id': 2,
+                                  'full_name': 'Joseph Anderson', 'number_of_courses': 1}]
+        assert 'X-Next-Cursor' in response.headers
+
+    def test_get_course_counts(self, client, refreshed):
+        response = client.get(f"{stats_resources['course_counts'].format(api_url)}")
+        assert response.status_code == 200
+        assert response.json == [{'number_of_courses': 0, 'number_of_students': 2},
+                                 {'number_of_courses': 1, 'number_of_students': 3},
+                                 {'number_of_courses': 2, 'number_of_students': 3},
+                                 {'number_of_courses': 3, 'number_of_students': 2}]
+
+    # the statistics change on refreshes only, until then they are answered with 304
+    def test_get_modified(self, client, refreshed):
+        url = stats_resources['course_students'].format(api_url)
+        etag = client.get(url).headers['ETag']
+        assert client.post(f"{api_url}/courses/1/students", json={"student_ids": [5]}).status_code == 200
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+        refresh_times = client.get(stats_resources['stats'].format(api_url)).json['refreshed_at']
+        assert client.post(stats_resources['refresh'].format(api_url)).status_code == 200
+        assert client.get(stats_resources['stats'].format(api_url)).json['refreshed_at'] != refresh_times
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.json[0]['number_of_students'] == 7
+
+    def test_get_wrong_number_of_courses(self, client):
+        response = client.get(f"{stats_resources['course_counts'].format(api_url)}?number_of_courses=three")
+        assert response.status_code == 400
+        assert response.json == {'message': gettext_("query_err_int").format('number_of_courses'), 'status': 400}
@@ -24,6 +24,12 @@ student_resources = {
     'group_full_student_list': "{}/students?full={}&group={}",
     'course_full_student_list': "{}/students?full={}&course={}",
     'group&course_full_student_list': "{}/students?full={}&group={}&course={}",
+
+    'paginated_student_list': "{}/students?limit={}",
+    'group_paginated_student_list': "{}/students?group={}&limit={}",
+    'course_paginated_student_list': "{}/students?course={}&limit={}",
+    'student_list_after': "{}/students?limit={}&after={}",
+    'student_search': "{}/students/search?q={}",
 }
 
 
@@ -45,6 +51,28 @@ class TestStudent:
         assert isinstance(response.json['group_name'], (str, type(None))) is True
         assert isinstance(response.json['course_names'], (str, type(None))) is True
 
+    @pytest.mark.parametrize("student_id, full, fields, attrs", [
+        (1, 'false', 'student_id,last_name', ['student_id', 'last_name']),
+        (2, 'false', 'course_names, first_name', ['first_name', 'course_names']),
+        (4, 'true', 'courses', ['courses']),
+        (6, 'true', 'group,student_id', ['student_id', 'group']),
+    ])
+    # sparse fieldsets
+    def test_get_fields(self, student_id, full, fields, attrs, client):
+        url = f"{student_resources['full_student'].format(api_url, student_id, full)}&fields={fields}"
+        response = client.get(url)
+        assert response.status_code == 200
+        assert list(response.json.keys()) == attrs
+        full_json = client.get(student_resources['full_student'].format(api_url, student_id, full)).json
+        assert response.json == {attr: full_json[attr] for attr in attrs}
+
+    @pytest.mark.parametrize("full", ['true', 'false'])
+    def test_get_query_count(self, full, client, select_statements):
+        url = student_resources['full_student'].format(api_url, 9, full)
+        response = client.get(url)
+        assert response.status_code == 200
+        assert len(select_statements) == 3
+
     @pytest.mark.parametrize("student_id", [2, 4, 6])
     # full schema
     def test_get_full_schema(self, student_id, client):
@@ -117,6 +145,15 @@ class TestStudent:
                  'status': 200},
                 2,
                 1
+        ),
+        # course ids given as strings
+        (
+                4,
+                {"delete_courses": ["2", "3"]},
+                {'message': gettext_("student_put").format(4),
+                 'status': 200},
+                None,
+                1
         )
     ])
     def test_put(self, student_id, json_to_send, result_json, group_id, course_count, client):
@@ -205,7 +242,7 @@ class TestStudentException:
                  "group_id": 3,
                  "courses": [1000, 20]},
                 404,
-                {'message': gettext_("course_not_found").format(1000),
+                {'message': gettext_("course_list_not_found").format([1000, 20]),
                  'status': 404}
         )
     ])
@@ -257,7 +294,16 @@ class TestStudentException:
                  "group_id": 3,
                  "delete_courses": [1000, 20]},
                 404,
-                {'message': gettext_("course_not_found").format(1000),
+                {'message': gettext_("course_list_not_found").format([1000, 20]),
+                 'status': 404}
+        ),
+        # 4 give course ids which are not numbers:
+        (
+                1,
+                {"student_id": 5,
+                 "add_courses": ["one", True, 2]},
+                404,
+                {'message': gettext_("course_list_not_found").format(["one", True]),
                  'status': 404}
         )
     ])
@@ -363,6 +409,128 @@ class TestStudentList:
             assert isinstance(student['group'], (dict, type(None))) is True
             assert isinstance(student['courses'], list) is True
 
+    @pytest.mark.parametrize("url, query_count", [
+        ("{}/students", 3),
+        ("{}/students?full=true", 3),
+        ("{}/students?group=2", 4),
+        ("{}/students?full=true&group=2", 4),
+        ("{}/students?course=2", 4),
+        ("{}/students?full=true&course=2", 4),
+        ("{}/students?full=true&group=1&course=1", 3)
+    ])
+    # relationships are eager loaded, so the number of queries does not depend on the number of students
+    # (one of the queries reads the table versions for the ETag)
+    def test_get_query_count(self, url, query_count, client, select_statements):
+        for limit in (1, student_count):
+            select_statements.clear()
+            response = client.get(f"{url.format(api_url)}{'&' if '?' in url else '?'}limit={limit}")
+            assert response.status_code == 200
+            assert len(select_statements) == query_count
+
+    @pytest.mark.parametrize("url", [
+        "{}/students",
+        "{}/students?full=true",
+        "{}/students?full=true&group=2",
+        "{}/students?course=2",
+    ])
+    # streaming gives the same list as the regular response
+    def test_get_stream(self, url, app, client, monkeypatch):
+        monkeypatch.setitem(app.config, 'STREAM_CHUNK_SIZE', 3)
+        url = url.format(api_url)
+        expected_json = client.get(url).json
+        response = client.get(f"{url}{'&' if '?' in url else '?'}stream=true")
+        assert response.status_code == 200
+        assert response.is_streamed is True
+        assert 'application/json' in response.headers['Content-Type']
+        assert response.json == expected_json
+
+    @pytest.mark.parametrize("url, attrs, query_count", [
+        ("{}/students?fields=student_id,first_name", ['student_id', 'first_name'], 2),
+        ("{}/students?fields=last_name,group_name", ['last_name', 'group_name'], 2),
+        ("{}/students?fields=course_names", ['course_names'], 3),
+        ("{}/students?full=true&fields=student_id,courses", ['student_id', 'courses'], 3),
+    ])
+    # sparse fieldsets: unused relationships are not loaded at all
+    def test_get_fields(self, url, attrs, query_count, client, select_statements):
+        response = client.get(url.format(api_url))
+        assert response.status_code == 200
+        assert len(response.json) == student_count
+        for student in response.json:
+            assert list(student.keys()) == attrs
+        assert len(select_statements) == query_count
+
+    @pytest.mark.parametrize("group_id, course_id, limit, student_ids", [
+        (None, None, 3, list(range(1, 11))),
+        (None, None, 10, list(range(1, 11))),
+        (2, None, 2, [1, 3, 7]),
+        (None, 2, 4, [2, 4, 6, 9, 10])
+    ])
+    # keyset pagination
+    def test_get_paginated(self, group_id, course_id, limit, student_ids, client):
+        if group_id:
+            url = student_resources['group_paginated_student_list'].format(api_url, group_id, limit)
+        elif course_id:
+            url = student_resources['course_paginated_student_list'].format(api_url, course_id, limit)
+        else:
+            url = student_resources['paginated_student_list'].format(api_url, limit)
+        received_ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            assert 'application/json' in response.headers['Content-Type']
+            assert 0 < len(response.json) <= limit
+            received_ids.extend(student['student_id'] for student in response.json)
+            next_cursor = response.headers.get('X-Next-Cursor')
+            if next_cursor:
+                assert f'after={next_cursor}' in response.headers['Link']
+                url = student_resources['student_list_after'].format(api_url, limit, next_cursor)
+                if group_id:
+                    url += f'&group={group_id}'
+                elif course_id:
+                    url += f'&course={course_id}'
+            else:
+                assert 'Link' not in response.headers
+                url = None
+        assert received_ids == student_ids
+
+    @pytest.mark.parametrize("url", ["{}/students", "{}/students?full=true&group=2", "{}/students/4"])
+    # conditional get: unchanged data is not read at all
+    def test_get_not_modified(self, url, client, select_statements):
+        url = url.format(api_url)
+        etag = client.get(url).headers['ETag']
+        assert etag.startswith('W/"')
+        select_statements.clear()
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+        assert len(select_statements) == 1
+        assert 'table_versions' in select_statements[0]
+
+    @pytest.mark.parametrize("method, url, json_to_send", [
+        ('put', "{}/students/2", {"first_name": "Somebody"}),
+        ('put', "{}/students/2", {"add_courses": [1]}),
+        ('delete', "{}/students/5", None),
+        ('put', "{}/groups/1", {"name": "ZZ-99"}),
+        ('put', "{}/courses/3", {"name": "Spanish"}),
+    ])
+    # every change of the tables the list is read from changes the ETag
+    def test_get_modified(self, method, url, json_to_send, client):
+        list_url = f"{api_url}/students"
+        etag = client.get(list_url).headers['ETag']
+        assert client.get(list_url, headers={'If-None-Match': etag}).status_code == 304
+        change_response = getattr(client, method)(url.format(api_url), json=json_to_send)
+        assert change_response.status_code == 200
+        response = client.get(list_url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    # the ETag depends on the requested representation
+    def test_get_etag_per_url(self, client):
+        etags = {client.get(f"{api_url}/students{query}").headers['ETag']
+                 for query in ('', '?full=true', '?limit=2', '?fields=student_id')}
+        assert len(etags) == 4
+
     @pytest.mark.parametrize("json_to_send, result_json", [
         ([
              {
@@ -395,6 +563,16 @@ class TestStudentList:
         assert StudentModel.find_by_id(11) is not None
         assert StudentModel.find_by_id(12) is not None
 
+    # ids given by the client are not handed out by the bulk insert
+    def test_post_after_given_id(self, client):
+        response = client.post(student_resources['student'].format(api_url, 100),
+                               json={"first_name": "John", "last_name": "Marlin"})
+        assert response.status_code == 200
+        response = client.post(student_resources['student_list'].format(api_url),
+                               json=[{"first_name": "Alex", "last_name": "Brown"}])
+        assert response.status_code == 200
+        assert response.json['message'] == gettext_("student_list_post").format([101])
+
     @pytest.mark.parametrize("json_to_send, result_json", [
         ([
              {
@@ -438,6 +616,21 @@ class TestStudentList:
         assert student_2 not in CourseModel.get_course_students(2)
         assert student_2 not in GroupModel.get_group_students(1)
 
+    # updates of the same student are applied in order
+    def test_put_same_student(self, client):
+        json_to_send = [{"student_id": 3, "first_name": "Alex", "add_courses": [1, 2]},
+                        {"student_id": 3, "first_name": "Maria", "delete_courses": [1]},
+                        {"student_id": 4, "add_courses": [2]}]
+        url = student_resources['student_list'].format(api_url)
+        response = client.put(url, json=json_to_send)
+        assert response.status_code == 200
+        assert response.json == {'message': gettext_("student_list_put").format([3, 3, 4]), 'status': 200}
+        student_3 = StudentModel.find_by_id(3)
+        assert student_3.first_name == "Maria"
+        assert student_3 not in CourseModel.get_course_students(1)
+        assert student_3 in CourseModel.get_course_students(2)
+        assert CourseModel.get_course_students(2).count(StudentModel.find_by_id(4)) == 1
+
     @pytest.mark.parametrize("json_to_send, result_json", [
         # give all correct data
         (
@@ -450,6 +643,18 @@ class TestStudentList:
                 {"student_id_list": [3, 2000]},
                 {'message': gettext_("student_list_delete").format([3]),
                  'status': 200}
+        ),
+        # give the same student_id twice
+        (
+                {"student_id_list": [5, 4, 5]},
+                {'message': gettext_("student_list_delete").format([5, 4]),
+                 'status': 200}
+        ),
+        # give student ids as strings
+        (
+                {"student_id_list": ["3", "2"]},
+                {'message': gettext_("student_list_delete").format([3, 2]),
+                 'status': 200}
         )
 
     ])
@@ -540,7 +745,7 @@ class TestStudentListException:
                   "group_id": 3,
                   "courses": [1000, 20]}],
                 404,
-                {'message': gettext_("course_not_found").format(1000),
+                {'message': gettext_("course_list_not_found").format([1000, 20]),
                  'status': 404}
         )
     ])
@@ -556,12 +761,22 @@ class TestStudentListException:
         assert response.content_type == mimetype
         assert response.json == result_json
 
+    # a failed bulk insert leaves no student behind
+    def test_post_student_list_atomic(self, client):
+        json_to_send = [{"first_name": "John", "last_name": "Marlin", "courses": [1]},
+                        {"first_name": "Alex", "last_name": "Brown", "group_id": 3000}]
+        url = student_resources['student_list'].format(api_url)
+        response = client.post(url, json=json_to_send)
+        assert response.status_code == 400
+        assert response.json['err_name'] == 'IntegrityError'
+        assert StudentModel.find_by_id(student_count + 1) is None
+
     @pytest.mark.parametrize("json_to_send, status, result_json", [
         # 0 student not found:
         (
-                [{"group_id": 3, "add_courses": [1, 2]}],
+                [{"student_id": 1000, "group_id": 3, "add_courses": [1, 2]}],
                 404,
-                {'message': gettext_("student_not_found").format(None),
+                {'message': gettext_("student_not_found").format(1000),
                  'status': 404}
         ),
         # 1 give 'courses' list instead of 'add_courses' and 'delete_courses' lists:
@@ -588,8 +803,16 @@ class TestStudentListException:
                   "group_id": 3,
                   "delete_courses": [1000, 20]}],
                 404,
-                {'message': gettext_("course_not_found").format(1000),
+                {'message': gettext_("course_list_not_found").format([1000, 20]),
                  'status': 404}
+        ),
+        # 4 missing student_id:
+        (
+                [{"group_id": 3, "add_courses": [1, 2]}],
+                400,
+                {'message': {'student_id': ['Missing data for required field.']},
+                 'err_name': 'ValidationError',
+                 'status': 400}
         )
     ])
     def test_put_wrong_student_list(self, json_to_send, status, result_json, session, client):
@@ -613,12 +836,28 @@ class TestStudentListException:
                 400
         ),
         # 1 give incorrect type student_id
-        pytest.param(
-            {"student_id_list": ['a', 'b']},
-            {'message': gettext_("student_list_delete_err_no_one"),
-             'status': 400},
-            400,
-            marks=pytest.mark.xfail(reason='incorrect input data: given str instead of int')
+        (
+                {"student_id_list": ['a', 'b']},
+                {'message': {'student_id_list': {'0': ['Not a valid integer.'], '1': ['Not a valid integer.']}},
+                 'err_name': 'ValidationError',
+                 'status': 400},
+                400
+        ),
+        # 2 give a number instead of the list
+        (
+                {"student_id_list": 5},
+                {'message': {'student_id_list': ['Not a valid list.']},
+                 'err_name': 'ValidationError',
+                 'status': 400},
+                400
+        ),
+        # 3 give a number instead of the object
+        (
+                5,
+                {'message': {'_schema': ['Invalid input type.']},
+                 'err_name': 'ValidationError',
+                 'status': 400},
+                400
         )
     ])
     def test_delete_wrong_student_list(self, json_to_send, status, result_json, client):
@@ -632,3 +871,81 @@ class TestStudentListException:
         assert response.status_code == status
         assert response.content_type == mimetype
         assert response.json == result_json
+
+    @pytest.mark.parametrize("url_params, result_json", [
+        ("limit=0",
+         {'message': gettext_("pagination_err_limit").format(Config.MAX_PAGE_LIMIT), 'status': 400}),
+        (f"limit={Config.MAX_PAGE_LIMIT + 1}",
+         {'message': gettext_("pagination_err_limit").format(Config.MAX_PAGE_LIMIT), 'status': 400}),
+        ("limit=2&after=smth_wrong",
+         {'message': gettext_("pagination_err_cursor").format('smth_wrong'), 'status': 400}),
+        ("limit=2&after=InN0cmluZyI",
+         {'message': gettext_("pagination_err_cursor").format('InN0cmluZyI'), 'status': 400}),
+        # cursor [true]: booleans are not keys
+        ("limit=2&after=W3RydWVd",
+         {'message': gettext_("pagination_err_cursor").format('W3RydWVd'), 'status': 400})
+    ])
+    # wrong query strings "?limit=" and "?after="
+    def test_get_wrong_page(self, url_params, result_json, client):
+        url = f"{student_resources['student_list'].format(api_url)}?{url_params}"
+        response = client.get(url)
+        assert response.status_code == 400
+        assert 'application/json' in response.headers['Content-Type']
+        assert response.json == result_json
+
+    @pytest.mark.parametrize("url_params", [
+        "fields=",
+        "fields=student_id,group",
+        "full=true&fields=student_id,group_name",
+        "fields=password",
+    ])
+    # wrong query string "?fields="
+    def test_get_wrong_fields(self, url_params, client):
+        url = f"{student_resources['student_list'].format(api_url)}?{url_params}"
+        response = client.get(url)
+        assert response.status_code == 400
+        assert 'application/json' in response.headers['Content-Type']
+        assert response.json['status'] == 400
+
+
+class TestStudentSearch:
+    @pytest.mark.parametrize("search_query, student_ids", [
+        # prefix of the last name
+        ('john', [2, 3]),
+        # similar last name
+        ('jonson', [2, 3]),
+        # every word has to match
+        ('Joseph Johnson', [3]),
+        # the prefix match of 'Margaret' ranks above the similar 'Maria'
+        ('marga', [9, 2]),
+        ('zzzz', []),
+    ])
+    def test_get(self, search_query, student_ids, client):
+        response = client.get(student_resources['student_search'].format(api_url, search_query))
+        assert response.status_code == 200
+        assert [student['student_id'] for student in response.json] == student_ids
+        for student in response.json:
+            assert list(student.keys()) == ['student_id', 'first_name', 'last_name', 'group_name', 'course_names']
+
+    def test_get_paginated(self, client):
+        url = f"{student_resources['student_search'].format(api_url, 'john')}&limit=1"
+        received_ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            received_ids.extend(student['student_id'] for student in response.json)
+            next_cursor = response.headers.get('X-Next-Cursor')
+            url = f"{url.split('&after=')[0]}&after={next_cursor}" if next_cursor else None
+        assert received_ids == [2, 3]
+
+    # cursor [0.5, true]: booleans are not keys
+    def test_get_wrong_cursor(self, client):
+        response = client.get(f"{student_resources['student_search'].format(api_url, 'john')}&after=WzAuNSx0cnVlXQ")
+        assert response.status_code == 400
+        assert response.json == {'message': gettext_("pagination_err_cursor").format('WzAuNSx0cnVlXQ'), 'status': 400}
+
+    @pytest.mark.parametrize("url_params", ["", "q=", "q=jo", "q=%20%20jo%20"])
+    def test_get_short_query(self, url_params, client):
+        response = client.get(f"{api_url}/students/search?{url_params}")
+        assert response.status_code == 400
+        assert response.json == {'message': gettext_("search_err_query").format(3), 'status': 400}
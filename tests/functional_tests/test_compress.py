@@ -0,0 +1,99 @@
+import gzip
+import json
+import zlib
+
+import pytest
+
+from api_university.config import Configuration as Config
+
+api_url = Config.API_URL
+full_student_list_url = f"{api_url}/students?full=true"
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    match encoding:
+        case 'gzip':
+            return gzip.decompress(data)
+        case 'br':
+            return pytest.importorskip('brotli').decompress(data)
+        case 'zstd':
+            return pytest.importorskip('zstandard').ZstdDecompressor().decompressobj().decompress(data)
+
+
+class TestCompress:
+    @pytest.mark.parametrize("accept_encoding, encoding", [
+        ('gzip', 'gzip'),
+        ('gzip, deflate', 'gzip'),
+        ('br', 'br'),
+        ('zstd', 'zstd'),
+        ('gzip, br, zstd', 'br'),
+        ('gzip;q=1.0, br;q=0.5', 'gzip'),
+        ('*', 'br'),
+    ])
+    def test_negotiated(self, accept_encoding, encoding, client):
+        if encoding != 'gzip':
+            pytest.importorskip({'br': 'brotli', 'zstd': 'zstandard'}[encoding])
+        expected = client.get(full_student_list_url).data
+        response = client.get(full_student_list_url, headers={'Accept-Encoding': accept_encoding})
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == encoding
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert int(response.headers['Content-Length']) == len(response.data) < len(expected)
+        assert decompress(response.data, encoding) == expected
+
+    @pytest.mark.parametrize("accept_encoding", [None, 'identity', 'gzip;q=0', 'deflate'])
+    def test_not_accepted(self, accept_encoding, client):
+        headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+        response = client.get(full_student_list_url, headers=headers)
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response.headers
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert isinstance(response.json, list)
+
+    # error responses are not compressed
+    def test_not_found(self, client):
+        response = client.get(f"{api_url}/students/1000", headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 404
+        assert 'Content-Encoding' not in response.headers
+
+    def test_min_size(self, app, client, monkeypatch):
+        size = len(client.get(full_student_list_url).data)
+        monkeypatch.setitem(app.config, 'COMPRESS_MIN_SIZE', size + 1)
+        response = client.get(full_student_list_url, headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in response.headers
+        monkeypatch.setitem(app.config, 'COMPRESS_MIN_SIZE', size)
+        response = client.get(full_student_list_url, headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+
+    def test_level(self, app, client, monkeypatch):
+        sizes = []
+        for level in (1, 9):
+            monkeypatch.setitem(app.config, 'COMPRESS_LEVEL', level)
+            response = client.get(full_student_list_url, headers={'Accept-Encoding': 'gzip'})
+            assert gzip.decompress(response.data) == client.get(full_student_list_url).data
+            sizes.append(len(response.data))
+        assert sizes[0] >= sizes[1]
+
+    @pytest.mark.parametrize("encoding", ['gzip', 'br', 'zstd'])
+    # chunked lists are compressed chunk by chunk, each chunk can be decompressed as soon as it is received
+    def test_stream(self, encoding, app, client, monkeypatch):
+        if encoding != 'gzip':
+            pytest.importorskip({'br': 'brotli', 'zstd': 'zstandard'}[encoding])
+        monkeypatch.setitem(app.config, 'STREAM_CHUNK_SIZE', 3)
+        expected = client.get(full_student_list_url).json
+        response = client.get(f"{full_student_list_url}&stream=true", headers={'Accept-Encoding': encoding})
+        assert response.status_code == 200
+        assert response.is_streamed is True
+        assert response.headers['Content-Encoding'] == encoding
+        assert 'Content-Length' not in response.headers
+        chunks = list(response.response)
+        assert len(chunks) > 2
+        if encoding == 'gzip':
+            # every chunk is flushed, so it is decompressed completely without the rest of the stream
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            decompressed_chunks = [decompressor.decompress(chunk) for chunk in chunks]
+            assert all(decompressed_chunks[:-1])
+            data = b''.join(decompressed_chunks)
+        else:
+            data = decompress(b''.join(chunks), encoding)
+        assert json.loads(data) == expected
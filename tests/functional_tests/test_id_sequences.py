@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from api_university.models.id_sequence import advance_sequence
+from api_university.models.student import StudentModel
+
+student_id = StudentModel.__table__.c.student_id
+
+
+def last_value(session) -> int:
+    return session.execute(text("SELECT pg_sequence_last_value(pg_get_serial_sequence('students', 'student_id')"
+                                "::regclass)")).scalar()
+
+
+class TestAdvanceSequence:
+    def test_never_moves_back(self, session):
+        advance_sequence(student_id, 1000)
+        advance_sequence(student_id, 500)
+        assert last_value(session) == 1000
+
+    # the check and setval of concurrent advances can not interleave
+    def test_concurrent_advances_wait(self, db):
+        first_session = db.session.session_factory(bind=db.engine, binds={})
+        second_session = db.session.session_factory(bind=db.engine, binds={})
+        try:
+            advance_sequence(student_id, 1000, first_session.connection())
+            second_session.execute(text("SET LOCAL lock_timeout = '100ms'"))
+            with pytest.raises(OperationalError):
+                advance_sequence(student_id, 500, second_session.connection())
+            second_session.rollback()
+            first_session.commit()
+            advance_sequence(student_id, 500, second_session.connection())
+            second_session.commit()
+            assert last_value(second_session) == 1000
+        finally:
+            first_session.close()
+            second_session.close()
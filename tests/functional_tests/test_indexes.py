@@ -0,0 +1,54 @@
+import json
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from api_university.models.course import CourseModel
+from api_university.models.group import GroupModel
+from api_university.db.sqlalchemy_queries.queries import ComplexQuery
+
+# about the size of a university, the planner prefers sequential scans of a few test rows
+dataset = {'groups': 2000, 'courses': 2000, 'students': 50000}
+
+
+@pytest.fixture
+def realistic_data(session):
+    """Adds generated rows after the test data, they are rolled back with the test."""
+    statements = [
+        "INSERT INTO groups (group_id, name) "
+        "SELECT id, 'G-' || id FROM generate_series(1000, 999 + :groups) AS id",
+        "INSERT INTO courses (course_id, name, description) "
+        "SELECT id, 'Course ' || id, NULL FROM generate_series(1000, 999 + :courses) AS id",
+        "INSERT INTO students (student_id, first_name, last_name, group_id) "
+        "SELECT id, 'First ' || id, 'Last ' || id, 1000 + id % :groups "
+        "FROM generate_series(1000, 999 + :students) AS id",
+        "ANALYZE groups, courses, students",
+    ]
+    for statement in statements:
+        session.execute(text(statement), dataset)
+
+
+def scanned_indexes(session, query) -> set[str]:
+    """Returns names of the indexes scanned by the plan of the query."""
+    sql = query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True})
+    plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    indexes, nodes = set(), [plan[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        if node['Node Type'] in ('Index Scan', 'Index Only Scan', 'Bitmap Index Scan'):
+            indexes.add(node['Index Name'])
+        nodes.extend(node.get('Plans', ()))
+    return indexes
+
+
+class TestIndexes:
+    @pytest.mark.parametrize("make_query, index", [
+        (lambda: GroupModel.query.filter_by(name='G-1500'), 'ix_groups_name'),
+        (lambda: CourseModel.query.filter_by(name='Course 1500'), 'ix_courses_name'),
+        (lambda: ComplexQuery.query_students(group_id=1500), 'ix_students_group_id'),
+    ])
+    def test_index_scan(self, make_query, index, session, realistic_data):
+        assert index in scanned_indexes(session, make_query())
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import func, select, update
+
+from api_university.config import Configuration as Config
+from api_university.models.group import GroupModel
+from api_university.models.student import StudentModel
+from api_university.models.student_count import repair_student_counts
+
+api_url = Config.API_URL
+
+groups, students = GroupModel.__table__, StudentModel.__table__
+
+
+def stored_counts(session) -> dict[int, int]:
+    return dict(session.execute(select(groups.c.group_id, groups.c.student_count).order_by(groups.c.group_id)))
+
+
+def real_counts(session) -> dict[int, int]:
+    counts = select(groups.c.group_id, func.count(students.c.student_id))\
+        .select_from(groups.outerjoin(students))\
+        .group_by(groups.c.group_id)\
+        .order_by(groups.c.group_id)
+    return dict(session.execute(counts))
+
+
+class TestStudentCount:
+    def test_initial(self, session):
+        assert stored_counts(session) == {1: 3, 2: 3, 3: 2}
+
+    # every way of writing students keeps the counts
+    @pytest.mark.parametrize("method, url, json_to_send", [
+        ('put', "{}/students/1", {"group_id": 3}),
+        ('put', "{}/students/4", {"group_id": 1}),
+        ('post', "{}/students", [{"first_name": "Anna", "last_name": "Lee", "group_id": 3},
+                                 {"first_name": "Ivan", "last_name": "Lee", "group_id": 3},
+                                 {"first_name": "Olga", "last_name": "Lee"}]),
+        ('put', "{}/students", [{"student_id": 2, "group_id": 2}, {"student_id": 6, "last_name": "Lee"}]),
+        ('delete', "{}/students", {"student_id_list": [1, 2, 5]}),
+        ('delete', "{}/students/8", None),
+        ('put', "{}/groups/3", {"add_students": [1, 2], "delete_students": [8]}),
+        ('post', "{}/groups/1/move", {"to_group_id": 3}),
+        ('post', "{}/groups/1/merge", {"group_ids": [2, 3], "delete_groups": True}),
+        ('delete', "{}/groups/2", None),
+    ])
+    def test_kept(self, method, url, json_to_send, client, session):
+        response = getattr(client, method)(url.format(api_url), json=json_to_send)
+        assert response.status_code == 200
+        assert stored_counts(session) == real_counts(session)
+
+    def test_repair(self, session):
+        session.execute(update(groups).where(groups.c.group_id.in_([1, 3])).values(student_count=100))
+        batches = list(repair_student_counts(batch_size=2))
+        assert batches == [(2, [1]), (1, [3])]
+        assert stored_counts(session) == {1: 3, 2: 3, 3: 2}
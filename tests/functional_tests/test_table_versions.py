@@ -0,0 +1,66 @@
+from sqlalchemy import text, update
+
+from api_university.models.group import GroupModel
+from api_university.models.student import StudentModel
+from api_university.models.table_version import TableVersionModel
+
+students = StudentModel.__table__
+
+
+def engine_session(db):
+    """A session of the app which commits for real, the session of the tests is joined to a rolled back transaction."""
+    return db.session.session_factory(bind=db.engine, binds={})
+
+
+class TestTableVersions:
+    # writers of the same table do not wait for each other's commits to bump its version
+    def test_concurrent_writers(self, db):
+        first_session, second_session = engine_session(db), engine_session(db)
+        try:
+            version = TableVersionModel.get_versions(['students'])['students']
+            # the names are written unchanged, so the data of the other tests stays the same
+            first_session.execute(update(students).where(students.c.student_id == 1)
+                                  .values(first_name=students.c.first_name))
+            # a lock held by the first transaction makes the second one fail instead of hanging
+            second_session.execute(text("SET LOCAL lock_timeout = '2s'"))
+            second_session.execute(update(students).where(students.c.student_id == 2)
+                                   .values(first_name=students.c.first_name))
+            second_session.commit()
+            assert TableVersionModel.get_versions(['students'])['students'] == version + 1
+            first_session.commit()
+            assert TableVersionModel.get_versions(['students'])['students'] == version + 2
+        finally:
+            first_session.close()
+            second_session.close()
+
+    # versions of rolled back changes are not bumped
+    def test_rollback(self, db):
+        session = engine_session(db)
+        try:
+            version = TableVersionModel.get_versions(['students'])['students']
+            session.execute(update(students).where(students.c.student_id == 1).values(first_name='Nobody'))
+            session.rollback()
+            assert TableVersionModel.get_versions(['students'])['students'] == version
+        finally:
+            session.close()
+
+    # changes of a released SAVEPOINT are counted once the outermost transaction is committed,
+    # changes of a rolled back one are not counted at all
+    def test_savepoints(self, db):
+        session = engine_session(db)
+        try:
+            versions = TableVersionModel.get_versions(['students', 'groups'])
+            session.begin_nested()
+            session.execute(update(students).where(students.c.student_id == 1)
+                            .values(first_name=students.c.first_name))
+            session.commit()
+            session.begin_nested()
+            session.execute(update(GroupModel.__table__).where(GroupModel.__table__.c.group_id == 1)
+                            .values(name=GroupModel.__table__.c.name))
+            session.rollback()
+            assert TableVersionModel.get_versions(['students', 'groups']) == versions
+            session.commit()
+            assert TableVersionModel.get_versions(['students', 'groups']) == {'students': versions['students'] + 1,
+                                                                              'groups': versions['groups']}
+        finally:
+            session.close()
@@ -0,0 +1,58 @@
+import pytest
+
+from api_university.data.bulk_import import read_rows
+
+
+class TestReadRows:
+    def test_csv(self):
+        lines = ["first_name,last_name,group_id\r\n",
+                 "John,Marlin,3\r\n",
+                 "Alex,Brown,\r\n",
+                 "\"Mary, Ann\",Smith,1,extra\r\n"]
+        assert list(read_rows(lines, 'csv')) == [
+            (2, {'first_name': 'John', 'last_name': 'Marlin', 'group_id': '3'}),
+            (3, {'first_name': 'Alex', 'last_name': 'Brown'}),
+            (4, None),
+        ]
+
+    def test_ndjson(self):
+        lines = [b'{"first_name": "John", "last_name": "Marlin"}\n',
+                 b'\n',
+                 b'[1, 2]\n',
+                 b'{"first_name": \n',
+                 '{"name": "Math"}']
+        assert list(read_rows(lines, 'ndjson')) == [
+            (1, {'first_name': 'John', 'last_name': 'Marlin'}),
+            (3, None),
+            (4, None),
+            (5, {'name': 'Math'}),
+        ]
+
+    # lines which are not UTF-8 or break the CSV parser are reported, not raised
+    def test_csv_broken_lines(self):
+        lines = [b"first_name,last_name\r\n",
+                 b"J\xffohn,Marlin\r\n",
+                 b"\"Mary\r\n",
+                 b"Ann\",Smith\r\n",
+                 "x" * 200000 + ",Brown\r\n",
+                 b"Alex,Brown\r\n"]
+        assert list(read_rows(lines, 'csv')) == [
+            (2, None),
+            (4, {'first_name': 'Mary\r\nAnn', 'last_name': 'Smith'}),
+            (5, None),
+            (6, {'first_name': 'Alex', 'last_name': 'Brown'}),
+        ]
+
+    def test_ndjson_broken_lines(self):
+        lines = [b'{"first_name": "J\xffohn"}\n',
+                 b'[' * 100000 + b'\n',
+                 b'{"name": "Math"}\n']
+        assert list(read_rows(lines, 'ndjson')) == [
+            (1, None),
+            (2, None),
+            (3, {'name': 'Math'}),
+        ]
+
+    @pytest.mark.parametrize("file_format", ['csv', 'ndjson'])
+    def test_empty(self, file_format):
+        assert list(read_rows([], file_format)) == []
@@ -0,0 +1,72 @@
+import json
+import pytest
+from marshmallow import fields, post_dump
+
+from api_university.models.course import CourseModel
+from api_university.models.group import GroupModel
+from api_university.models.student import StudentModel
+from api_university.schemas.compiler import compile_schema
+from api_university.schemas.course import CourseSchema
+from api_university.schemas.group import GroupSchema
+from api_university.schemas.student import ShortStudentSchema, FullStudentSchema
+
+
+class StudentWithDefaultSchema(ShortStudentSchema):
+    nickname = fields.String(dump_default='no nickname')
+    birthday = fields.Date()
+
+
+class StudentWithHookSchema(ShortStudentSchema):
+    @post_dump
+    def add_full_name(self, data, **kwargs):
+        data['full_name'] = f"{data['first_name']} {data['last_name']}"
+        return data
+
+
+groups = [GroupModel(group_id=1, name="AA-11"),
+          GroupModel(group_id=2, name="BB-22")]
+courses = [CourseModel(course_id=1, name="Math", description="Mathematics"),
+           CourseModel(course_id=2, name="Chemistry", description=None),
+           CourseModel(course_id=3, name="English", description="English")]
+students = [StudentModel(student_id=1, first_name="Joseph", last_name="Anderson",
+                         group=groups[1], courses=[courses[0]]),
+            StudentModel(student_id=2, first_name="Maria", last_name="Johnson",
+                         group=groups[0], courses=[courses[1], courses[2]]),
+            StudentModel(student_id=3, first_name="Patricia", last_name="Williams"),
+            StudentModel(student_id=4, first_name="William", last_name="Miller", group=groups[0])]
+
+
+class TestCompiler:
+    @pytest.mark.parametrize("schema, objects", [
+        (ShortStudentSchema(), students),
+        (FullStudentSchema(), students),
+        (ShortStudentSchema(only=('student_id', 'course_names')), students),
+        (FullStudentSchema(only=('courses',)), students),
+        (GroupSchema(), groups),
+        (GroupSchema(only=('group_id', 'name')), groups),
+        (CourseSchema(), courses),
+        (CourseSchema(only=('course_id', 'name')), courses),
+        (StudentWithDefaultSchema(), students),
+        (StudentWithHookSchema(), students),
+    ])
+    # compiled dumper gives the same data in the same order as marshmallow
+    def test_dump_parity(self, schema, objects):
+        dump = compile_schema(schema)
+        for obj in objects:
+            expected = schema.dump(obj)
+            result = dump(obj)
+            assert result == expected
+            assert json.dumps(result) == json.dumps(expected)
+
+    @pytest.mark.parametrize("schema, objects", [
+        (ShortStudentSchema(many=True), students),
+        (FullStudentSchema(many=True), students),
+        (CourseSchema(many=True), courses),
+        (ShortStudentSchema(many=True), []),
+    ])
+    def test_dump_many_parity(self, schema, objects):
+        assert json.dumps(compile_schema(schema)(objects)) == json.dumps(schema.dump(objects))
+
+    def test_compiled_once(self):
+        schema = ShortStudentSchema()
+        assert compile_schema(schema) is compile_schema(schema)
@@ -0,0 +1,76 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify, request
+from flask.json import JSONEncoder
+
+from api_university.json_provider import JSONProvider, OrjsonDecoder, OrjsonEncoder
+
+orjson = pytest.importorskip('orjson')
+
+payloads = [
+    {'status': 404, 'message': 'Not found'},
+    [{'student_id': 1, 'first_name': 'Joseph', 'last_name': 'Anderson', 'group_id': None,
+      'courses': [{'course_id': 1, 'name': 'Math'}]}],
+    {'message': 'Студент не найден', 'list': [1.5, True, None, 'ü']},
+    [],
+]
+
+
+class TestOrjsonEncoder:
+    @pytest.mark.parametrize("payload", payloads)
+    def test_encode_parity(self, payload):
+        assert json.loads(OrjsonEncoder().encode(payload)) == payload
+
+    def test_encode_options(self):
+        assert OrjsonEncoder(sort_keys=True).encode({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+        assert OrjsonEncoder(indent=2).encode({'a': 1}) == json.dumps({'a': 1}, indent=2)
+        # no such orjson option, stdlib is used
+        assert OrjsonEncoder(indent=4).encode({'a': 1}) == json.dumps({'a': 1}, indent=4)
+
+    # values orjson cannot encode are encoded as Flask does
+    def test_encode_fallback(self):
+        encoder = OrjsonEncoder()
+        assert encoder.encode({'id': 2 ** 70}) == json.dumps({'id': 2 ** 70})
+        assert json.loads(encoder.encode({'price': Decimal('1.50')})) == {'price': '1.50'}
+        assert json.loads(encoder.encode({'day': date(2022, 1, 2)})) == {'day': 'Sun, 02 Jan 2022 00:00:00 GMT'}
+        assert (json.loads(encoder.encode({'time': datetime(2022, 1, 2, 3, 4, 5)}))
+                == {'time': 'Sun, 02 Jan 2022 03:04:05 GMT'})
+
+
+class TestOrjsonDecoder:
+    @pytest.mark.parametrize("payload", payloads)
+    def test_decode_parity(self, payload):
+        data = json.dumps(payload)
+        assert json.loads(data, cls=OrjsonDecoder) == json.loads(data)
+
+    def test_decode_hooks(self):
+        assert json.loads('{"a": 1.5}', cls=OrjsonDecoder, parse_float=Decimal) == {'a': Decimal('1.5')}
+
+    def test_decode_error(self):
+        with pytest.raises(ValueError):
+            json.loads('{"a": ', cls=OrjsonDecoder)
+
+
+class TestJSONProvider:
+    @pytest.mark.parametrize("provider, encoder", [
+        ('orjson', OrjsonEncoder),
+        ('stdlib', JSONEncoder),
+    ])
+    def test_init_app(self, provider, encoder):
+        app = Flask(__name__)
+        app.config['JSON_PROVIDER'] = provider
+        JSONProvider(app)
+        assert app.json_encoder is encoder
+        assert app.config['RESTFUL_JSON']['cls'] is app.json_encoder
+        with app.test_request_context(json={'first_name': 'Maria'}):
+            assert request.get_json() == {'first_name': 'Maria'}
+            assert json.loads(jsonify({'a': [1, 2]}).get_data()) == {'a': [1, 2]}
+
+    def test_unknown_provider(self):
+        app = Flask(__name__)
+        app.config['JSON_PROVIDER'] = 'ujson'
+        with pytest.raises(ValueError):
+            JSONProvider(app)
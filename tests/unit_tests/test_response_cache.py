@@ -0,0 +1,162 @@
+import pytest
+
+from api_university.cache import backends
+from api_university.cache.backends import MemoryBackend, RedisBackend
+from api_university.cache.response_cache import ResponseCache
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def make_cache(request):
+    """Makes caches sharing one backend storage, like the worker processes of the app do."""
+    if request.param == 'redis':
+        fakeredis = pytest.importorskip('fakeredis')
+        server = fakeredis.FakeServer()
+
+        def make_backend():
+            return RedisBackend(fakeredis.FakeRedis(server=server), max_entries=3)
+    else:
+        backend = MemoryBackend(max_entries=3)
+
+        def make_backend():
+            return backend
+
+    def make_cache_():
+        cache_ = ResponseCache(backend=make_backend())
+        cache_.enabled = True
+        cache_.ttl = 10
+        return cache_
+    return make_cache_
+
+
+@pytest.fixture
+def cache(make_cache):
+    return make_cache()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(backends, 'monotonic', lambda: now[0])
+    return now
+
+
+def put(cache, key, tags=(), generation=None):
+    cache.set(key, key.encode(), 200, [('Content-Type', 'application/json')], tags, generation)
+
+
+class TestResponseCache:
+    def test_hit_and_miss(self, cache):
+        assert cache.get('/a') is None
+        put(cache, '/a', tags=['students'])
+        entry = cache.get('/a')
+        assert entry.body == b'/a'
+        assert entry.status == 200
+        assert entry.headers == [('Content-Type', 'application/json')]
+        assert entry.tags == {'students'}
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    # the least recently used entry is evicted
+    def test_lru_eviction(self, cache):
+        for key in ('/a', '/b', '/c'):
+            put(cache, key)
+        cache.get('/a')
+        put(cache, '/d')
+        assert cache.get('/b') is None
+        assert all(cache.get(key) is not None for key in ('/a', '/c', '/d'))
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['size'] == 3
+
+    def test_invalidate(self, cache):
+        put(cache, '/students/1', tags=['students:1', 'groups:2'])
+        put(cache, '/students/2', tags=['students:2', 'groups:1'])
+        put(cache, '/groups/2', tags=['groups:2', 'students:1'])
+        cache.invalidate(['groups:2'])
+        assert cache.get('/students/1') is None
+        assert cache.get('/groups/2') is None
+        assert cache.get('/students/2') is not None
+        assert cache.stats()['invalidations'] == 2
+        # removed entries are not invalidated once again
+        cache.invalidate(['students:1'])
+        assert cache.stats()['invalidations'] == 2
+
+    # a response made before an invalidation may be stale, so it is not stored
+    def test_set_after_invalidation(self, cache):
+        generation = cache.generation
+        cache.invalidate(['students:1'])
+        put(cache, '/students/1', tags=['students:1'], generation=generation)
+        assert cache.get('/students/1') is None
+        put(cache, '/students/1', tags=['students:1'], generation=cache.generation)
+        assert cache.get('/students/1') is not None
+
+    # workers sharing a backend share entries, invalidations and stats
+    def test_shared_between_workers(self, make_cache):
+        worker_1, worker_2 = make_cache(), make_cache()
+        put(worker_1, '/students/1', tags=['students:1'])
+        assert worker_2.get('/students/1') is not None
+        generation = worker_1.generation
+        worker_2.invalidate(['students:1'])
+        assert worker_1.get('/students/1') is None
+        put(worker_1, '/students/1', tags=['students:1'], generation=generation)
+        assert worker_2.get('/students/1') is None
+        assert worker_1.stats()['hits'] == worker_2.stats()['hits'] == 1
+        assert worker_1.stats()['invalidations'] == 1
+
+
+class TestMemoryBackend:
+    def test_ttl(self, clock):
+        backend = MemoryBackend()
+        cache = ResponseCache(backend=backend)
+        cache.ttl = 10
+        put(cache, '/a')
+        clock[0] += 9
+        assert cache.get('/a') is not None
+        clock[0] += 1
+        assert cache.get('/a') is None
+        assert cache.stats()['expirations'] == 1
+
+
+class TestRedisBackend:
+    def test_ttl(self):
+        fakeredis = pytest.importorskip('fakeredis')
+        backend = RedisBackend(fakeredis.FakeRedis(), prefix='test:')
+        cache = ResponseCache(backend=backend)
+        cache.ttl = 10
+        put(cache, '/a', tags=['students'])
+        assert 0 < backend.client.ttl('test:entry:/a') <= 10
+        assert 0 < backend.client.ttl('test:tag:students') <= 10
+        # as if the entry has expired
+        backend.client.delete('test:entry:/a')
+        assert cache.get('/a') is None
+        assert cache.stats()['expirations'] == 1
+        assert cache.stats()['size'] == 0
+
+    # the tag sets are read and deleted by one MULTI/EXEC, a key added to them meanwhile can not escape
+    def test_invalidate_in_one_transaction(self, monkeypatch):
+        fakeredis = pytest.importorskip('fakeredis')
+        backend = RedisBackend(fakeredis.FakeRedis(), prefix='test:')
+        cache = ResponseCache(backend=backend)
+        cache.ttl = 10
+        put(cache, '/a', tags=['students', 'groups:1'])
+        transactions = []
+        make_pipeline = backend.client.pipeline
+
+        def recording_pipeline(*args, **kwargs):
+            pipe = make_pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            def recording_execute(*execute_args, **execute_kwargs):
+                transactions.append([command_args[0].upper() for command_args, _ in pipe.command_stack])
+                return execute(*execute_args, **execute_kwargs)
+            pipe.execute = recording_execute
+            return pipe
+        monkeypatch.setattr(backend.client, 'pipeline', recording_pipeline)
+        cache.invalidate(['students', 'groups:1'])
+        assert {'SMEMBERS', 'DEL'} <= set(transactions[0])
+        assert not backend.client.exists('test:tag:students', 'test:tag:groups:1')
+        assert cache.get('/a') is None
+
+    def test_from_url_without_redis(self, monkeypatch):
+        monkeypatch.setattr(backends, 'Redis', None)
+        with pytest.raises(ImportError):
+            RedisBackend.from_url('redis://localhost:6379/0')